@@ -21,4 +21,5 @@ setup(name="pytl",
       packages=find_packages(where="."),
       python_requires=">=3.7",
       install_requires=["TatSu"],
+      extras_require={"numpy": ["numpy"]},
 )
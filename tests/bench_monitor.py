@@ -0,0 +1,66 @@
+"""Benchmark of the runtime monitors and of the DFA cache
+
+Usage: bench_monitor.py [DEVICES] [STEPS]
+
+Measures the time per event of a single `tl.monitor.Monitor`, the time per
+event and per monitor of `Monitors` following DEVICES traces at once
+(100000 by default) for STEPS steps (100 by default), the memory used by
+their states, and the time to compile a DFA with `tl.dfa.compile_dfa`
+without cache, on a cache miss, and on a cache hit. Events are drawn from a
+seeded generator so that runs are reproducible.
+"""
+
+import os, sys, tempfile, time
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tl.monitor import Monitor, Monitors, Progression
+from tl.dfa import AutomatonCache, compile_dfa
+
+FORMULA = "G (req => F ack) & G (err => X ~err)"
+ATOMS = ["req", "ack", "err"]
+
+def timed (fun, *args) :
+    start = time.perf_counter()
+    result = fun(*args)
+    return result, time.perf_counter() - start
+
+def single (events) :
+    mon = Monitor(FORMULA)
+    dicts = [dict(zip(ATOMS, map(bool, row))) for row in events]
+    for event in dicts :
+        mon.step(event)
+
+def batch (prog, events) :
+    mons = Monitors(prog, events.shape[1], ATOMS)
+    for step in events :
+        mons.step_many(step)
+    return mons
+
+def main (devices=100000, steps=100) :
+    rng = numpy.random.default_rng(0)
+    events = rng.random((10000, len(ATOMS))) < .3
+    _, elapsed = timed(single, events)
+    print(f"Monitor: {elapsed / len(events) * 1e6:.2f} us per event")
+    prog = Progression(FORMULA)
+    events = rng.random((steps, devices, len(ATOMS))) < .3
+    # the first steps explore the obligations and fill the tables
+    batch(prog, events[:2])
+    mons, elapsed = timed(batch, prog, events)
+    print(f"Monitors: {elapsed / steps / devices * 1e9:.1f} ns per event and monitor"
+          f" ({devices} monitors, {mons.states.nbytes / devices:.0f} bytes each)")
+    phi = " & ".join(f"G (req_{i} => F ack_{i})" for i in range(4))
+    other = " & ".join(f"G (r_{i} => F a_{i})" for i in range(4))
+    _, elapsed = timed(compile_dfa, phi)
+    print(f"compile_dfa: {elapsed * 1e3:.1f} ms without cache")
+    with tempfile.TemporaryDirectory() as tmp :
+        cache = AutomatonCache(os.path.join(tmp, "automata.db"))
+        _, elapsed = timed(compile_dfa, phi, cache)
+        print(f"compile_dfa: {elapsed * 1e3:.1f} ms on a cache miss")
+        _, elapsed = timed(compile_dfa, other, cache)
+        print(f"compile_dfa: {elapsed * 1e3:.1f} ms on a cache hit")
+        cache.close()
+
+if __name__ == "__main__" :
+    main(*map(int, sys.argv[1:]))
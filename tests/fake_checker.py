@@ -0,0 +1,24 @@
+"""Fake model-checker for the tests of tl.runner
+
+Usage: fake_checker.py MODEL PROPS
+
+Property n is reported TRUE if its line contains atom "yes" and FALSE
+otherwise, a property that contains atom "slow" makes the run hang. Each run
+appends the number of properties it was given to file MODEL.calls.
+"""
+
+import sys, time
+
+def main (model, props) :
+    with open(props, encoding="utf-8") as stream :
+        lines = [line for line in stream.read().splitlines() if line.strip()]
+    with open(model + ".calls", "a", encoding="utf-8") as stream :
+        stream.write(f"{len(lines)}\n")
+    if any('"slow"' in line for line in lines) :
+        time.sleep(60)
+    for num, line in enumerate(lines) :
+        verdict = "TRUE" if '"yes"' in line else "FALSE"
+        print(f"Formula {num} is {verdict}")
+
+if __name__ == "__main__" :
+    main(*sys.argv[1:])
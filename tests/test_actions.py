@@ -0,0 +1,61 @@
+import itertools, random
+import tl
+from tl.actions import ActionCompiler, compile_actions, _compiler
+
+ALPHABET = ("a", "b", "c", "d")
+
+def _formula (rng, depth) :
+    if depth == 0 or rng.random() < .3 :
+        return rng.choice(ALPHABET + ("e", "True", "False"))
+    op = rng.choice(["~", "&", "|", "=>", "<=>"])
+    if op == "~" :
+        return f"~({_formula(rng, depth - 1)})"
+    return f"({_formula(rng, depth - 1)}) {op} ({_formula(rng, depth - 1)})"
+
+def _accepts (node, action) :
+    kind = node.kind
+    if kind == "name" :
+        return node.value == action
+    elif kind == "bool" :
+        return node.value
+    sub = [_accepts(child, action) for child in node.children]
+    if kind in ("actions", "not") :
+        return sub[0] != (kind == "not")
+    elif kind == "and" :
+        return all(sub)
+    elif kind == "or" :
+        return any(sub)
+    elif kind == "imply" :
+        return not sub[0] or sub[1]
+    return all(a == b for a, b in zip(sub, sub[1:]))
+
+def test_bitsets () :
+    rng = random.Random(0)
+    for _ in range(300) :
+        actions = tl.parse(f"A{{{_formula(rng, 3)}}} G p").actions
+        bits = compile_actions(actions, ALPHABET, "bitset")
+        for num, action in enumerate(ALPHABET) :
+            assert bool(bits >> num & 1) == _accepts(actions, action)
+
+def test_cached_compiler_memory () :
+    # the cached compiler keeps the distinct formulas only
+    alphabet = ALPHABET + ("memory",)
+    texts = ["a | ~(b & c)", "d => a", "(b & c) | a"]
+    sizes = []
+    for _ in range(50) :
+        for text in texts :
+            actions = tl.parse(f"A{{{text}}} G p").actions
+            compile_actions(actions, alphabet, "bitset")
+        hc = _compiler(alphabet, "bitset").hc
+        sizes.append((len(hc), len(hc._alive)))
+    assert sizes[0][0] == 9
+    assert sizes[0] == sizes[-1]
+
+def test_compiler_memo () :
+    compiler = ActionCompiler(ALPHABET, "bitset")
+    first = compiler(tl.parse("A{a | b} G p").actions)
+    assert first == 0b11
+    assert len(compiler.cache) == 3
+    compiler(tl.parse("A{b | a} G p").actions)
+    compiler(tl.parse("A{a | b} G p").actions)
+    assert len(compiler.cache) == 4
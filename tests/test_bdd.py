@@ -0,0 +1,212 @@
+import itertools, random
+import pytest
+from tl.bdd import BDD, Function
+
+NAMES = ["a", "b", "c", "d", "e"]
+VALUATIONS = [dict(zip(NAMES, values))
+              for values in itertools.product([False, True], repeat=len(NAMES))]
+
+def _table (bdd, f) :
+    # truth table of f over all the valuations of NAMES
+    return [bdd.let(f, values) == bdd.true for values in VALUATIONS]
+
+def _random (rng, bdd, depth) :
+    # a random function and its truth table
+    if depth == 0 or rng.random() < .2 :
+        name = rng.choice(NAMES)
+        return bdd.var(name), [v[name] for v in VALUATIONS]
+    op = rng.choice(["and", "or", "xor", "imply", "iff", "not", "exist",
+                     "forall", "ite", "and_exist"])
+    f, ft = _random(rng, bdd, depth - 1)
+    if op == "not" :
+        return ~f, [not x for x in ft]
+    elif op in ("exist", "forall") :
+        names = rng.sample(NAMES, rng.randint(1, 2))
+        pick = any if op == "exist" else all
+        table = []
+        for v in VALUATIONS :
+            table.append(pick(ft[VALUATIONS.index({**v, **dict(zip(names, values))})]
+                              for values in itertools.product([False, True],
+                                                              repeat=len(names))))
+        return getattr(bdd, op)(f, names), table
+    g, gt = _random(rng, bdd, depth - 1)
+    if op == "ite" :
+        h, ht = _random(rng, bdd, depth - 1)
+        return bdd.ite(f, g, h), [y if x else z for x, y, z in zip(ft, gt, ht)]
+    elif op == "and_exist" :
+        name = rng.choice(NAMES)
+        conj = [x and y for x, y in zip(ft, gt)]
+        table = [conj[VALUATIONS.index({**v, name : False})]
+                 or conj[VALUATIONS.index({**v, name : True})] for v in VALUATIONS]
+        return bdd.and_exist(f, g, [name]), table
+    fun = {"and" : lambda x, y : x and y,
+           "or" : lambda x, y : x or y,
+           "xor" : lambda x, y : x != y,
+           "imply" : lambda x, y : not x or y,
+           "iff" : lambda x, y : x == y}[op]
+    return bdd.apply(op, f, g), [fun(x, y) for x, y in zip(ft, gt)]
+
+def _build (bdd, table) :
+    # canonical function of a truth table
+    f = bdd.false
+    for values, value in zip(VALUATIONS, table) :
+        if value :
+            f |= bdd.cube(values)
+    return f
+
+def _ordered (bdd, f) :
+    # levels strictly increase from the root to the terminals
+    for node in bdd._reach(f.node) :
+        if node > 1 :
+            for child in (bdd.low[node], bdd.high[node]) :
+                assert bdd.level[child] > bdd.level[node]
+            assert bdd.low[node] != bdd.high[node]
+
+@pytest.mark.parametrize("seed", range(60))
+def test_random (seed) :
+    rng = random.Random(seed)
+    bdd = BDD(NAMES)
+    f, table = _random(rng, bdd, 5)
+    assert _table(bdd, f) == table
+    # equivalent functions are the same node
+    assert _build(bdd, table) == f
+    assert (f == bdd.true) == all(table) and (f == bdd.false) == (not any(table))
+    _ordered(bdd, f)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_collect (seed) :
+    # a tiny threshold and cache force many collections during operations
+    rng = random.Random(seed)
+    bdd = BDD(NAMES, cache=2, threshold=4)
+    live = []
+    for _ in range(40) :
+        live.append(_random(rng, bdd, 4))
+        if len(live) > 5 :
+            del live[rng.randrange(len(live))]
+        for f, table in live :
+            assert _table(bdd, f) == table
+    assert bdd.stats()["collections"] > 0
+    del f, table
+    bdd.collect()
+    # the nodes that are not reachable from live functions were freed
+    reach = set().union(*(bdd._reach(f.node) for f, _ in live))
+    assert set(bdd.unique.values()) | {0, 1} == reach
+    assert len(bdd.unique) + len(bdd.free) + 2 == len(bdd.level)
+    for f, table in live :
+        assert _table(bdd, f) == table
+        assert _build(bdd, table) == f
+
+def test_threshold () :
+    calls = []
+    bdd = BDD(NAMES, threshold=2, hook=calls.append)
+    keep = [bdd.cube(dict.fromkeys(NAMES, value)) for value in (False, True)]
+    for _ in range(5) :
+        bdd.var("a") & bdd.var("b")
+    assert calls and all(c is bdd for c in calls)
+    assert bdd.stats()["collections"] == len(calls)
+    # most nodes are alive, so the threshold was doubled
+    assert bdd.stats()["threshold"] > 2
+    assert len(bdd) >= 2 * len(NAMES)
+    assert keep == [bdd.cube(dict.fromkeys(NAMES, value)) for value in (False, True)]
+    assert bdd.count(keep[0]) == bdd.count(keep[1]) == 1
+
+@pytest.mark.parametrize("seed", range(20))
+def test_reorder (seed) :
+    rng = random.Random(seed)
+    bdd = BDD(NAMES, threshold=16)
+    funcs = [_random(rng, bdd, 4) for _ in range(4)]
+    order = rng.sample(NAMES, len(NAMES))
+    bdd.reorder(order)
+    assert bdd.names == order
+    for f, table in funcs :
+        assert _table(bdd, f) == table
+        assert _build(bdd, table) == f
+        _ordered(bdd, f)
+    # the order is the one of the levels
+    assert [bdd.level[bdd.var(name).node] for name in order] == list(range(len(NAMES)))
+    # renaming works after reordering
+    f, table = funcs[0]
+    swap = bdd.rename(f, {"a" : "b", "b" : "a"})
+    assert _table(bdd, swap) == [table[VALUATIONS.index({**v, "a" : v["b"], "b" : v["a"]})]
+                                 for v in VALUATIONS]
+
+@pytest.mark.parametrize("seed", range(30))
+def test_rename (seed) :
+    # maps are injective but may reverse the order of the variables
+    rng = random.Random(seed)
+    bdd = BDD(NAMES, threshold=32)
+    f, table = _random(rng, bdd, 4)
+    old = rng.sample(NAMES, rng.randint(1, len(NAMES)))
+    new = rng.sample(NAMES, len(old))
+    mapping = dict(zip(old, new))
+    g = bdd.rename(f, mapping)
+    # simultaneous substitution of new for old
+    assert _table(bdd, g) == [table[VALUATIONS.index({n : v[mapping.get(n, n)] for n in NAMES})]
+                              for v in VALUATIONS]
+    _ordered(bdd, g)
+    # maps are numbered once
+    assert bdd.rename(f, dict(mapping)) == g
+    assert len(bdd.maps) == 1
+
+def test_rename_reverse () :
+    bdd = BDD(NAMES)
+    f = bdd.var("a") & ~bdd.var("b") | bdd.var("c")
+    g = bdd.rename(f, {"a" : "e", "b" : "d", "c" : "a"})
+    assert g == (bdd.var("e") & ~bdd.var("d") | bdd.var("a"))
+    assert bdd.rename(g, {"e" : "a", "d" : "b", "a" : "c"}) == f
+
+@pytest.mark.parametrize("seed", range(30))
+def test_count_pick (seed) :
+    rng = random.Random(seed)
+    bdd = BDD(NAMES)
+    f, table = _random(rng, bdd, 4)
+    assert bdd.count(f) == sum(table)
+    values = bdd.pick(f)
+    if not any(table) :
+        assert values is None
+    else :
+        # every completion of the partial valuation satisfies f
+        assert set(values) <= set(NAMES)
+        assert bdd.cube(values) & ~f == bdd.false
+    # counting over the support only
+    support = bdd.support(f)
+    assert bdd.count(f, support) << (len(NAMES) - len(support)) == sum(table)
+
+def test_count () :
+    bdd = BDD(NAMES)
+    assert bdd.count(bdd.true) == 32 and bdd.count(bdd.false) == 0
+    assert bdd.count(bdd.var("c")) == 16
+    assert bdd.count(bdd.var("a") | bdd.var("e"), ["a", "e"]) == 3
+    assert bdd.count(bdd.true, []) == 1
+    assert bdd.pick(bdd.true) == {}
+    assert bdd.pick(~bdd.var("b") & bdd.var("d")) == {"b" : False, "d" : True}
+
+def test_functions () :
+    bdd = BDD(["x", "y"])
+    x, y = bdd.var("x"), bdd.var("y")
+    assert (x & y) | (x & ~y) == x
+    assert x ^ x == bdd.false and x != y
+    assert len({x, bdd.var("x"), y}) == 2
+    assert isinstance(x, Function) and repr(bdd.true) == "<Function True>"
+    assert len(x & y) == 4 and bdd.support(x & y) == {"x", "y"}
+    # references are counted
+    node = (x & y).node
+    extra = x & y
+    assert bdd.refs[node] == 1
+    del extra
+    assert bdd.refs[node] == 0
+
+def test_errors () :
+    with pytest.raises(ValueError, match="power of 2") :
+        BDD(cache=3)
+    bdd = BDD(["x"])
+    with pytest.raises(ValueError, match="already declared") :
+        bdd.declare("x")
+    with pytest.raises(ValueError, match="unknown variable 'y'") :
+        bdd.var("y")
+    with pytest.raises(ValueError, match="not a function of this manager") :
+        bdd.var("x") & BDD(["x"]).var("x")
+    with pytest.raises(ValueError, match="unknown operator") :
+        bdd.apply("nand", bdd.true, bdd.true)
+    with pytest.raises(ValueError, match="permutation") :
+        bdd.reorder(["x", "y"])
@@ -0,0 +1,124 @@
+import itertools, random
+import pytest
+import tl
+from tl.bmc import System, check
+
+FORMULAS = ["G a", "F a", "G F a", "F G a", "a U b", "G (a => F b)",
+            "G (a => X b)", "(G F a) => (G F b)", "(F G a) | (G F b)", "a R b",
+            "X (a W b)", "a M b", "G (a => X (b U c))", "~(F (a & X b))",
+            "E ((G F a) & (F G b))", "A G (a => F c)", "E (a U (X b))",
+            "True", "False", "E X X ~a"]
+
+def holds (phi, word, loop) :
+    # value of phi at position 0 of the lasso word[:loop] word[loop:]^omega
+    size = len(word)
+    succ = [i + 1 for i in range(size - 1)] + [loop]
+    def fix (init, step) :
+        val = [init] * size
+        for _ in range(size + 1) :
+            val = [step(i, val) for i in range(size)]
+        return val
+    def sat (node) :
+        kind = node.kind
+        if kind == "name" :
+            return [node.value in letters for letters in word]
+        elif kind == "bool" :
+            return [node.value] * size
+        sub = [sat(child) for child in node.children]
+        if kind == "not" :
+            return [not v for v in sub[0]]
+        elif kind == "and" :
+            return [all(v) for v in zip(*sub)]
+        elif kind == "or" :
+            return [any(v) for v in zip(*sub)]
+        elif kind == "imply" :
+            return [not a or b for a, b in zip(*sub)]
+        elif kind == "iff" :
+            return [a == b for a, b in zip(*sub)]
+        elif kind == "X" :
+            return [sub[0][succ[i]] for i in range(size)]
+        elif kind == "F" :
+            return fix(False, lambda i, v : sub[0][i] or v[succ[i]])
+        elif kind == "G" :
+            return fix(True, lambda i, v : sub[0][i] and v[succ[i]])
+        a, b = sub
+        if kind == "U" :
+            return fix(False, lambda i, v : b[i] or (a[i] and v[succ[i]]))
+        elif kind == "W" :
+            return fix(True, lambda i, v : b[i] or (a[i] and v[succ[i]]))
+        elif kind == "R" :
+            return fix(True, lambda i, v : b[i] and (a[i] or v[succ[i]]))
+        elif kind == "M" :
+            return fix(False, lambda i, v : b[i] and (a[i] or v[succ[i]]))
+        raise ValueError(f"unexpected {kind}")
+    return sat(phi)[0]
+
+def _target (phi) :
+    # LTL formula whose paths are searched for by check
+    if phi.kind == "E" :
+        return phi.children[0]
+    elif phi.kind == "A" :
+        return tl.Phi("not", phi.children[0])
+    return tl.Phi("not", phi)
+
+def _system (rng, size=2) :
+    states = list(itertools.product([False, True], repeat=size))
+    succ = {s : rng.sample(states, rng.randint(1, 2)) for s in states}
+    init = rng.sample(states, rng.randint(1, 2))
+    def block (vals, offset=0) :
+        return [-(offset + i + 1) if v else (offset + i + 1)
+                for i, v in enumerate(vals)]
+    system = System(size,
+                    [block(s) for s in states if s not in init],
+                    [block(s) + block(t, size) for s in states for t in states
+                     if t not in succ[s]],
+                    {"a" : 1, "b" : -2, "c" : size})
+    return init, succ, system
+
+def _word (states) :
+    return [{name for name, val in (("a", s[0]), ("b", not s[1]), ("c", s[-1]))
+             if val} for s in states]
+
+def _lassos (init, succ, length) :
+    paths = [[s] for s in init]
+    while paths :
+        path = paths.pop()
+        for loop in range(len(path)) :
+            if path[loop] in succ[path[-1]] :
+                yield path, loop
+        if len(path) < length :
+            paths.extend(path + [t] for t in succ[path[-1]])
+
+def _extend (rng, states, succ) :
+    # a random lasso that starts with the finite path states
+    states = list(states)
+    while True :
+        nxt = rng.choice(succ[states[-1]])
+        if nxt in states :
+            return states, states.index(nxt)
+        states.append(nxt)
+
+@pytest.mark.parametrize("text", FORMULAS)
+def test_counterexamples (text) :
+    rng = random.Random(text)
+    target = _target(tl.parse(text))
+    for _ in range(25) :
+        init, succ, system = _system(rng)
+        path = check(text, system, 12)
+        known = next((lasso for lasso in _lassos(init, succ, 5)
+                      if holds(target, _word(lasso[0]), lasso[1])), None)
+        if known is not None :
+            assert path is not None, (text, known)
+        if path is None :
+            continue
+        states = path.states
+        assert states[0] in init
+        assert all(t in succ[s] for s, t in zip(states, states[1:]))
+        if path.loop is not None :
+            assert states[path.loop] in succ[states[-1]]
+            assert holds(target, _word(states), path.loop), (text, path)
+        else :
+            # a finite witness holds whatever follows it
+            for _ in range(10) :
+                lasso, loop = _extend(rng, states, succ)
+                assert holds(target, _word(lasso), loop), (text, path)
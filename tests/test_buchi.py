@@ -0,0 +1,228 @@
+import random
+import numpy
+import pytest
+import tl
+from tl.buchi import Buchi, Tableau, translate
+from tl.scc import tarjan
+
+FORMULAS = ["a", "X a", "F a", "G a", "G F a", "F G a", "a U b", "a R b",
+            "a W b", "a M b", "G (a => F b)", "G (a => X (b U c))",
+            "F G a | G F b", "~(G F a) & (a U (G b))", "(a U b) U c",
+            "G F a & G F b & G F c", "F (a & X (b & X c))", "a <=> X b <=> F c",
+            "G (a => (b R c))", "X X X ~a", "G F a => G F b",
+            "~(a U (X (b M c)))", "False", "True", "G a & F ~a", "F a | ~(F a)"]
+
+def _formula (rng, depth) :
+    if depth == 0 or rng.random() < .2 :
+        return rng.choice(["a", "b", "c", "True", "False"])
+    op = rng.choice(["~", "&", "|", "=>", "<=>", "X", "F", "G", "U", "R", "W", "M"])
+    if op == "~" :
+        return f"~({_formula(rng, depth - 1)})"
+    elif op in ("X", "F", "G") :
+        return f"{op} ({_formula(rng, depth - 1)})"
+    return f"({_formula(rng, depth - 1)}) {op} ({_formula(rng, depth - 1)})"
+
+def holds (phi, word, loop) :
+    # LTL semantics on the lasso word[:loop] (word[loop:])^omega
+    size = len(word)
+    succ = list(range(1, size)) + [loop]
+    def lfp (left, right) :
+        sat = [False] * size
+        for _ in range(size + 1) :
+            sat = [right[i] or (left[i] and sat[succ[i]]) for i in range(size)]
+        return sat
+    def gfp (left, right) :
+        sat = [True] * size
+        for _ in range(size + 1) :
+            sat = [right[i] and (left[i] or sat[succ[i]]) for i in range(size)]
+        return sat
+    def sat (node) :
+        kind = node.kind
+        if kind == "name" :
+            return [node.value in letters for letters in word]
+        elif kind == "bool" :
+            return [node.value] * size
+        sub = [sat(child) for child in node.children]
+        every, never = [True] * size, [False] * size
+        if kind == "not" :
+            return [not v for v in sub[0]]
+        elif kind == "and" :
+            return [all(s[i] for s in sub) for i in range(size)]
+        elif kind == "or" :
+            return [any(s[i] for s in sub) for i in range(size)]
+        elif kind == "imply" :
+            return [not l or r for l, r in zip(*sub)]
+        elif kind == "iff" :
+            value = sub[0]
+            for other in sub[1:] :
+                value = [l == r for l, r in zip(value, other)]
+            return value
+        elif kind == "X" :
+            return [sub[0][succ[i]] for i in range(size)]
+        elif kind == "F" :
+            return lfp(every, sub[0])
+        elif kind == "G" :
+            return gfp(never, sub[0])
+        elif kind == "U" :
+            return lfp(*sub)
+        elif kind == "R" :
+            return gfp(*sub)
+        elif kind == "W" :
+            return [u or g for u, g in zip(lfp(*sub), gfp(never, sub[0]))]
+        elif kind == "M" :
+            return lfp(sub[1], [l and r for l, r in zip(*sub)])
+        raise ValueError(f"unexpected {kind}")
+    return sat(phi)[0]
+
+def accepts (aut, word, loop) :
+    # an accepting run exists iff a reachable SCC of the product with the
+    # lasso has an internal edge in every acceptance set (or an accepting
+    # state when acceptance is on states)
+    succ = list(range(1, len(word))) + [loop]
+    index = {atom : num for num, atom in enumerate(aut.atoms)}
+    codes = [sum(1 << index[a] for a in letters if a in index) for letters in word]
+    number = {(aut.initial, 0) : 0}
+    order = [(aut.initial, 0)]
+    edges = []
+    while len(edges) < len(order) :
+        state, pos = order[len(edges)]
+        trans = []
+        for p, n, target, acc in aut.edges[state] :
+            if codes[pos] & p == p and not codes[pos] & n :
+                key = (target, succ[pos])
+                if key not in number :
+                    number[key] = len(order)
+                    order.append(key)
+                trans.append((number[key], acc))
+        edges.append(trans)
+    indptr = numpy.cumsum([0] + [len(t) for t in edges])
+    comp = tarjan(indptr, numpy.array([d for t in edges for d, _ in t], dtype=numpy.int64))
+    if aut.accepting is None :
+        need = (1 << aut.sets) - 1
+    else :
+        need = 1
+    cover = {}
+    for src, trans in enumerate(edges) :
+        for dst, acc in trans :
+            if comp[src] != comp[dst] :
+                continue
+            elif aut.accepting is not None :
+                acc = 1 if aut.accepting[order[src][0]] else 0
+            cover[comp[src]] = cover.get(comp[src], 0) | acc
+    return any(found & need == need for found in cover.values())
+
+def _lasso (rng) :
+    size = rng.randint(1, 5)
+    word = [{name for name in "abc" if rng.random() < .5} for _ in range(size)]
+    return word, rng.randrange(size)
+
+def _check (phi, rng, count) :
+    tgba = translate(phi)
+    ba = tgba.degeneralize()
+    assert ba.accepting is not None and len(ba.accepting) == len(ba)
+    assert ba.degeneralize() is ba
+    for _ in range(count) :
+        word, loop = _lasso(rng)
+        expected = holds(phi, word, loop)
+        assert accepts(tgba, word, loop) == expected, (word, loop)
+        assert accepts(ba, word, loop) == expected, (word, loop)
+
+@pytest.mark.parametrize("text", FORMULAS)
+def test_formulas (text) :
+    _check(tl.parse(text), random.Random(text), 150)
+
+@pytest.mark.parametrize("seed", range(60))
+def test_random (seed) :
+    rng = random.Random(seed)
+    _check(tl.parse(_formula(rng, 4)), rng, 40)
+
+def test_sets () :
+    # one acceptance set for each until sub-formula
+    assert translate("G a").sets == 0
+    assert translate("G (a => F b)").sets == 1
+    assert translate("G F a & G F b & G F c").sets == 3
+    assert len(translate("False").edges[0]) == 0
+
+def test_lazy () :
+    tableau = Tableau(tl.parse("G (a => F b) & G F c"))
+    assert tableau.succ == {}
+    trans = tableau.successors(tableau.initial)
+    assert tableau.successors(tableau.initial) is trans
+    # only the initial state was expanded
+    assert set(tableau.succ) == {tableau.initial}
+    assert len(tableau.automaton()) > 1
+
+def _parse_hoa (text) :
+    # read back the HOA automata written by Buchi.hoa
+    head, body = text.split("--BODY--\n")
+    assert body.endswith("--END--\n")
+    fields = dict(line.split(": ", 1) for line in head.splitlines())
+    count, *atoms = fields["AP"].split(" ")
+    atoms = [a[1:-1] for a in atoms]
+    assert int(count) == len(atoms)
+    states = fields["acc-name"] == "Buchi"
+    sets = int(fields["Acceptance"].split(" ")[0])
+    edges, accepting = [], []
+    for line in body.splitlines()[:-1] :
+        if line.startswith("State: ") :
+            assert line.split(" ")[1] == str(len(edges))
+            accepting.append(line.endswith("{0}"))
+            edges.append([])
+            continue
+        label, rest = line[1:].split("] ")
+        target, *acc = rest.split(" ", 1)
+        pos = neg = 0
+        for lit in label.split(" & ") if label != "t" else [] :
+            if lit.startswith("!") :
+                neg |= 1 << int(lit[1:])
+            else :
+                pos |= 1 << int(lit)
+        mask = sum(1 << int(n) for n in acc[0].strip("{}").split()) if acc else 0
+        edges[-1].append((pos, neg, int(target), mask))
+    assert len(edges) == int(fields["States"])
+    return Buchi(atoms, edges, sets, int(fields["Start"]),
+                 accepting if states else None)
+
+@pytest.mark.parametrize("text", FORMULAS)
+def test_hoa_round_trip (text) :
+    phi = tl.parse(text)
+    rng = random.Random(text)
+    for aut in (translate(phi), translate(phi).degeneralize()) :
+        back = _parse_hoa(aut.hoa())
+        assert back.edges == aut.edges
+        assert back.sets == aut.sets and back.accepting == aut.accepting
+        for _ in range(30) :
+            word, loop = _lasso(rng)
+            assert accepts(back, word, loop) == holds(phi, word, loop)
+
+def test_hoa () :
+    aut = translate("G (a => F b)")
+    assert aut.hoa() == "\n".join([
+        "HOA: v1",
+        "States: 2",
+        "Start: 0",
+        'AP: 2 "a" "b"',
+        "acc-name: generalized-Buchi 1",
+        "Acceptance: 1 Inf(0)",
+        "properties: trans-labels explicit-labels trans-acc",
+        "--BODY--",
+        "State: 0",
+        "[!0] 0 {0}",
+        "[1] 0 {0}",
+        "[t] 1",
+        "State: 1",
+        "[1] 0 {0}",
+        "[t] 1",
+        "--END--"]) + "\n"
+    lines = aut.degeneralize().hoa().splitlines()
+    assert lines[4:7] == ["acc-name: Buchi", "Acceptance: 1 Inf(0)",
+                          "properties: trans-labels explicit-labels state-acc"]
+    assert "State: 0 {0}" in lines
+    # without until, every infinite run is accepting
+    lines = translate("G a").hoa().splitlines()
+    assert lines[4:7] == ["acc-name: all", "Acceptance: 0 t",
+                          "properties: trans-labels explicit-labels"]
+    # names and atoms are quoted
+    lines = translate("G 'x\"y'").hoa(name='a "b"\\c').splitlines()
+    assert lines[1] == 'name: "a \\"b\\"\\\\c"'
+    assert lines[4] == 'AP: 1 "x\\"y"'
@@ -0,0 +1,48 @@
+import random
+import tl
+
+def _formula (rng, depth) :
+    if depth == 0 or rng.random() < .2 :
+        return rng.choice(["p", "q", "r"])
+    op = rng.choice(["~", "&", "|", "<=>", "Q"])
+    if op == "~" :
+        return f"~({_formula(rng, depth - 1)})"
+    elif op == "Q" :
+        quant = rng.choice(["A G", "E F", "A{a | b} X", "E [UFAIR p] [UFAIR q] G"])
+        return f"{quant} ({_formula(rng, depth - 1)})"
+    return f"({_formula(rng, depth - 1)}) {op} ({_formula(rng, depth - 1)})"
+
+def _shuffle (rng, phi) :
+    # same formula with the operands of and/or/iff shuffled and regrouped
+    children = [_shuffle(rng, child) for child in phi.children]
+    attr = {key : _shuffle(rng, value) if isinstance(value, tl.Phi) else value
+            for key, value in phi.items()}
+    if phi.kind in ("and", "or", "iff") :
+        rng.shuffle(children)
+    if phi.kind in ("and", "or") and len(children) > 2 and rng.random() < .5 :
+        children = [tl.Phi(phi.kind, *children[:2])] + children[2:]
+    return tl.Phi(phi.kind, *children, **attr)
+
+def test_commutative () :
+    rng = random.Random(0)
+    for _ in range(300) :
+        phi = tl.parse(_formula(rng, 4))
+        other = _shuffle(rng, phi)
+        assert phi.canonical() == other.canonical()
+        assert phi.canonical().fingerprint() == other.canonical().fingerprint()
+        canon = phi.canonical()
+        assert canon.canonical() is canon
+
+def test_modified () :
+    phi = tl.parse("A G (a & b)")
+    before = phi.canonical().fingerprint()
+    assert tl.parse("A G (b & a)").canonical().fingerprint() == before
+    # in-place edits are seen by the next canonical form
+    phi.children[0].children[0].children[1]["value"] = "c"
+    after = phi.canonical().fingerprint()
+    assert after != before
+    assert after == tl.parse("A G (c & a)").canonical().fingerprint()
+    phi["actions"] = tl.parse("A{x} G p").actions
+    assert phi.canonical().fingerprint() == tl.parse("A{x} G (a & c)").canonical().fingerprint()
+    phi.children = (tl.parse("F p"),)
+    assert phi.canonical().fingerprint() == tl.parse("A{x} F p").canonical().fingerprint()
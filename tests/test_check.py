@@ -0,0 +1,215 @@
+import itertools, random
+import numpy
+import pytest
+import tl
+from tl.actions import compile_actions
+from tl.check import Kripke, LTS, Checker, check
+
+ALPHABET = ["x", "y"]
+
+def _state (rng, depth) :
+    if depth == 0 or rng.random() < .25 :
+        return rng.choice(["a", "b", "c", "True"])
+    op = rng.choice(["~", "&", "|", "Q", "Q", "Q"])
+    if op == "~" :
+        return f"~({_state(rng, depth - 1)})"
+    elif op in "&|" :
+        return f"({_state(rng, depth - 1)}) {op} ({_state(rng, depth - 1)})"
+    quant = rng.choice(["A", "E"])
+    quant += rng.choice(["", "", "{x}", "{y}", "{x | y}"])
+    quant += rng.choice(["", "", "", " [UFAIR a]", " [UFAIR {x}]",
+                         " [WFAIR b THEN a]", " [SFAIR {y} THEN c]",
+                         " [SFAIR a THEN {x}] [UFAIR ~a]"])
+    mod = rng.choice("XFGURWM")
+    if mod in "XFG" :
+        return f"{quant} {mod} ({_state(rng, depth - 1)})"
+    return f"{quant} (({_state(rng, depth - 1)}) {mod} ({_state(rng, depth - 1)}))"
+
+##
+## reference semantics, on sets of states
+##
+
+class _Model (object) :
+    def __init__ (self, size, edges, labels) :
+        self.size = size
+        # triples (src, dst, action number)
+        self.edges = edges
+        self.labels = labels
+    def cyclic (self, states, edges) :
+        # states are strongly connected with at least one edge
+        for start in states :
+            seen, todo = {start}, [start]
+            while todo :
+                src = todo.pop()
+                for s, d, _ in edges :
+                    if s == src and d not in seen :
+                        seen.add(d)
+                        todo.append(d)
+            if seen != set(states) :
+                return False
+        return bool(edges)
+    def eg (self, sat, allowed, constraints) :
+        # states from which a fair strongly connected subset of sat can be
+        # reached within sat, subsets are enumerated
+        edges = [e for e in self.edges if e[0] in sat and e[1] in sat and e[2] in allowed]
+        good = set()
+        for num in range(1, len(sat) + 1) :
+            for sub in itertools.combinations(sorted(sat), num) :
+                inner = [e for e in edges if e[0] in sub and e[1] in sub]
+                if not self.cyclic(sub, inner) :
+                    continue
+                def hits (cond) :
+                    states, actions = cond
+                    if states is not None :
+                        return any(s in states for s in sub)
+                    return any(e[2] in actions for e in inner)
+                ok = True
+                for kind, cond, then in constraints :
+                    if kind == "ufair" :
+                        ok = ok and hits(then)
+                    elif kind == "wfair" :
+                        states, actions = cond
+                        neg = (None if states is None else set(range(self.size)) - states,
+                               None if actions is None else set(range(len(ALPHABET))) - actions)
+                        ok = ok and (hits(neg) or hits(then))
+                    else :
+                        ok = ok and (not hits(cond) or hits(then))
+                if ok :
+                    good |= set(sub)
+        return self.eu(sat, good, allowed)
+    def eu (self, left, right, allowed) :
+        reach = set(right)
+        grow = True
+        while grow :
+            grow = False
+            for s, d, a in self.edges :
+                if a in allowed and d in reach and s in left and s not in reach :
+                    reach.add(s)
+                    grow = True
+        return reach
+    def ex (self, sat, allowed) :
+        return {s for s, d, a in self.edges if a in allowed and d in sat}
+    def sat (self, phi) :
+        everything = set(range(self.size))
+        kind = phi.kind
+        if kind == "name" :
+            return {s for s in everything if self.labels[phi.value][s]}
+        elif kind == "bool" :
+            return everything if phi.value else set()
+        sub = [self.sat(child) for child in phi.children]
+        if kind == "not" :
+            return everything - sub[0]
+        elif kind == "and" :
+            return set.intersection(*sub)
+        elif kind == "or" :
+            return set.union(*sub)
+        allowed = set(range(len(ALPHABET)))
+        if phi.actions is not None :
+            mask = compile_actions(phi.actions, ALPHABET)
+            allowed = {i for i in allowed if mask[i]}
+        constraints = []
+        for fkind in ("ufair", "wfair", "sfair") :
+            for fair in phi.get(fkind) or () :
+                def cond (node) :
+                    if node is None :
+                        return None
+                    elif node.kind == "actions" :
+                        mask = compile_actions(node, ALPHABET)
+                        return None, {i for i in range(len(ALPHABET)) if mask[i]}
+                    return self.sat(node), None
+                constraints.append((fkind, cond(fair.condition), cond(fair.then)))
+        # without fairness, paths are not required to be infinite
+        fair = self.eg(everything, allowed, constraints) if constraints else everything
+        def e (mod, left, right=None) :
+            # existential modalities on fair paths
+            if mod == "X" :
+                return self.ex(left & fair, allowed)
+            elif mod == "U" :
+                return self.eu(left, right & fair, allowed)
+            elif mod == "F" :
+                return e("U", everything, left)
+            elif mod == "G" :
+                return self.eg(left, allowed, constraints)
+            elif mod == "R" :
+                return e("U", right, left & right) | e("G", right)
+            elif mod == "W" :
+                return e("U", left, right) | e("G", left)
+            elif mod == "M" :
+                return e("U", right, left & right)
+        quant, mod = kind
+        if quant == "E" :
+            return e(mod, *sub)
+        neg = [everything - s for s in sub]
+        dual = {"X" : "X", "F" : "G", "G" : "F", "U" : "R", "R" : "U", "W" : "M", "M" : "W"}
+        return everything - e(dual[mod], *neg)
+
+def _lts (rng, size) :
+    edges = [(s, rng.randrange(size), rng.randrange(len(ALPHABET)))
+             for s in range(size) for _ in range(rng.randint(1, 3))]
+    labels = {name : [rng.random() < .5 for _ in range(size)] for name in "abc"}
+    src, dst, act = zip(*edges)
+    return (LTS(src, dst, act, ALPHABET, labels, size=size),
+            _Model(size, edges, labels))
+
+@pytest.mark.parametrize("seed", range(60))
+def test_arctl (seed) :
+    rng = random.Random(seed)
+    lts, model = _lts(rng, rng.randint(1, 5))
+    checker = Checker(lts)
+    done = 0
+    while done < 10 :
+        try :
+            phi = tl.parse(_state(rng, 3)).arctl()
+        except ValueError :
+            continue
+        done += 1
+        found = set(numpy.flatnonzero(checker(phi)).tolist())
+        assert found == model.sat(phi), phi
+
+@pytest.mark.parametrize("seed", range(30))
+def test_ctl (seed) :
+    rng = random.Random(seed)
+    size = rng.randint(1, 6)
+    succ = [sorted(set(rng.randrange(size) for _ in range(rng.randint(1, 3))))
+            for _ in range(size)]
+    labels = {name : [rng.random() < .5 for _ in range(size)] for name in "abc"}
+    indptr = numpy.cumsum([0] + [len(s) for s in succ])
+    kripke = Kripke(indptr, [t for s in succ for t in s], labels)
+    model = _Model(size, [(s, t, 0) for s in range(size) for t in succ[s]], labels)
+    checker = Checker(kripke)
+    done = 0
+    while done < 10 :
+        text = _state(rng, 3)
+        try :
+            phi = tl.parse(text).ctl()
+        except ValueError :
+            continue
+        done += 1
+        assert set(numpy.flatnonzero(checker(phi)).tolist()) == model.sat(phi), phi
+        assert check(text, kripke) == (0 in model.sat(phi))
+
+def test_labels_not_frozen () :
+    spam = numpy.array([True, False, True])
+    kripke = Kripke([0, 1, 2, 3], [1, 2, 2], {"spam" : spam})
+    found = Checker(kripke)(tl.parse("A F A G spam").ctl())
+    assert found.tolist() == [True, True, True]
+    assert not found.flags.writeable
+    # the caller's array is still writeable and is not aliased
+    assert spam.flags.writeable
+    spam[0] = False
+    assert kripke.labels["spam"][0]
+
+def test_errors () :
+    kripke = Kripke([0, 1], [0], {"spam" : [True]})
+    with pytest.raises(ValueError, match="unknown atom 'egg'") :
+        Checker(kripke)(tl.parse("E F egg").ctl())
+    with pytest.raises(ValueError, match="actions require an LTS") :
+        Checker(kripke)(tl.parse("E{x} F spam").arctl())
+    with pytest.raises(ValueError, match="invalid CSR") :
+        Kripke([0, 2], [0], {})
+    with pytest.raises(ValueError, match="successor out of range") :
+        Kripke([0, 1], [1], {})
+    with pytest.raises(ValueError, match="invalid labelling") :
+        Kripke([0, 1], [0], {"spam" : [True, False]})
+    with pytest.raises(ValueError, match="action out of range") :
+        LTS([0], [0], [2], ALPHABET, {})
@@ -0,0 +1,74 @@
+import random
+import numpy
+import pytest
+import tl
+from tl.dfa import build, minimize, compile_dfa, AutomatonCache
+
+def _random (rng, depth) :
+    if depth == 0 or rng.random() < .2 :
+        return rng.choice(["a", "b", "c", "True", "False"])
+    op = rng.choice(["~", "X", "F", "G", "&", "|", "=>", "<=>", "U", "R", "W", "M"])
+    if op == "~" :
+        return f"~({_random(rng, depth - 1)})"
+    elif op in ("X", "F", "G") :
+        return f"{op} ({_random(rng, depth - 1)})"
+    return f"({_random(rng, depth - 1)}) {op} ({_random(rng, depth - 1)})"
+
+def _check (phi, dfa, seed) :
+    if not dfa.atoms :
+        return
+    traces = numpy.random.default_rng(seed).random((20, 1 + seed % 6, len(dfa.atoms))) < .5
+    expected = tl.eval_traces(phi, traces, dfa.atoms)[:, 0]
+    assert (dfa.run_many(traces) == expected).all()
+
+@pytest.mark.parametrize("phi", ["G ~(c M (G b))",
+                                 "(b W (True & c & (c U a))) W b",
+                                 "F (((a <=> False) W (G c)) | ((c W b) M True))",
+                                 "G (a => X (b W a))"])
+def test_build_converges (phi) :
+    dfa = build(phi, limit=100)
+    _check(phi, dfa, 0)
+    _check(phi, minimize(dfa), 1)
+
+def test_random_formulas () :
+    rng = random.Random(1)
+    for seed in range(150) :
+        phi = _random(rng, 4)
+        _check(phi, compile_dfa(phi, limit=1000), seed)
+
+def test_limit () :
+    with pytest.raises(ValueError) :
+        build("G (a => X X X X X X b)", limit=10)
+
+def test_cache (tmp_path) :
+    cache = AutomatonCache(str(tmp_path / "automata.db"))
+    first = compile_dfa("G (req_1 => F ack_1)", cache)
+    second = compile_dfa("G (b => F a)", cache)
+    assert first.atoms == ["req_1", "ack_1"] and second.atoms == ["b", "a"]
+    assert cache.db.execute("SELECT COUNT(*) FROM automata").fetchone() == (1,)
+    assert (first.table == second.table).all()
+
+def test_cache_hit (tmp_path, monkeypatch) :
+    path = str(tmp_path / "automata.db")
+    cache = AutomatonCache(path)
+    phi = "G (req_1 => F ack_1) & (err U ok)"
+    stored = compile_dfa(phi, cache)
+    cache.close()
+    # a hit reads the automaton back from disk and does not build it
+    def fail (*args) :
+        raise AssertionError("automaton built on a cache hit")
+    monkeypatch.setattr(tl.dfa, "build", fail)
+    other = "G (req_2 => F ack_2) & (fail U done)"
+    for cache in (AutomatonCache(path), path) :
+        found = compile_dfa(other, cache)
+        assert dict(zip(stored.atoms, found.atoms)) == {
+            "req_1" : "req_2", "ack_1" : "ack_2", "err" : "fail", "ok" : "done"}
+        assert (found.table == stored.table).all()
+        assert (found.accepting == stored.accepting).all()
+        assert found.initial == stored.initial
+    monkeypatch.undo()
+    # the renamed automaton is the one compiled without cache
+    expected = compile_dfa(other)
+    _check(other, found, 3)
+    traces = numpy.random.default_rng(0).random((50, 6, 4)) < .5
+    assert (found.run_many(traces, expected.atoms) == expected.run_many(traces)).all()
@@ -0,0 +1,104 @@
+import itertools
+import pytest
+import tl
+
+SYNTAXES = ["ctl", "arctl", "its_ctl", "its_ltl"]
+
+FAMILIES = ["A G (&_{i in 1..3} p_i)",
+            "E F (|_{i in 0..2} (p_i & q_{i+1}))",
+            "A G (&_{i in 1..2} (p_i => A F q_i))",
+            "&_{i in 1..2} (A G p_i)",
+            "A (&_{i in 1..2} (G p_i))",
+            "G (&_{i in 1..3} (p_i => F q_i))",
+            "A G (&_{i in 1..2} (|_{j in i..2} r_{i*j}))",
+            "A G (&_{i in 3..1} p_i)",
+            "E X (|_{i in 1..1} p_i)",
+            "A G (&_{i in 1..n} p_i)",
+            "A [UFAIR (&_{i in 1..2} p_i)] G q"]
+
+PROP = ["~(&_{i in 1..3} p_i)",
+        "~(|_{i in 1..2} (p_i => p_{i+1}))",
+        "(&_{i in 1..2} (p_i & True)) | False",
+        "~(&_{i in 1..2} ~(|_{j in 1..i} (p_j <=> p_i)))",
+        "~~(|_{i in 1..3} (p_i | p_i))",
+        "(&_{i in 2..1} p_i) => p_1"]
+
+def _translate (phi, syntax) :
+    try :
+        return getattr(phi, syntax)()
+    except ValueError as err :
+        return err
+
+@pytest.mark.parametrize("text", FAMILIES)
+def test_check (text) :
+    phi = tl.parse(text)
+    for syntax in SYNTAXES :
+        found = _translate(phi, syntax)
+        violation = phi.check(syntax)
+        assert (violation is None) == (not isinstance(found, ValueError)), syntax
+        if violation is not None and "unbound" not in str(found) :
+            assert str(violation) == str(found)
+
+def test_check_unbound () :
+    phi = tl.parse("A G (&_{i in 1..n} p_i)")
+    assert str(phi.check("ctl")) == "invalid ctl formula (unbound index 'n')"
+    assert phi.bind(n=2).check("ctl") is None
+
+def _eval (phi, env) :
+    kind = phi.kind
+    if kind == "name" :
+        return env[phi.value]
+    elif kind == "bool" :
+        return phi.value
+    sub = [_eval(child, env) for child in phi.children]
+    if kind == "not" :
+        return not sub[0]
+    elif kind == "and" :
+        return all(sub)
+    elif kind == "or" :
+        return any(sub)
+    elif kind == "imply" :
+        return not sub[0] or sub[1]
+    elif kind == "iff" :
+        return all(v == sub[0] for v in sub)
+    raise ValueError(f"unexpected {kind}")
+
+def _names (phi) :
+    if phi.kind == "name" :
+        yield phi.value
+    for child in phi.children :
+        yield from _names(child)
+
+def _equivalent (one, two) :
+    names = sorted(set(_names(one)) | set(_names(two)))
+    for values in itertools.product([False, True], repeat=len(names)) :
+        env = dict(zip(names, values))
+        assert _eval(one, env) == _eval(two, env), env
+
+def _negations (phi) :
+    # kinds of the nodes under a negation
+    if phi.kind == "not" :
+        yield phi.children[0].kind
+    for child in phi.children :
+        yield from _negations(child)
+
+@pytest.mark.parametrize("text", PROP + FAMILIES[:-2])
+def test_nnf (text) :
+    phi = tl.parse(text)
+    found = phi.nnf()
+    assert set(_negations(found)) <= {"name", "iname"}
+    assert found.expand().key() == phi.expand().nnf().key()
+    if text in PROP :
+        _equivalent(found.expand(), phi.expand())
+
+@pytest.mark.parametrize("text", PROP)
+def test_simplify (text) :
+    phi = tl.parse(text)
+    _equivalent(phi.simplify().expand(), phi.expand())
+
+def test_expand_edit () :
+    phi = tl.parse("&_{i in 1..2} p_i")
+    assert phi.expand().key() == tl.parse("p_1 & p_2").key()
+    phi["high"] = 3
+    assert phi.expand().key() == tl.parse("p_1 & p_2 & p_3").key()
+    assert phi.expand({"i" : 0}).key() == tl.parse("p_1 & p_2 & p_3").key()
@@ -0,0 +1,96 @@
+import io
+import pytest
+import tl
+from tl.its import PropertyFile
+
+TEXT = """let safe = a & ~b
+let live = A F (c & safe)
+in
+A G safe
+E F (safe & live)
+A G safe
+"""
+
+def test_add () :
+    props = PropertyFile(["A G spam", "E F (spam & egg)"])
+    assert props.add(tl.parse("A (spam U egg)")) == 2
+    assert len(props) == 3
+    assert [p.index for p in props] == [0, 1, 2]
+    assert props[0].text == "A G spam" and props[2].text is None
+    assert props[0].line == tl.parse("A G spam").its_ctl()
+    assert props[2].phi.key() == tl.parse("A (spam U egg)").key()
+    assert props.extend(["E F egg", tl.parse("A G spam")]) == [3, 4]
+    found = props.lookup(tl.parse("A G spam").fingerprint())
+    assert [p.index for p in found] == [0, 4]
+    assert props.lookup(tl.parse("E F bacon").fingerprint()) == []
+    ltl = PropertyFile(["G (spam => F egg)"], syntax="ltl")
+    assert ltl[0].line == tl.parse("G (spam => F egg)").its_ltl()
+    with pytest.raises(ValueError, match="unsupported ITS syntax") :
+        PropertyFile(syntax="arctl")
+
+@pytest.mark.parametrize("bad", ["A G (spam", "A{x} G spam", tl.parse("A F G spam")])
+def test_extend_atomic (bad) :
+    props = PropertyFile(["A G spam"])
+    with pytest.raises(Exception) :
+        props.extend(["E F egg", bad, "A G egg"])
+    # nothing was added
+    assert len(props) == 1
+    assert props.lookup(tl.parse("E F egg").fingerprint()) == []
+    assert props.dumps() == PropertyFile(["A G spam"]).dumps()
+    assert props.extend(["E F egg"]) == [1]
+
+def test_loads () :
+    props = PropertyFile()
+    assert props.loads(TEXT) == [0, 1, 2]
+    assert set(props.defs) == {"safe", "live"}
+    # definitions are parsed once and shared
+    assert props[0].phi.children[0].children[0] is props.defs["safe"]
+    assert props[1].phi.children[0].children[0].children[0] is props.defs["safe"]
+    assert props[0].fingerprint == props[2].fingerprint
+    assert props[0].line == tl.parse("A G (a & ~b)").its_ctl()
+    # later formulas may use the definitions
+    assert props.loads("E X live") == [3]
+    assert props[3].phi.key() == tl.parse("E X (A F (c & (a & ~b)))").key()
+
+@pytest.mark.parametrize("text", ["let x = a\nlet y = (b\nin\nA G x\n",
+                                  "let x = a\nbad\nin\nA G x\n",
+                                  "let x = a\nin\nA G x\nE F (x\n"])
+def test_loads_atomic (text) :
+    props = PropertyFile(["A G spam"])
+    props.define("egg", "b | c")
+    with pytest.raises(Exception) :
+        props.loads(text)
+    assert len(props) == 1
+    assert set(props.defs) == {"egg"}
+
+def test_write (tmp_path) :
+    props = PropertyFile()
+    props.loads(TEXT)
+    path = tmp_path / "model.ctl"
+    props.write(str(path))
+    # property n is line n
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines == [p.line for p in props]
+    out = io.StringIO()
+    props.write(out)
+    assert out.getvalue() == path.read_text(encoding="utf-8") == props.dumps()
+
+def test_round_trip (tmp_path) :
+    # a text is loaded, written, and loaded again from its source
+    path = tmp_path / "props.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    first = PropertyFile()
+    first.read(str(path))
+    second = PropertyFile()
+    with open(path, encoding="utf-8") as stream :
+        second.read(stream)
+    assert second.dumps() == first.dumps()
+    assert [p.fingerprint for p in second] == [p.fingerprint for p in first]
+    out = tmp_path / "model.ctl"
+    first.write(str(out))
+    # the records are enough to build the same file again
+    third = PropertyFile()
+    for name, phi in first.defs.items() :
+        third.define(name, phi)
+    third.extend(p.text for p in first)
+    assert third.dumps() == out.read_text(encoding="utf-8")
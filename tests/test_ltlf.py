@@ -0,0 +1,131 @@
+import random
+import numpy
+import pytest
+import tl
+from tl.ltlf import Evaluator, eval_traces
+
+def _formula (rng, depth) :
+    if depth == 0 or rng.random() < .2 :
+        return rng.choice(["a", "b", "c", "True", "False"])
+    op = rng.choice(["~", "&", "|", "=>", "<=>", "X", "F", "G", "U", "R", "W", "M"])
+    if op == "~" :
+        return f"~({_formula(rng, depth - 1)})"
+    elif op in ("X", "F", "G") :
+        return f"{op} ({_formula(rng, depth - 1)})"
+    return f"({_formula(rng, depth - 1)}) {op} ({_formula(rng, depth - 1)})"
+
+def holds (phi, trace, i) :
+    # direct LTLf semantics, trace is a list of sets of atoms
+    kind, sub, n = phi.kind, phi.children, len(trace)
+    def at (child, j) :
+        return holds(child, trace, j)
+    if kind == "name" :
+        return phi.value in trace[i]
+    elif kind == "bool" :
+        return phi.value
+    elif kind == "not" :
+        return not at(sub[0], i)
+    elif kind == "and" :
+        return all(at(c, i) for c in sub)
+    elif kind == "or" :
+        return any(at(c, i) for c in sub)
+    elif kind == "imply" :
+        return not at(sub[0], i) or at(sub[1], i)
+    elif kind == "iff" :
+        value = at(sub[0], i)
+        for child in sub[1:] :
+            value = value == at(child, i)
+        return value
+    elif kind == "X" :
+        return i + 1 < n and at(sub[0], i + 1)
+    elif kind == "F" :
+        return any(at(sub[0], j) for j in range(i, n))
+    elif kind == "G" :
+        return all(at(sub[0], j) for j in range(i, n))
+    left, right = sub
+    def until (p, q) :
+        return any(q(j) and all(p(k) for k in range(i, j)) for j in range(i, n))
+    if kind == "U" :
+        return until(lambda j : at(left, j), lambda j : at(right, j))
+    elif kind == "R" :
+        return all(at(right, j) or any(at(left, k) for k in range(i, j))
+                   for j in range(i, n))
+    elif kind == "W" :
+        return (until(lambda j : at(left, j), lambda j : at(right, j))
+                or all(at(left, j) for j in range(i, n)))
+    elif kind == "M" :
+        return until(lambda j : at(right, j),
+                     lambda j : at(left, j) and at(right, j))
+    raise ValueError(f"unexpected {kind}")
+
+def _trace (rng, length) :
+    return [{name for name in "abc" if rng.random() < .5} for _ in range(length)]
+
+def _array (traces) :
+    return numpy.array([[[name in letters for name in "abc"] for letters in trace]
+                        for trace in traces], dtype=bool)
+
+@pytest.mark.parametrize("seed", range(100))
+def test_random (seed) :
+    rng = random.Random(seed)
+    text = _formula(rng, 4)
+    phi = tl.parse(text)
+    traces = [_trace(rng, rng.randint(1, 7)) for _ in range(3)]
+    for trace in traces :
+        found = eval_traces(phi, _array([trace])[0], "abc")
+        assert found.tolist() == [holds(phi, trace, i) for i in range(len(trace))], text
+
+@pytest.mark.parametrize("seed", range(20))
+def test_batch (seed) :
+    rng = random.Random(seed)
+    length = rng.randint(1, 8)
+    traces = [_trace(rng, length) for _ in range(5)]
+    array = _array(traces)
+    columns = {name : array[..., num] for num, name in enumerate("abc")}
+    evaluator = Evaluator(array, "abc")
+    for _ in range(5) :
+        text = _formula(rng, 4)
+        found = evaluator(text)
+        assert found.shape == (5, length)
+        # the same as each trace alone, and as columns
+        for num, trace in enumerate(traces) :
+            assert (found[num] == eval_traces(text, array[num], "abc")).all()
+        assert (found == eval_traces(text, columns)).all()
+
+def test_example () :
+    found = eval_traces("a U b", {"a" : [True, True, False, False],
+                                  "b" : [False, False, True, False]})
+    assert found.tolist() == [True, True, True, False]
+    # X is strong and ~X ~ is weak at the last position
+    assert eval_traces("X a", {"a" : [True, True]}).tolist() == [True, False]
+    assert eval_traces("~(X ~a)", {"a" : [True, True]}).tolist() == [True, True]
+    # families are expanded
+    trace = {"p_1" : [True, False], "p_2" : [True, True]}
+    assert eval_traces("G (&_{i in 1..2} p_i)", trace).tolist() == [False, False]
+    assert eval_traces("F (&_{i in 1..2} p_i)", trace).tolist() == [True, False]
+
+def test_shared () :
+    evaluator = Evaluator({"a" : [True, False, True], "b" : [False, False, True]})
+    one = evaluator("F (a & b)")
+    size = len(evaluator.cache)
+    two = evaluator("G F (a & b)")
+    # only G is evaluated for the second formula
+    assert len(evaluator.cache) == size + 1
+    assert evaluator(tl.parse("F (a & b)")) is one
+    assert two.tolist() == [True, True, True]
+
+def test_errors () :
+    with pytest.raises(ValueError, match="unknown atom 'c'") :
+        eval_traces("F c", {"a" : [True]})
+    with pytest.raises(ValueError, match="actions not supported") :
+        eval_traces("a U{x} a", {"a" : [True]})
+    with pytest.raises(ValueError, match="cannot evaluate 'A'") :
+        eval_traces("A F a", {"a" : [True]})
+    with pytest.raises(ValueError, match="distinct shapes") :
+        eval_traces("a", {"a" : [True], "b" : [True, False]})
+    with pytest.raises(ValueError, match="atoms must be given") :
+        eval_traces("a", [[True]])
+    with pytest.raises(ValueError, match="does not match atoms") :
+        eval_traces("a", [[True, False]], ["a"])
+    with pytest.raises(ValueError, match="empty traces") :
+        eval_traces("a", {"a" : []})
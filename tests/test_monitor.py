@@ -0,0 +1,41 @@
+import numpy
+import tl
+from tl.monitor import Monitor, Monitors, Progression
+
+def _events (count, seed=0) :
+    rng = numpy.random.default_rng(seed)
+    return rng.random((count, 2)) < .5
+
+def test_verdicts_match_eval_traces () :
+    for phi in ["a U b", "G (a => F b)", "a W (G b)", "~(a R (b M (X a)))",
+                "G (a => X (b W a))", "a <=> b <=> X a"] :
+        prog = Progression(phi)
+        for seed in range(30) :
+            events = _events(1 + seed % 7, seed)
+            expected = tl.eval_traces(phi, events, ["a", "b"])[0]
+            mon = Monitor(prog)
+            for row in events :
+                verdict = mon.step({"a" : row[0], "b" : row[1]})
+            assert mon.accepting == expected
+            assert verdict in (None, expected)
+
+def test_batch_monitors () :
+    phi = "G (a => F b)"
+    traces = numpy.random.default_rng(1).random((5, 20, 2)) < .5
+    mons = Monitors(phi, 20, ["a", "b"])
+    for step in range(5) :
+        mons.step_many(traces[step])
+    expected = tl.eval_traces(phi, traces.transpose(1, 0, 2), ["a", "b"])[:, 0]
+    assert (mons.accepting() == expected).all()
+
+def test_obligations_stay_bounded () :
+    # progression used to nest obligations one level deeper at each step
+    for phi in ["a W (G c)", "G (req => (b W (G c)))"] :
+        mon = Monitor(phi)
+        sizes = []
+        for step in range(10000) :
+            mon.step({"a", "b", "c", "req"} if step % 3 else {"c", "req"})
+            if step in (100, 9999) :
+                sizes.append(len(mon.progression.nodes))
+        assert sizes[0] == sizes[1] < 50
+        assert mon.verdict is None and mon.accepting
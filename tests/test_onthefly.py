@@ -0,0 +1,154 @@
+import random
+import numpy
+import pytest
+import tl
+from tl.buchi import translate
+from tl.onthefly import Lasso, check
+from tl.scc import tarjan
+
+FORMULAS = ["G a", "F a", "G F a", "F G a", "a U b", "G (a => F b)",
+            "G (a => X b)", "(G F a) => (G F b)", "(F G a) | (G F b)", "a R b",
+            "X (a W b)", "a M b", "G (a => X (b U c))", "~(F (a & X b))",
+            "G F a & G F b", "True", "False"]
+
+def holds (phi, word, loop) :
+    # value of phi at position 0 of the lasso word[:loop] word[loop:]^omega
+    size = len(word)
+    succ = [i + 1 for i in range(size - 1)] + [loop]
+    def fix (init, step) :
+        val = [init] * size
+        for _ in range(size + 1) :
+            val = [step(i, val) for i in range(size)]
+        return val
+    def sat (node) :
+        kind = node.kind
+        if kind == "name" :
+            return [node.value in letters for letters in word]
+        elif kind == "bool" :
+            return [node.value] * size
+        sub = [sat(child) for child in node.children]
+        if kind == "not" :
+            return [not v for v in sub[0]]
+        elif kind == "and" :
+            return [all(v) for v in zip(*sub)]
+        elif kind == "or" :
+            return [any(v) for v in zip(*sub)]
+        elif kind == "imply" :
+            return [not a or b for a, b in zip(*sub)]
+        elif kind == "X" :
+            return [sub[0][succ[i]] for i in range(size)]
+        elif kind == "F" :
+            return fix(False, lambda i, v : sub[0][i] or v[succ[i]])
+        elif kind == "G" :
+            return fix(True, lambda i, v : sub[0][i] and v[succ[i]])
+        a, b = sub
+        if kind == "U" :
+            return fix(False, lambda i, v : b[i] or (a[i] and v[succ[i]]))
+        elif kind == "W" :
+            return fix(True, lambda i, v : b[i] or (a[i] and v[succ[i]]))
+        elif kind == "R" :
+            return fix(True, lambda i, v : b[i] and (a[i] or v[succ[i]]))
+        elif kind == "M" :
+            return fix(False, lambda i, v : b[i] and (a[i] or v[succ[i]]))
+        raise ValueError(f"unexpected {kind}")
+    return sat(phi)[0]
+
+def violated (phi, initial, succ, labels) :
+    # the explicit product of the model with the automaton of ~phi has a
+    # reachable SCC with an internal edge in every acceptance set
+    aut = translate(tl.Phi("not", phi))
+    index = {atom : num for num, atom in enumerate(aut.atoms)}
+    order = [(s, aut.initial) for s in initial]
+    number = {node : num for num, node in enumerate(order)}
+    edges = []
+    while len(edges) < len(order) :
+        state, auto = order[len(edges)]
+        code = sum(1 << index[a] for a in labels[state] if a in index)
+        trans = []
+        for pos, neg, target, acc in aut.edges[auto] :
+            if code & pos != pos or code & neg :
+                continue
+            for dst in succ[state] :
+                if (dst, target) not in number :
+                    number[dst, target] = len(order)
+                    order.append((dst, target))
+                trans.append((number[dst, target], acc))
+        edges.append(trans)
+    indptr = numpy.cumsum([0] + [len(t) for t in edges])
+    comp = tarjan(indptr, numpy.array([d for t in edges for d, _ in t], dtype=numpy.int64))
+    need = (1 << aut.sets) - 1
+    cover = {}
+    for src, trans in enumerate(edges) :
+        for dst, acc in trans :
+            if comp[src] == comp[dst] :
+                cover[comp[src]] = cover.get(comp[src], 0) | acc
+    return any(found & need == need for found in cover.values())
+
+def _model (rng) :
+    size = rng.randint(1, 6)
+    succ = {s : rng.sample(range(size), rng.randint(1, min(2, size))) for s in range(size)}
+    labels = {s : {name for name in "abc" if rng.random() < .5} for s in range(size)}
+    initial = rng.sample(range(size), rng.randint(1, min(2, size)))
+    return initial, succ, labels
+
+def _genuine (phi, lasso, initial, succ, labels) :
+    # the lasso is a path of the model on which phi does not hold
+    path = lasso.prefix + lasso.cycle
+    assert isinstance(lasso, Lasso) and lasso.cycle
+    assert path[0] in initial
+    for src, dst in zip(path, path[1:] + [lasso.cycle[0]]) :
+        assert dst in succ[src]
+    assert not holds(phi, [labels[s] for s in path], len(lasso.prefix))
+
+@pytest.mark.parametrize("text", FORMULAS)
+def test_random (text) :
+    phi = tl.parse(text)
+    rng = random.Random(text)
+    for _ in range(60) :
+        initial, succ, labels = _model(rng)
+        found = check(phi, initial, succ.__getitem__, lambda s, a : a in labels[s])
+        assert (found is not None) == violated(phi, initial, succ, labels)
+        if found is not None :
+            _genuine(phi, found, initial, succ, labels)
+        # counterexamples found with bitstate hashing are genuine too
+        found = check(text, initial, succ.__getitem__, lambda s, a : a in labels[s], bits=4)
+        if found is not None :
+            _genuine(phi, found, initial, succ, labels)
+
+def test_example () :
+    found = check("G F a", [0], lambda s : [(s + 1) % 4, 3], lambda s, a : s == 1)
+    assert found == Lasso(prefix=[0], cycle=[3, 0])
+    assert check("G F a", [1], lambda s : [s], lambda s, a : s == 1) is None
+    # finite paths are not considered
+    assert check("F a", [0], lambda s : [], lambda s, a : False) is None
+
+def test_early_stop () :
+    # the first branch has a counterexample, the second one is infinite
+    calls = []
+    def successors (state) :
+        calls.append(state)
+        if state == 0 :
+            return [1, 100]
+        elif state < 100 :
+            return [state % 3 + 1]
+        return [state + 1]
+    found = check("G F b", [0], successors, lambda s, a : False)
+    assert found == Lasso(prefix=[0], cycle=[1, 2, 3])
+    assert max(calls) < 100
+    # later initial states are not explored either
+    calls.clear()
+    found = check("G ~a", [5, 200], successors, lambda s, a : s == 5)
+    assert found is not None and found.prefix[0] == 5
+    assert 200 not in calls and max(calls) < 100
+
+def test_deep () :
+    # long paths do not hit the recursion limit
+    size = 50000
+    successors = lambda s : [(s + 1) % size]
+    label = lambda s, a : s % 1000 == 0
+    assert check("G F a", [0], successors, label) is None
+    found = check("F G ~a", [0], successors, label)
+    path = found.prefix + found.cycle + found.cycle[:1]
+    assert path[0] == 0 and all(t == (s + 1) % size for s, t in zip(path, path[1:]))
+    assert sorted(found.cycle) == list(range(size))
+    assert check("G F a", [0], successors, label, bits=20) is None
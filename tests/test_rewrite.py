@@ -0,0 +1,104 @@
+import itertools, random
+import pytest
+import tl
+from tl.rewrite import Rule, RuleSet, Var
+
+NEGATION = RuleSet([Rule("~~p", "p", "p", name="double"),
+                    Rule("~(p & q)", "~p | ~q", "p q", name="and"),
+                    Rule("~(p | q)", "~p & ~q", "p q", name="or"),
+                    Rule("p => q", "~p | q", "p q", name="imply")])
+
+def _formula (rng, depth) :
+    if depth == 0 or rng.random() < .2 :
+        return rng.choice(["a", "b", "c"])
+    op = rng.choice(["~", "~", "&", "|", "=>"])
+    if op == "~" :
+        return f"~({_formula(rng, depth - 1)})"
+    return f"({_formula(rng, depth - 1)}) {op} ({_formula(rng, depth - 1)})"
+
+def _eval (phi, env) :
+    sub = [_eval(child, env) for child in phi.children]
+    if phi.kind == "name" :
+        return env[phi.value]
+    elif phi.kind == "not" :
+        return not sub[0]
+    elif phi.kind == "and" :
+        return all(sub)
+    elif phi.kind == "or" :
+        return any(sub)
+    elif phi.kind == "imply" :
+        return not sub[0] or sub[1]
+    raise ValueError(f"unexpected {phi.kind}")
+
+def _normal (phi) :
+    if phi.kind == "not" :
+        return phi.children[0].kind == "name"
+    return phi.kind != "imply" and all(_normal(c) for c in phi.children)
+
+@pytest.mark.parametrize("strategy", ["bottomup", "topdown"])
+@pytest.mark.parametrize("seed", range(20))
+def test_terminates (seed, strategy) :
+    rng = random.Random(seed)
+    phi = tl.parse(_formula(rng, 5))
+    found = phi.rewrite(NEGATION, strategy)
+    assert _normal(found)
+    for values in itertools.product([False, True], repeat=3) :
+        env = dict(zip("abc", values))
+        assert _eval(found, env) == _eval(phi, env)
+    # a normal form is left unchanged
+    assert found.rewrite(NEGATION, strategy) is found
+
+@pytest.mark.parametrize("strategy", ["bottomup", "topdown"])
+@pytest.mark.parametrize("rule", [Rule("p & q", "q & p", "p q"),
+                                  Rule("p", "p & p", "p"),
+                                  Rule(Var("x", "name"), "X x", "x")])
+def test_cycle (rule, strategy) :
+    with pytest.raises(ValueError, match="rewriting does not terminate") :
+        tl.parse("A G (a & b)").rewrite(RuleSet([rule]), strategy)
+
+def test_max_steps () :
+    grow = RuleSet([Rule(Var("x", "name"),
+                         lambda node, binding : tl.Phi("name", value=node.value + "'"))])
+    with pytest.raises(ValueError, match="within 50 steps") :
+        tl.parse("a & b").rewrite(grow, max_steps=50)
+    with pytest.raises(ValueError, match="within 10 steps") :
+        list(grow.rewrite_all([tl.parse("a")], max_steps=10))
+    # the bound is not hit by a terminating rewriting
+    phi = tl.parse("~~a & ~~b")
+    assert phi.rewrite(NEGATION, max_steps=2).key() == tl.parse("a & b").key()
+    with pytest.raises(ValueError) :
+        phi.rewrite(NEGATION, max_steps=1)
+
+def test_rules () :
+    rules = RuleSet([Rule("A G (p => A F q)", "A G (~p | A F q)", "p q", name="ag"),
+                     Rule("~~p", "p", "p", name="double")])
+    found = tl.parse("A G (~~spam => A F egg)").rewrite(rules)
+    assert found.key() == tl.parse("A G (~spam | A F egg)").key()
+    assert rules.fired == {"ag" : 1, "double" : 1}
+    # attributes must match
+    phi = tl.parse("A{x} G (spam => A F egg)")
+    assert phi.rewrite(rules) is phi
+    # repeated variables match equal nodes
+    idem = RuleSet([Rule("p & p", "p", "p")])
+    assert tl.parse("(a | b) & (a | b)").rewrite(idem).key() == tl.parse("a | b").key()
+    phi = tl.parse("a & b")
+    assert phi.rewrite(idem) is phi
+    # variables restricted to some kinds
+    atoms = RuleSet([Rule(tl.Phi("not", Var("x", "name")), tl.Phi("bool", value=False))])
+    assert tl.parse("~a | ~(a & b)").rewrite(atoms).key() == tl.parse("False | ~(a & b)").key()
+    # functions may decline to rewrite
+    def swap (node, binding) :
+        if binding["p"].value > binding["q"].value :
+            return tl.Phi("and", binding["q"], binding["p"])
+    order = RuleSet([Rule(tl.rewrite.pattern("p & q", "p q"), swap)])
+    assert tl.parse("b & a").rewrite(order).key() == tl.parse("a & b").key()
+    with pytest.raises(ValueError, match="unknown strategy") :
+        phi.rewrite(idem, "sideways")
+    with pytest.raises(ValueError, match="unknown rule set") :
+        phi.rewrite("spam")
+
+def test_rewrite_all () :
+    formulas = [tl.parse("A G ~~a"), tl.parse("E F ~~a"), tl.parse("~~a")]
+    found = list(NEGATION.rewrite_all(formulas))
+    assert [f.key() for f in found] == [tl.parse(t).key() for t in ("A G a", "E F a", "a")]
+    assert found[0].children[0].children[0] is found[2]
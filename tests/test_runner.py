@@ -0,0 +1,81 @@
+import os, sys
+import pytest
+import tl
+from tl.runner import Runner
+
+CHECKER = [sys.executable, os.path.join(os.path.dirname(__file__), "fake_checker.py"),
+           "{model}", "{props}"]
+
+@pytest.fixture
+def model (tmp_path) :
+    path = tmp_path / "model.gal"
+    path.write_text("gal model {}\n")
+    return str(path)
+
+def _calls (model) :
+    if not os.path.exists(model + ".calls") :
+        return []
+    with open(model + ".calls") as stream :
+        return [int(line) for line in stream]
+
+def _verdicts (runner, model, formulas) :
+    # verdicts indexed by the formulas as given
+    texts = {}
+    for text in formulas :
+        try :
+            texts[tl.parse(text).key()] = text
+        except Exception :
+            pass
+    found = {}
+    for verdict in runner.run({model : formulas}) :
+        if isinstance(verdict.phi, str) :
+            found[verdict.phi] = verdict
+        else :
+            found[texts[verdict.phi.key()]] = verdict
+    return found
+
+def test_verdicts (model) :
+    found = _verdicts(Runner(CHECKER), model, ["AG yes", "EF no", "AG (yes & no)"])
+    assert {key : v.value for key, v in found.items()} == {
+        "AG yes" : True,
+        "EF no" : False,
+        "AG (yes & no)" : True}
+    assert not any(v.cached or v.error for v in found.values())
+    assert _calls(model) == [3]
+
+def test_cache_hit (model, tmp_path) :
+    cache = str(tmp_path / "verdicts.db")
+    first = _verdicts(Runner(CHECKER, cache=cache), model,
+                      ["AG yes", "EF no", "EF (no & yes)"])
+    assert not any(v.cached for v in first.values())
+    # the cache is keyed by canonical fingerprints (operands are sorted)
+    second = _verdicts(Runner(CHECKER, cache=cache), model,
+                       ["AG yes", "EF no", "EF (no & yes)", "EF (yes & no)"])
+    assert all(v.cached for v in second.values())
+    assert {key : v.value for key, v in second.items()} == {
+        "AG yes" : True,
+        "EF no" : False,
+        "EF (no & yes)" : True,
+        "EF (yes & no)" : True}
+    assert _calls(model) == [3]
+
+def test_timeout (model) :
+    formulas = ["AG yes", "EF slow", "EF no"]
+    found = _verdicts(Runner(CHECKER, timeout=1), model, formulas)
+    # the whole batch times out
+    assert all(v.value is None and v.error == "timeout" for v in found.values())
+    found = _verdicts(Runner(CHECKER, timeout=1, batch=1), model, formulas)
+    assert found["EF slow"].error == "timeout"
+    assert found["AG yes"].value is True
+    assert found["EF no"].value is False
+
+def test_invalid_formulas (model) :
+    found = _verdicts(Runner(CHECKER), model,
+                      ["EF (bad", "AG yes", "a & b | c", "A{a} G yes", "EF no"])
+    assert found["EF (bad"].value is None and "Unexpected" in found["EF (bad"].error
+    assert found["a & b | c"].error == "cannot chain distinct Boolean operators"
+    assert found["AG yes"].value is True
+    assert found["EF no"].value is False
+    assert _calls(model) == [2]
+    assert found["A{a} G yes"].value is None
+    assert "actions not allowed" in found["A{a} G yes"].error
@@ -0,0 +1,58 @@
+import io, itertools, random
+import pytest
+from tl.sat import Solver, read
+
+def _clauses (rng, size, count) :
+    return [[rng.choice([1, -1]) * rng.randint(1, size)
+             for _ in range(rng.randint(1, 3))]
+            for _ in range(count)]
+
+def _satisfies (model, clauses) :
+    return all(any(model.get(abs(lit), False) == (lit > 0) for lit in clause)
+               for clause in clauses)
+
+def _brute (size, clauses) :
+    for values in itertools.product([False, True], repeat=size) :
+        if _satisfies(dict(enumerate(values, 1)), clauses) :
+            return True
+    return False
+
+@pytest.mark.parametrize("seed", range(200))
+def test_random (seed) :
+    rng = random.Random(seed)
+    size = rng.randint(1, 10)
+    clauses = _clauses(rng, size, rng.randint(1, 5 * size))
+    solver = Solver()
+    for clause in clauses :
+        solver.add(clause)
+    found = solver.solve()
+    assert found == _brute(size, clauses)
+    if found :
+        assert _satisfies(solver.model, clauses)
+
+@pytest.mark.parametrize("seed", range(100))
+def test_incremental (seed) :
+    # clauses are added between calls, each solved under assumptions
+    rng = random.Random(seed)
+    size = rng.randint(2, 10)
+    solver = Solver()
+    clauses = []
+    for _ in range(8) :
+        for clause in _clauses(rng, size, rng.randint(0, size)) :
+            solver.add(clause)
+            clauses.append(clause)
+        picked = rng.sample(range(1, size + 1), rng.randint(0, min(3, size)))
+        assumptions = [rng.choice([1, -1]) * var for var in picked]
+        found = solver.solve(assumptions)
+        assert found == _brute(size, clauses + [[lit] for lit in assumptions])
+        if found :
+            assert _satisfies(solver.model, clauses + [[lit] for lit in assumptions])
+    # assumptions do not stick
+    assert solver.solve() == _brute(size, clauses)
+
+def test_read () :
+    text = "c example\np inccnf\n1 2 0\n-1 0\na 2 0\n-2 3\n0\n"
+    solver = read(io.StringIO(text))
+    assert solver.solve()
+    assert solver.model[2] and not solver.model[1]
+    assert not solver.solve([-3])
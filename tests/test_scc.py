@@ -0,0 +1,48 @@
+import random
+import numpy
+import pytest
+from tl.scc import tarjan
+
+def _reach (succ, roots) :
+    seen = set(roots)
+    todo = list(roots)
+    while todo :
+        for t in succ[todo.pop()] :
+            if t not in seen :
+                seen.add(t)
+                todo.append(t)
+    return seen
+
+def _csr (succ) :
+    indptr = numpy.cumsum([0] + [len(s) for s in succ])
+    return indptr, [t for s in succ for t in s]
+
+@pytest.mark.parametrize("seed", range(200))
+def test_random (seed) :
+    rng = random.Random(seed)
+    size = rng.randint(1, 12)
+    succ = [rng.sample(range(size), rng.randint(0, min(size, 3))) for _ in range(size)]
+    roots = None
+    if rng.random() < .5 :
+        roots = rng.sample(range(size), rng.randint(1, size))
+    comp = tarjan(*_csr(succ), roots).tolist()
+    visited = _reach(succ, range(size) if roots is None else roots)
+    for s in range(size) :
+        if s not in visited :
+            assert comp[s] == -1
+            continue
+        # same component iff mutually reachable
+        mutual = {t for t in _reach(succ, [s]) if s in _reach(succ, [t])}
+        assert {t for t in range(size) if comp[t] == comp[s]} == mutual
+        # components are numbered in reverse topological order
+        assert all(comp[t] <= comp[s] for t in succ[s])
+    assert sorted(set(comp) - {-1}) == list(range(len(set(comp) - {-1})))
+
+def test_deep () :
+    # a long cycle and a long chain do not hit the recursion limit
+    size = 100000
+    comp = tarjan(numpy.arange(size + 1), (numpy.arange(size) + 1) % size)
+    assert (comp == 0).all()
+    indptr = numpy.minimum(numpy.arange(size + 1), size - 1)
+    comp = tarjan(indptr, numpy.arange(1, size))
+    assert comp.tolist() == list(range(size - 1, -1, -1))
@@ -0,0 +1,90 @@
+import random
+import pytest
+import tl
+
+SYNTAXES = ["ctl", "arctl", "its_ctl", "its_ltl"]
+
+def _formula (rng, depth, pool) :
+    if pool and rng.random() < .3 :
+        return rng.choice(pool)
+    elif depth == 0 or rng.random() < .2 :
+        return rng.choice(["p", "q", "r"])
+    op = rng.choice(["~", "&", "|", "=>", "Q", "T"])
+    if op == "~" :
+        text = f"~({_formula(rng, depth - 1, pool)})"
+    elif op == "Q" :
+        text = f"{rng.choice(['A', 'E'])} ({rng.choice('XFG')} ({_formula(rng, depth - 1, pool)}))"
+    elif op == "T" :
+        text = f"{rng.choice('XFG')} ({_formula(rng, depth - 1, pool)})"
+    else :
+        text = f"({_formula(rng, depth - 1, pool)}) {op} ({_formula(rng, depth - 1, pool)})"
+    pool.append(text)
+    return text
+
+def _translate (phi, syntax) :
+    try :
+        return getattr(phi, syntax)()
+    except ValueError as err :
+        return str(err)
+
+def _emit (shared, syntax) :
+    try :
+        return shared.emit(syntax)
+    except ValueError as err :
+        return str(err)
+
+@pytest.mark.parametrize("seed", range(50))
+def test_emit (seed) :
+    rng = random.Random(seed)
+    phi = tl.parse(_formula(rng, 5, []))
+    shared = phi.share()
+    for syntax in SYNTAXES :
+        assert _emit(shared, syntax) == _translate(phi, syntax)
+    # the definitions are sub-formulas of the DAG used several times
+    for name, node in shared.defs :
+        assert shared[name] is node
+        assert node.key() != phi.key()
+    assert shared.root._memo is None
+
+def test_translated_once () :
+    class Counted (tl.Phi) :
+        names = []
+        def _its_ctl_name (self, node) :
+            self.names.append(node.value)
+            return super()._its_ctl_name(node)
+    phi = tl.parse("(A G (a & b)) | (E F (A G (a & b)))", Counted)
+    expected = phi.its_ctl()
+    assert sorted(Counted.names) == ["a", "a", "b", "b"]
+    del Counted.names[:]
+    assert phi.share().emit("its_ctl") == expected
+    assert sorted(Counted.names) == ["a", "b"]
+
+def test_defs () :
+    shared = tl.parse("(A G (a & b)) | (E F (A G (a & b)))").share()
+    # G (a & b) is under a quantifier, a & b is only used by it in the DAG
+    assert [(name, node.key()) for name, node in shared.defs] == [
+        ("_d0", tl.parse("A G (a & b)").key())]
+    assert shared.root.children[0] is shared.root.children[1].children[0].children[0]
+    shared = tl.parse("((a & b) | c) & ((a & b) | d) & ((a & b) | c)").share(prefix="x")
+    # definitions only use the previous ones
+    assert [(name, node.key()) for name, node in shared.defs] == [
+        ("x0", tl.parse("a & b").key()),
+        ("x1", tl.parse("(a & b) | c").key())]
+    assert shared["x1"].children[0] is shared["x0"]
+    with pytest.raises(KeyError) :
+        shared["x2"]
+    # small sub-formulas are not named
+    assert tl.parse("(a | b) & (a | b)").share(min_size=4).defs == []
+    assert len(tl.parse("(a | b) & (a | b)").share(min_size=3).defs) == 1
+
+def test_stats () :
+    shared = tl.parse("(A G (a & b)) | (E F (A G (a & b)))").share()
+    assert shared.stats() == {"tree_size" : 13,
+                              "dag_size" : 8,
+                              "definitions" : 1,
+                              "ratio" : 8 / 13}
+    shared = tl.parse("A G (a => A F b)").share()
+    assert shared.stats() == {"tree_size" : 7,
+                              "dag_size" : 7,
+                              "definitions" : 0,
+                              "ratio" : 1.0}
@@ -0,0 +1,155 @@
+import random
+import pytest
+import tl
+
+SYNTAXES = ["ctl", "arctl", "its_ctl", "its_ltl"]
+
+def _state (rng, depth) :
+    if depth == 0 or rng.random() < .2 :
+        return rng.choice(["p", "q", "True", "False"])
+    op = rng.choice(["~", "&", "|", "=>", "Q", "Q", "Q"])
+    if op == "~" :
+        return f"~({_state(rng, depth - 1)})"
+    elif op == "Q" :
+        quant = rng.choice(["A", "E", "A{a}", "E{a | b}", "A [UFAIR q]", "E [WFAIR p THEN q]"])
+        return f"{quant} ({_path(rng, depth - 1)})"
+    return f"({_state(rng, depth - 1)}) {op} ({_state(rng, depth - 1)})"
+
+def _path (rng, depth) :
+    op = rng.choice(["X", "F", "G", "U", "R", "W", "M"])
+    if op in ("X", "F", "G") :
+        return f"{op} ({_state(rng, depth)})"
+    return f"({_state(rng, depth)}) {op} ({_state(rng, depth)})"
+
+def _translates (phi, syntax) :
+    try :
+        getattr(phi, syntax)()
+    except Exception :
+        return False
+    return True
+
+@pytest.mark.parametrize("text", ["A (p U p)", "E (False U q)", "A{a} (p U p)",
+                                  "A [UFAIR q] (p U p)", "E (p W False)",
+                                  "E{a} (q R q)", "A G A G p", "E X (p U p)"])
+def test_quantified_paths (text) :
+    phi = tl.parse(text)
+    simple = phi.simplify()
+    for syntax in SYNTAXES :
+        if _translates(phi, syntax) :
+            assert _translates(simple, syntax), (text, syntax, simple)
+
+def test_random_formulas () :
+    rng = random.Random(0)
+    for _ in range(500) :
+        text = _state(rng, 4)
+        phi = tl.parse(text)
+        simple = phi.simplify()
+        for syntax in SYNTAXES :
+            if _translates(phi, syntax) :
+                assert _translates(simple, syntax), (text, syntax, simple)
+
+def test_fairness_kept () :
+    simple = tl.parse("A [UFAIR q] (p U p)").simplify()
+    assert simple.kind == "A" and simple.children[0].kind == "U"
+    assert tl.parse("A (p U p)").simplify() == tl.parse("p")
+
+def test_ctl_semantics () :
+    numpy = pytest.importorskip("numpy")
+    from tl.check import LTS, Checker
+    rng = random.Random(1)
+    for _ in range(20) :
+        size = rng.randint(1, 6)
+        edges = [(src, rng.randrange(size), rng.randrange(2))
+                 for src in range(size) for _ in range(rng.randint(1, 2))]
+        labels = {name : [rng.random() < .5 for _ in range(size)] for name in "pq"}
+        lts = LTS(*zip(*edges), ["a", "b"], labels, size=size)
+        checker = Checker(lts)
+        for _ in range(20) :
+            phi = tl.parse(_state(rng, 3))
+            if _translates(phi, "arctl") :
+                assert (checker(phi.arctl()) == checker(phi.simplify().arctl())).all()
+
+def _star (rng, depth) :
+    # CTL* state formulas, quantifying Boolean combinations of path formulas
+    if depth == 0 or rng.random() < .2 :
+        return rng.choice(["p", "q", "True", "False"])
+    op = rng.choice(["~", "&", "|", "Q", "Q", "Q"])
+    if op == "~" :
+        return f"~({_star(rng, depth - 1)})"
+    elif op == "Q" :
+        return f"{rng.choice('AE')} ({_star_path(rng, depth - 1)})"
+    return f"({_star(rng, depth - 1)}) {op} ({_star(rng, depth - 1)})"
+
+def _star_path (rng, depth) :
+    if depth == 0 or rng.random() < .2 :
+        return _star(rng, depth)
+    op = rng.choice(["~", "&", "|", "X", "F", "G", "U", "R", "W", "M", "S"])
+    if op == "S" :
+        return _star(rng, depth)
+    elif op == "~" :
+        return f"~({_star_path(rng, depth - 1)})"
+    elif op in ("X", "F", "G") :
+        return f"{op} ({_star_path(rng, depth - 1)})"
+    return f"({_star_path(rng, depth - 1)}) {op} ({_star_path(rng, depth - 1)})"
+
+def _sat (phi, succ, labels) :
+    # states of the Kripke structure (succ, labels) that satisfy phi
+    from tl.onthefly import check
+    states = set(succ)
+    kind = phi.kind
+    if kind == "name" :
+        return labels[phi.value]
+    elif kind == "bool" :
+        return states if phi.value else set()
+    elif kind in ("A", "E") :
+        # maximal state sub-formulas of the path formula become atoms
+        atoms = dict(labels)
+        def path (node) :
+            if node.kind in ("A", "E") :
+                name = f"@{len(atoms)}"
+                atoms[name] = _sat(node, succ, labels)
+                return tl.Phi("name", value=name)
+            return node.__class__(node.kind, *(path(c) for c in node.children), **node)
+        psi = path(phi.children[0])
+        label = lambda state, atom : state in atoms[atom]
+        if kind == "A" :
+            return {s for s in states if check(psi, [s], succ.get, label) is None}
+        return {s for s in states
+                if check(tl.Phi("not", psi), [s], succ.get, label) is not None}
+    sub = [_sat(child, succ, labels) for child in phi.children]
+    if kind == "not" :
+        return states - sub[0]
+    elif kind == "and" :
+        return set.intersection(*sub)
+    elif kind == "or" :
+        return set.union(*sub)
+    raise ValueError(kind)
+
+@pytest.mark.parametrize("text", ["E ((G p) & (G q))", "E ((F p) | q)",
+                                  "A G E ((X p) | (X q))", "E ~(X p)",
+                                  "A ((F p) => (p U q))"])
+def test_path_combinations_kept (text) :
+    phi = tl.parse(text)
+    assert phi.simplify().kind == phi.kind
+
+def test_ctl_star_semantics () :
+    rng = random.Random(2)
+    for _ in range(30) :
+        size = rng.randint(1, 4)
+        succ = {s : rng.sample(range(size), rng.randint(1, min(2, size)))
+                for s in range(size)}
+        labels = {name : {s for s in range(size) if rng.random() < .5}
+                  for name in "pq"}
+        for _ in range(10) :
+            phi = tl.parse(_star(rng, 4))
+            simple = phi.simplify()
+            assert _sat(phi, succ, labels) == _sat(simple, succ, labels), (phi, simple)
+
+def test_fired_kept_rewrites () :
+    fired = {}
+    tl.parse("A{a} (p U p)").simplify(fired=fired)
+    assert fired == {}
+    fired = {}
+    tl.parse("(A (p U p)) & (A (p U p))").simplify(fired=fired)
+    assert fired == {"until-const" : 1, "quantifier" : 1, "idempotence" : 1,
+                     "const" : 1}
@@ -0,0 +1,159 @@
+import random
+import numpy
+import pytest
+import tl
+from tl import symbolic
+from tl.bdd import BDD
+from tl.check import Kripke, LTS, Checker, check
+
+ALPHABET = ["x", "y"]
+
+def _state (rng, depth) :
+    if depth == 0 or rng.random() < .25 :
+        return rng.choice(["a", "b", "c", "True"])
+    op = rng.choice(["~", "&", "|", "Q", "Q", "Q"])
+    if op == "~" :
+        return f"~({_state(rng, depth - 1)})"
+    elif op in "&|" :
+        return f"({_state(rng, depth - 1)}) {op} ({_state(rng, depth - 1)})"
+    quant = rng.choice(["A", "E"])
+    quant += rng.choice(["", "", "{x}", "{y}", "{x | y}"])
+    quant += rng.choice(["", "", "", " [UFAIR a]", " [UFAIR {x}]",
+                         " [WFAIR b THEN a]", " [SFAIR {y} THEN c]",
+                         " [SFAIR a THEN {x}] [UFAIR ~a]"])
+    mod = rng.choice("XFGURWM")
+    if mod in "XFG" :
+        return f"{quant} {mod} ({_state(rng, depth - 1)})"
+    return f"{quant} (({_state(rng, depth - 1)}) {mod} ({_state(rng, depth - 1)}))"
+
+def _formulas (rng, syntax, count) :
+    done = 0
+    while done < count :
+        text = _state(rng, 3)
+        try :
+            phi = getattr(tl.parse(text), syntax)()
+        except ValueError :
+            continue
+        done += 1
+        yield text, phi
+
+def _states (model, sat, size) :
+    # numbers of the states of sat, as encoded in binary by encode
+    found = []
+    for num in range(size) :
+        code = {name : bool(num >> pos & 1) for pos, name in enumerate(model.variables)}
+        if model.state(code) & sat != model.bdd.false :
+            found.append(num)
+    return found
+
+@pytest.mark.parametrize("seed", range(40))
+def test_arctl (seed) :
+    rng = random.Random(seed)
+    size = rng.randint(1, 9)
+    edges = [(s, rng.randrange(size), rng.randrange(len(ALPHABET)))
+             for s in range(size) for _ in range(rng.randint(1, 3))]
+    labels = {name : [rng.random() < .5 for _ in range(size)] for name in "abc"}
+    src, dst, act = zip(*edges)
+    lts = LTS(src, dst, act, ALPHABET, labels, size=size,
+              initial=rng.sample(range(size), rng.randint(1, size)))
+    # a tiny manager collects garbage during the fixpoints
+    model = symbolic.encode(lts, BDD(cache=4, threshold=4))
+    assert model.count(model.states) == size
+    explicit, checker = Checker(lts), symbolic.Checker(model)
+    for text, phi in _formulas(rng, "arctl", 10) :
+        expected = numpy.flatnonzero(explicit(phi)).tolist()
+        assert _states(model, checker(phi), size) == expected, text
+        assert symbolic.check(text, model, "arctl") == check(text, lts, "arctl"), text
+    assert model.bdd.stats()["collections"] > 0
+
+@pytest.mark.parametrize("seed", range(20))
+def test_ctl (seed) :
+    rng = random.Random(seed)
+    size = rng.randint(1, 9)
+    succ = [sorted(set(rng.randrange(size) for _ in range(rng.randint(1, 3))))
+            for _ in range(size)]
+    labels = {name : [rng.random() < .5 for _ in range(size)] for name in "abc"}
+    kripke = Kripke(numpy.cumsum([0] + [len(s) for s in succ]),
+                    [t for s in succ for t in s], labels)
+    model = symbolic.encode(kripke)
+    explicit, checker = Checker(kripke), symbolic.Checker(model)
+    for text, phi in _formulas(rng, "ctl", 10) :
+        expected = numpy.flatnonzero(explicit(phi)).tolist()
+        assert _states(model, checker(phi), size) == expected, text
+        assert symbolic.check(text, model) == check(text, kripke), text
+
+@pytest.mark.parametrize("seed", range(10))
+def test_reorder (seed) :
+    # results do not depend on the order of the variables, that may be
+    # changed when garbage is collected
+    rng = random.Random(seed)
+    size = rng.randint(2, 9)
+    succ = [[rng.randrange(size)] for _ in range(size)]
+    labels = {name : [rng.random() < .5 for _ in range(size)] for name in "abc"}
+    kripke = Kripke(numpy.arange(size + 1), [s[0] for s in succ], labels)
+    def shuffle (bdd) :
+        bdd.reorder(rng.sample(bdd.names, len(bdd.names)))
+    model = symbolic.encode(kripke, BDD(threshold=4, hook=shuffle))
+    explicit, checker = Checker(kripke), symbolic.Checker(model)
+    for text, phi in _formulas(rng, "ctl", 10) :
+        expected = numpy.flatnonzero(explicit(phi)).tolist()
+        assert _states(model, checker(phi), size) == expected, text
+    assert model.bdd.stats()["collections"] > 0
+
+def _counter () :
+    # goes through 00, 01, 11, 10 and back
+    model = symbolic.Model(["a", "b"])
+    a, b = model.var("a"), model.var("b")
+    model.init = ~a & ~b
+    model.add(~(model.var("a", True) ^ b) & ~(model.var("b", True) ^ ~a))
+    return model
+
+def test_model () :
+    model = _counter()
+    a, b = model.var("a"), model.var("b")
+    assert model.bdd.names == ["a", "a'", "b", "b'"]
+    assert model.count(model.reachable()) == 4
+    assert model.image(model.init) == (~a & b)
+    assert model.preimage(model.init) == (a & ~b)
+    assert symbolic.check("A G A F a", model)
+    assert symbolic.check("E F (a & b)", model)
+    assert not symbolic.check("E F (a & b & E X ~a)", model)
+    # labels are looked up before variables
+    model.labels["a"] = model.bdd.false
+    assert not symbolic.check("E F a", model)
+    model.labels["done"] = a & ~b
+    assert symbolic.check("A F done", model)
+
+def test_actions () :
+    model = symbolic.Model(["a"], alphabet=["on", "off", "stay"])
+    a, na = model.var("a"), model.var("a", True)
+    assert model.letters == ["@0", "@1"]
+    assert model.bdd.names == ["@0", "@1", "a", "a'"]
+    model.init = ~a
+    model.add(~a & na, "on")
+    model.add(a & ~na, "off")
+    model.add(~(a ^ na), "stay")
+    assert symbolic.check("A G E{on} X a", model, "arctl") is False
+    assert symbolic.check("E{on} X a", model, "arctl")
+    assert symbolic.check("A{stay} G ~a", model, "arctl")
+    assert symbolic.check("A{~stay} F a", model, "arctl")
+    assert symbolic.check("E [UFAIR {stay}] G True", model, "arctl")
+    assert not symbolic.check("A [UFAIR {off}] G ~a", model, "arctl")
+
+def test_errors () :
+    model = _counter()
+    with pytest.raises(ValueError, match="unknown variable 'c'") :
+        model.var("c")
+    with pytest.raises(ValueError, match="unknown atom 'c'") :
+        symbolic.check("E F c", model)
+    with pytest.raises(ValueError, match="model has no actions") :
+        model.add(model.bdd.true, "x")
+    with pytest.raises(ValueError, match="actions require a model with actions") :
+        symbolic.check("E{x} F a", model, "arctl")
+    with pytest.raises(ValueError, match="unsupported syntax") :
+        symbolic.check("E F a", model, "ltl")
+    model = symbolic.Model(["a"], alphabet=ALPHABET)
+    with pytest.raises(ValueError, match="missing action") :
+        model.add(model.bdd.true)
+    with pytest.raises(ValueError, match="unknown action 'z'") :
+        model.add(model.bdd.true, "z")
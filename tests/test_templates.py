@@ -0,0 +1,58 @@
+import pytest
+import tl
+
+CTL = ["A G ($p => A F $q)", "A G ($p => A F $p)", "E ($p U (A X $p))",
+       "($p & $q) | ~($q)", "A [UFAIR $p] G $q"]
+LTL = ["G ($p => F $q)", "G ($p => F $p)", "($p U $q) & (X $p)", "F G ($q)"]
+
+@pytest.mark.parametrize("text", CTL)
+def test_its_ctl (text) :
+    template = tl.template(text)
+    values = {var : {"p" : "x", "q" : "y"}[var] for var in template.variables}
+    instance = template.instantiate(**values)
+    try :
+        expected = instance.its_ctl()
+    except ValueError as err :
+        with pytest.raises(ValueError, match=str(err)[:20]) :
+            template.its_ctl(**values)
+    else :
+        assert template.its_ctl(**values) == expected
+    assert instance.key() == tl.parse(text.replace("$p", "x").replace("$q", "y")).key()
+
+@pytest.mark.parametrize("text", LTL)
+def test_its_ltl (text) :
+    template = tl.template(text)
+    rows = [("a", "b"), ("c", "d"), ("a", "a")]
+    rows = [row[:len(template.variables)] for row in rows]
+    assert list(template.emit_many("its_ltl", rows)) == [
+        tl.template(text).instantiate(row).its_ltl() for row in rows]
+
+def test_repeated_variable () :
+    template = tl.template("A G ($p => A F $p)")
+    assert template.variables == ["p"]
+    assert template.its_ctl(p="x") == 'AG(("x")->(AF("x")));'
+    assert template.its_ctl(["y"]) == 'AG(("y")->(AF("y")));'
+    assert template.instantiate(p="x") == tl.parse("A G (x => A F x)")
+
+def test_formula_values () :
+    template = tl.template("A G ($p => A F done)")
+    value = tl.parse("a & b")
+    assert template.its_ctl(p=value) == tl.parse("A G ((a & b) => A F done)").its_ctl()
+    # sub-formulas without variables are shared
+    def future (phi) :
+        # the A F done operand of the implication
+        return phi.children[0].children[0].children[1]
+    one = template.instantiate(p="x")
+    two = template.instantiate(p=value)
+    assert future(one) is future(two) is future(template.phi)
+
+def test_bindings () :
+    template = tl.template("A G ($p => A F $q)")
+    with pytest.raises(ValueError, match=r"missing value for \$q") :
+        template.its_ctl(p="x")
+    with pytest.raises(ValueError, match=r"unknown variable \$r") :
+        template.its_ctl(p="x", q="y", r="z")
+    with pytest.raises(ValueError, match="expected 2 values, got 1") :
+        template.its_ctl(["x"])
+    with pytest.raises(ValueError, match="expected 2 values, got 3") :
+        list(template.emit_many("its_ctl", [("x", "y", "z")]))
@@ -0,0 +1,99 @@
+import random
+import pytest
+import tl
+
+SYNTAXES = ["ctl", "arctl", "its_ctl", "its_ltl"]
+
+def _formula (rng, depth) :
+    if depth == 0 or rng.random() < .2 :
+        return rng.choice(["p", "q", "r", "True"])
+    op = rng.choice(["~", "&", "|", "=>", "<=>", "Q", "Q", "T", "T"])
+    if op == "~" :
+        return f"~({_formula(rng, depth - 1)})"
+    elif op == "Q" :
+        quant = rng.choice(["A", "E", "A{a}", "E [UFAIR p]"])
+        return f"{quant} ({_formula(rng, depth - 1)})"
+    elif op == "T" :
+        mod = rng.choice(["X", "F", "G", "U", "R", "W"])
+        if mod in ("X", "F", "G") :
+            return f"{mod} ({_formula(rng, depth - 1)})"
+        return f"({_formula(rng, depth - 1)}) {mod} ({_formula(rng, depth - 1)})"
+    return f"({_formula(rng, depth - 1)}) {op} ({_formula(rng, depth - 1)})"
+
+def _translate (phi, syntax) :
+    try :
+        return getattr(phi, syntax)()
+    except ValueError as err :
+        return str(err)
+
+def _texts (count, seed) :
+    rng = random.Random(seed)
+    return [_formula(rng, 4) for _ in range(count)]
+
+@pytest.mark.parametrize("text", _texts(300, 0))
+def test_translate_all (text) :
+    phi = tl.parse(text)
+    found = phi.translate_all(SYNTAXES)
+    for syntax in SYNTAXES :
+        value = found[syntax]
+        if isinstance(value, ValueError) :
+            value = str(value)
+        assert value == _translate(phi, syntax)
+        assert (phi.check(syntax) is None) == (not isinstance(found[syntax],
+                                                              ValueError))
+
+@pytest.mark.parametrize("text", _texts(100, 1))
+def test_let (text) :
+    rng = random.Random(text)
+    sub = _formula(rng, 2)
+    # every q in text is replaced by the shared sub-formula
+    body = text.replace("q", "x")
+    shared = tl.parse(f"let x = ({sub}) in ({body}) & (x | ~(x))")
+    body = text.replace("q", f"({sub})")
+    plain = tl.parse(f"({body}) & (({sub}) | ~({sub}))")
+    assert shared._shared and not plain._shared
+    for syntax in SYNTAXES :
+        assert _translate(shared, syntax) == _translate(plain, syntax)
+    assert shared.translate_all(SYNTAXES).keys() == set(SYNTAXES)
+
+def test_shared_translation () :
+    phi = tl.parse("let x = A G p in x & E F x")
+    ctl = phi.ctl()
+    assert ctl.children[0] is ctl.children[1].children[0]
+    assert phi.its_ctl() == '(AG("p"))&&(EF(AG("p")));'
+
+def test_subclass_dispatch () :
+    class Upper (tl.Phi) :
+        def _its_ctl_name (self, node) :
+            return f'"{node.value.upper()}"'
+    assert tl.parse("A G p").its_ctl() == 'AG("p");'
+    assert tl.parse("A G p", Upper).its_ctl() == 'AG("P");'
+    assert tl.parse("A G p").its_ctl() == 'AG("p");'
+
+@pytest.mark.parametrize("text, expected", [("let & p", '("let")&&("p");'),
+                                            ("in | q", '("in")||("q");'),
+                                            ("(let) & in", '("let")&&("in");'),
+                                            ("A G let", 'AG("let");'),
+                                            ("let x = in in x & let", '("in")&&("let");'),
+                                            ("let let = a in let | in", '("a")||("in");')])
+def test_let_keywords (text, expected) :
+    # let and in are keywords only around definitions
+    assert tl.parse(text).its_ctl() == expected
+
+def test_let_scope () :
+    # inner definitions hide outer ones until the end of their let
+    phi = tl.parse("let x = a in (let x = b in x) & x")
+    assert phi.key() == tl.parse("b & a").key()
+    # definitions may use the previous ones, including the one they hide
+    phi = tl.parse("let x = a, x = x & b in x | c")
+    assert phi.key() == tl.parse("(a & b) | c").key()
+    # names are bound only in the body of let
+    phi = tl.parse("(let x = a in x) & x")
+    assert phi.key() == tl.parse("a & x").key()
+
+def test_let_unused () :
+    phi = tl.parse("let x = a, y = A G b in x & c")
+    assert phi.key() == tl.parse("a & c").key()
+    phi = tl.parse("let y = A G b in E F c")
+    assert not phi._shared
+    assert phi.its_ctl() == tl.parse("E F c").its_ctl()
@@ -1,7 +1,7 @@
 """Python parser and translator for varied temporal logics
 """
 
-import functools, re, ast
+import functools, itertools, re, ast, hashlib
 from .tlparse import Lark_StandAlone, Transformer, v_args, Token
 
 version = "0.2"
@@ -9,13 +9,163 @@ version = "0.2"
 def translator (method) :
     @functools.wraps(method)
     def wrapper (self) :
+        # shared sub-formulas (from let) are translated once, formulas
+        # without sharing skip the memo altogether
+        fresh = self._memo is None and self._shared
+        if fresh :
+            self._memo = {}
         try :
             return method(self)
         except AssertionError as err :
             raise ValueError(f"invalid {method.__name__} formula ({err})")
+        finally :
+            if fresh :
+                del self._memo
     return wrapper
 
+def _key (value) :
+    if isinstance(value, Phi) :
+        return value.key()
+    elif isinstance(value, (list, tuple)) :
+        return tuple(_key(v) for v in value)
+    else :
+        return value
+
+def _subterms (node) :
+    yield from node.children
+    for value in node.values() :
+        if isinstance(value, Phi) :
+            yield value
+        elif isinstance(value, (list, tuple)) :
+            for item in value :
+                if isinstance(item, Phi) :
+                    yield item
+
+def _digest (node, digests) :
+    def attr (value) :
+        if isinstance(value, Phi) :
+            return digests[id(value)]
+        elif isinstance(value, (list, tuple)) :
+            return tuple(attr(v) for v in value)
+        return value
+    key = (node.kind,
+           tuple(digests[id(child)] for child in node.children),
+           tuple(sorted((k, attr(v)) for k, v in node.items()
+                        if v is not None and not (isinstance(v, list) and not v))))
+    return hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+
+class Rule (object) :
+    def __init__ (self, ident, test, message) :
+        self.ident = ident
+        self.test = test
+        self.message = message
+    def __repr__ (self) :
+        return f"{self.__class__.__name__}({self.ident!r})"
+
+class Violation (object) :
+    __slots__ = ("syntax", "path", "rule", "node", "fields")
+    def __init__ (self, syntax, path, rule, node, fields) :
+        self.syntax = syntax
+        self.path = path
+        self.rule = rule
+        self.node = node
+        self.fields = fields
+    @property
+    def message (self) :
+        return self.rule.message.format(node=self.node, **self.fields)
+    def __str__ (self) :
+        return f"invalid {self.syntax} formula ({self.message})"
+    def __repr__ (self) :
+        return (f"{self.__class__.__name__}({self.syntax!r}, {self.path!r},"
+                f" {self.rule.ident!r}, {self.message!r})")
+
+def _has_actions (node) :
+    return bool(node.actions or node.left_actions or node.right_actions)
+
+def _has_fairness (node) :
+    return bool(node.ufair or node.wfair or node.sfair)
+
+def _modality_actions (node) :
+    return _has_actions(node.children[0])
+
+def _followed (kinds) :
+    def test (node) :
+        return node.children[0].kind not in kinds
+    return test
+
+def _nested (kinds) :
+    def test (node) :
+        for child in node.children[0].children :
+            if child.kind in kinds :
+                return {"child" : child}
+    return test
+
+def _nested_child (kinds) :
+    def test (node) :
+        if node.children[0].kind in kinds :
+            return {"child" : node.children[0]}
+    return test
+
+def _quantified (node) :
+    return (((0, i), child) for i, child in enumerate(node.children[0].children))
+
+def _arctl_quantified (node) :
+    for key in ("ufair", "wfair", "sfair") :
+        for i, fair in enumerate(node.get(key) or ()) :
+            if key in ("wfair", "sfair") and fair.condition.kind != "actions" :
+                yield (key, i, "condition"), fair.condition
+            if fair.then.kind != "actions" :
+                yield (key, i, "then"), fair.then
+    yield from _quantified(node)
+
+_accepted = Rule("accepted", None, "{node.kind!r} not accepted")
+_expansion = Rule("expansion", None, "{error}")
+_actions = Rule("actions", _has_actions, "actions not allowed")
+_fairness = Rule("fairness", _has_fairness, "fairness not allowed")
+_ctl_quantifier = (Rule("modality", _followed("XFGURWM"),
+                        "{node.kind} must be followed by X, F, G, U, R, W, or M"),
+                   _actions,
+                   _fairness,
+                   Rule("actions", _modality_actions, "actions not allowed"),
+                   Rule("nesting", _nested("FGURXWM"),
+                        "cannot nest {child.kind} in {node.kind}{node.children[0].kind}"))
+_arctl_quantifier = (_ctl_quantifier[0],
+                     Rule("actions", _modality_actions,
+                          "actions not allowed on temporal operators"),
+                     _ctl_quantifier[-1])
+_its_ctl_quantifier = (Rule("modality", _followed("XFGUE"),
+                            "{node.kind} must be followed by X, F, G, U, or R"),
+                       _actions,
+                       _fairness)
+_its_ctl_unary = (_actions,
+                  Rule("nesting", _nested_child("FGURX"),
+                       "cannot nest {child.kind} in {node.kind}"))
+
 class Phi (dict) :
+    _rules = {"ctl" : {"A" : _ctl_quantifier,
+                       "E" : _ctl_quantifier},
+              "arctl" : {"A" : _arctl_quantifier,
+                         "E" : _arctl_quantifier},
+              "its_ctl" : {"A" : _its_ctl_quantifier,
+                           "E" : _its_ctl_quantifier,
+                           "X" : _its_ctl_unary,
+                           "F" : _its_ctl_unary,
+                           "G" : _its_ctl_unary,
+                           "U" : _its_ctl_unary,
+                           "R" : (_actions,)},
+              "its_ltl" : {"X" : (_actions,),
+                           "F" : (_actions,),
+                           "G" : (_actions,),
+                           "U" : (_actions,),
+                           "R" : (_actions,)}}
+    # syntax => kind => (handler, rules), filled by _compile
+    _dispatch = {}
+    _memo = None
+    _shared = False
+    _descend = {"ctl" : {"A" : _quantified,
+                         "E" : _quantified},
+                "arctl" : {"A" : _arctl_quantified,
+                           "E" : _arctl_quantified}}
     def __init__ (self, kind, *children, **attr) :
         super().__init__()
         self.kind = kind
@@ -23,6 +173,10 @@ class Phi (dict) :
         for key, val in attr.items() :
             if val is not None :
                 self[key] = val
+    def __init_subclass__ (cls, **args) :
+        super().__init_subclass__(**args)
+        # subclasses may override handlers or rules
+        cls._dispatch = {}
     def __getattr__ (self, name) :
         return self.get(name, None)
     def __repr__ (self) :
@@ -31,18 +185,222 @@ class Phi (dict) :
                          + [f"{k}={v!r}" for k, v in self.items()])
         return f"{self.__class__.__name__}({args})"
     def __call__ (self, syntax, node) :
+        memo = self._memo
+        if memo is not None :
+            key = (syntax, id(node))
+            if key in memo :
+                result = memo[key]
+                if isinstance(result, ValueError) :
+                    raise result
+                return result
+        try :
+            handler, rules = self._dispatch[syntax][node.kind]
+        except KeyError :
+            handler, rules = self._compile(syntax, node.kind)
         try :
-            handler = getattr(self, f"_{syntax}_{node.kind}")
-            assert handler is not None, f"{node.kind!r} not accepted"
-            return handler(node)
+            if handler is None :
+                raise ValueError(str(Violation(syntax, None, _accepted, node, {})))
+            for rule in rules :
+                found = rule.test(node)
+                if found :
+                    raise ValueError(str(Violation(syntax, None, rule, node,
+                                                   found if isinstance(found, dict)
+                                                   else {})))
+            result = handler(self, node)
         except AssertionError as err :
-            raise ValueError(f"invalid {syntax} formula ({err})")
+            result = ValueError(f"invalid {syntax} formula ({err})")
+        except ValueError as err :
+            result = err
+        if memo is not None :
+            memo[key] = result
+        if isinstance(result, ValueError) :
+            raise result
+        return result
+    def _compile (self, syntax, kind) :
+        # handler and rules of each node kind, looked up once per class
+        entry = (getattr(self.__class__, f"_{syntax}_{kind}", None),
+                 self._rules.get(syntax, {}).get(kind, ()))
+        self._dispatch.setdefault(syntax, {})[kind] = entry
+        return entry
     def __bool__(self):
       	return True
     def __iter__ (self) :
         yield self
         for child in self.children :
             yield from child
+    def key (self) :
+        return (self.kind,
+                tuple(child.key() for child in self.children),
+                tuple(sorted((k, _key(v)) for k, v in self.items()
+                             if v is not None and not (isinstance(v, list)
+                                                       and not v))))
+    def fingerprint (self) :
+        # SHA-1 computed bottom-up from the digests of the sub-formulas,
+        # canonical formulas cache their fingerprint (see tl.canonical)
+        digests = {}
+        stack = [(self, False)]
+        while stack :
+            node, ready = stack.pop()
+            if id(node) in digests :
+                continue
+            elif node._fingerprint is not None :
+                digests[id(node)] = node._fingerprint
+            elif ready :
+                digests[id(node)] = _digest(node, digests)
+            else :
+                stack.append((node, True))
+                stack.extend((sub, False) for sub in _subterms(node))
+        return digests[id(self)]
+    def _postorder (self) :
+        stack = [(self, False)]
+        while stack :
+            node, done = stack.pop()
+            if done :
+                yield node
+            else :
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.children))
+    def translate_all (self, syntaxes) :
+        # one post-order walk: at each node, the rules of all the syntaxes
+        # are tested once and each handler finds the translations of the
+        # children in the memo, a syntax that fails is left to its own
+        # translator below to report the error as usual
+        memo = self._memo = {}
+        try :
+            live = list(syntaxes)
+            plans = {}
+            order = []
+            seen = set()
+            stack = [self]
+            while stack :
+                node = stack.pop()
+                if id(node) not in seen :
+                    seen.add(id(node))
+                    order.append(node)
+                    stack.extend(node.children)
+            # reversed pre-order: children come before their parents, except
+            # the sub-formulas also shared by a node met earlier, which are
+            # then translated on demand by __call__
+            for node in reversed(order) :
+                if not live :
+                    break
+                plan = plans.get(node.kind)
+                if plan is None :
+                    plan = plans[node.kind] = self._plan(live, node.kind)
+                tested = {}
+                for syntax, handler, rules in plan :
+                    key = (syntax, id(node))
+                    if key in memo :
+                        continue
+                    try :
+                        for rule in rules :
+                            if rule.test not in tested :
+                                tested[rule.test] = rule.test(node)
+                            if tested[rule.test] :
+                                raise ValueError(rule.ident)
+                        memo[key] = handler(self, node)
+                    except (AssertionError, ValueError) :
+                        live.remove(syntax)
+                        plans.clear()
+            result = {}
+            for syntax in syntaxes :
+                try :
+                    result[syntax] = getattr(self, syntax)()
+                except ValueError as err :
+                    result[syntax] = err
+            return result
+        finally :
+            del self._memo
+    def _plan (self, syntaxes, kind) :
+        plan = []
+        for syntax in syntaxes :
+            try :
+                handler, rules = self._dispatch[syntax][kind]
+            except KeyError :
+                handler, rules = self._compile(syntax, kind)
+            if handler is not None :
+                plan.append((syntax, handler, rules))
+        return plan
+    def simplify (self, rules=None, fired=None) :
+        from .simplify import Simplifier
+        return Simplifier(rules)(self, fired)
+    def canonical (self) :
+        from .canonical import canonical
+        return canonical(self)
+    def expand (self, params=None) :
+        from .family import expand
+        return expand(self, params)
+    def bind (self, **params) :
+        from .family import instantiate
+        return instantiate(self, params)
+    def _family (self, syntax, node) :
+        # families are expanded on the fly, one instance at a time
+        from .family import instances
+        sep = {"and" : "&&", "or" : "||"}[node.op]
+        todo = instances(node)
+        first = next(todo, None)
+        if first is None :
+            return str(node.op == "and").lower()
+        second = next(todo, None)
+        if second is None :
+            return first(syntax, first)
+        return sep.join("({})".format(inst(syntax, inst))
+                        for inst in itertools.chain([first, second], todo))
+    def rename (self, names) :
+        from .alpha import rename
+        return rename(self, names)
+    def alpha (self, prefix="_") :
+        from .alpha import alpha
+        return alpha(self, prefix)
+    def template_key (self, prefix="_") :
+        from .alpha import template_key
+        return template_key(self, prefix)
+    def nnf (self) :
+        from .nnf import nnf
+        return nnf(self)
+    def to_buchi (self) :
+        from .buchi import translate
+        return translate(self)
+    def share (self, min_size=2, prefix="_d") :
+        from .share import share
+        return share(self, min_size, prefix)
+    def rewrite (self, rules, strategy="bottomup", max_steps=None) :
+        if isinstance(rules, str) :
+            name, rules = rules, getattr(self, f"_rewrite_{rules}")
+            if rules is None :
+                raise ValueError(f"unknown rule set {name!r}")
+        return rules.rewrite(self, strategy, max_steps=max_steps)
+    def _violation (self, syntax, node, path=None) :
+        try :
+            handler, rules = self._dispatch[syntax][node.kind]
+        except KeyError :
+            handler, rules = self._compile(syntax, node.kind)
+        if handler is None :
+            return Violation(syntax, path, _accepted, node, {})
+        for rule in rules :
+            found = rule.test(node)
+            if found :
+                return Violation(syntax, path, rule, node,
+                                 found if isinstance(found, dict) else {})
+    def check (self, syntax) :
+        descend = self._descend.get(syntax, {})
+        stack = [((), self)]
+        while stack :
+            path, node = stack.pop()
+            violation = self._violation(syntax, node, path)
+            if violation is not None :
+                return violation
+            if node.kind == "family" :
+                # families are checked as their expansion
+                try :
+                    sub = [((), node.expand())]
+                except ValueError as err :
+                    return Violation(syntax, path, _expansion, node, {"error" : err})
+            elif node.kind in descend :
+                sub = descend[node.kind](node)
+            else :
+                sub = (((i,), child) for i, child in enumerate(node.children))
+            stack.extend((path + step, child) for step, child in reversed(list(sub)))
     ##
     ## CTL tree
     ##
@@ -55,6 +413,8 @@ class Phi (dict) :
                               **node)
     def _ctl_name (self, node) :
         return self.__class__(node.kind, **node)
+    def _ctl_family (self, node) :
+        return self("ctl", node.expand())
     def _ctl_bool (self, node) :
         return self.__class__(node.kind, **node)
     def _ctl_not (self, node) :
@@ -68,12 +428,6 @@ class Phi (dict) :
     def _ctl_iff (self, node) :
         return self._ctl(node)
     def __CTL_quantifier(self, node):
-        assert node.children[0].kind in "XFGURWM", f"{node.kind} must be followed by X, F, G, U, R, W, or M"
-        assert not node.actions, "actions not allowed"
-        assert (not node.ufair) and (not node.wfair) and (not node.sfair), "fairness not allowed"
-        assert not (node.children[0].actions or node.children[0].left_actions or node.children[0].right_actions), "actions not allowed"
-        for child in node.children[0].children :
-            assert child.kind not in "FGURXWM", f"cannot nest {child.kind} in {node.kind}{node.children[0].kind}"
         return self.__class__(node.kind + node.children[0].kind,
                               *(self("ctl", child)
                                 for child in node.children[0].children),
@@ -94,6 +448,8 @@ class Phi (dict) :
                               **node)
     def _arctl_name (self, node) :
         return self.__class__(node.kind, **node)
+    def _arctl_family (self, node) :
+        return self("arctl", node.expand())
     def _arctl_bool (self, node) :
         return self.__class__(node.kind, **node)
     def _arctl_not (self, node) :
@@ -107,10 +463,6 @@ class Phi (dict) :
     def _arctl_iff (self, node) :
         return self._arctl(node)
     def __arctl_quantifier(self, node):
-        assert node.children[0].kind in "XFGURWM", f"{node.kind} must be followed by X, F, G, U, R, W, or M"
-        assert not (node.children[0].actions or node.children[0].left_actions or node.children[0].right_actions), "actions not allowed on temporal operators"
-        for child in node.children[0].children :
-            assert child.kind not in "FGURXWM", f"cannot nest {child.kind} in {node.kind}{node.children[0].kind}"
         kwargs = dict()
         for key, value in node.items():
             if key in ("ufair", "wfair", "sfair"):
@@ -141,6 +493,8 @@ class Phi (dict) :
         return self("its_ctl", self) + ";"
     def _its_ctl_name (self, node) :
         return '"{}"'.format(node.value)
+    def _its_ctl_family (self, node) :
+        return self._family("its_ctl", node)
     def _its_ctl_bool (self, node) :
         return str(node.value).lower()
     def _its_ctl_not (self, node) :
@@ -158,36 +512,19 @@ class Phi (dict) :
         return "({})<->({})".format(self("its_ctl", node.children[0]),
                                     self("its_ctl", node.children[1]))
     def _its_ctl_A (self, node) :
-        assert node.children[0].kind in "XFGUE", "A must be followed by X, F, G, U, or R"
-        assert not node.actions, "actions not allowed"
-        assert (not node.ufair) and (not node.wfair) and (not node.sfair), "fairness not allowed"
         return "A" + self("its_ctl", node.children[0])
     def _its_ctl_E (self, node) :
-        assert node.children[0].kind in "XFGUE", "E must be followed by X, F, G, U, or R"
-        assert not node.actions, "actions not allowed"
-        assert (not node.ufair) and (not node.wfair) and (not node.sfair), "fairness not allowed"
         return "E" + self("its_ctl", node.children[0])
     def _its_ctl_X (self, node) :
-        assert not node.actions, "actions not allowed"
-        assert node.children[0].kind not in "FGURX", f"cannot nest {node.children[0].kind} in X"
         return "X({})".format(self("its_ctl", node.children[0]))
     def _its_ctl_F (self, node) :
-        assert not node.actions, "actions not allowed"
-        assert node.children[0].kind not in "FGURX", f"cannot nest {node.children[0].kind} in F"
         return "F({})".format(self("its_ctl", node.children[0]))
     def _its_ctl_G (self, node) :
-        assert not node.actions, "actions not allowed"
-        assert node.children[0].kind not in "FGURX", f"cannot nest {node.children[0].kind} in G"
         return "G({})".format(self("its_ctl", node.children[0]))
     def _its_ctl_U (self, node) :
-        assert not node.left_actions, "actions not allowed"
-        assert not node.right_actions, "actions not allowed"
-        assert node.children[0].kind not in "FGURX", f"cannot nest {node.children[0].kind} in U"
         return "(({})U({}))".format(self("its_ctl", node.children[0]),
                                     self("its_ctl", node.children[1]))
     def _its_ctl_R (self, node) :
-        assert not node.left_actions, "actions not allowed"
-        assert not node.right_actions, "actions not allowed"
         return "(({})R({}))".format(self("its_ctl", node.children[0]),
                                     self("its_ctl", node.children[1]))
     ##
@@ -199,6 +536,8 @@ class Phi (dict) :
         return self("its_ltl", self)
     def _its_ltl_name (self, node) :
         return '"{}"'.format(node.value)
+    def _its_ltl_family (self, node) :
+        return self._family("its_ltl", node)
     def _its_ttl_bool (self, node) :
         return str(node.value).lower()
     def _its_ltl_not (self, node) :
@@ -216,46 +555,62 @@ class Phi (dict) :
         return "({})<->({})".format(self("its_ltl", node.children[0]),
                                     self("its_ltl", node.children[1]))
     def _its_ltl_X (self, node) :
-        assert not node.actions, "actions not allowed"
         return "X" + self("its_ltl", node.children[0])
     def _its_ltl_F (self, node) :
-        assert not node.actions, "actions not allowed"
         return "F" + self("its_ltl", node.children[0])
     def _its_ltl_G (self, node) :
-        assert not node.actions, "actions not allowed"
         return "G" + self("its_ltl", node.children[0])
     def _its_ltl_U (self, node) :
-        assert not node.left_actions, "actions not allowed"
-        assert not node.right_actions, "actions not allowed"
         return "(({})U({}))".format(self("its_ltl", node.children[0]),
                                     self("its_ltl", node.children[1]))
     def _its_ltl_R (self, node) :
-        assert not node.left_actions, "actions not allowed"
-        assert not node.right_actions, "actions not allowed"
         return "(({})R({}))".format(self("its_ltl", node.children[0]),
                                     self("its_ltl", node.children[1]))
 
 @v_args(inline=True)
 class PhiTransformer (Transformer) :
     c = Phi
+    def __init__ (self, *largs, **kwargs) :
+        super().__init__(*largs, **kwargs)
+        self._global = None
+        self._fairness = 0
+        # name => stack of the formulas it is bound to
+        self._scope = {}
+        # whether a bound name has been used
+        self._shared = False
+        # indexes of the enclosing families
+        self._index = []
     def start (self, restr, main) :
-        if restr is not None :
-            for node in main :
-                if not isinstance(node, self.c) :
-                    continue
-                if node.kind in ("A", "E") :
-                    if restr.actions is not None :
-                        assert node.actions is None, "cannot propagate global action restriction to an already restricted modality"
-                        node["actions"] = restr.actions
-                    for fair in restr.fairness :
-                        getattr(node, fair.kind).append(fair)
+        self._global = None
+        self._fairness = 0
+        if self._shared :
+            main._shared = True
+        self._shared = False
         return main
+    def global_restrict (self, restr) :
+        # stored once and propagated to A/E nodes as they are built by mod
+        self._global = restr
+        return restr
+    def _propagate (self, node) :
+        restr = self._global
+        if restr.actions is not None :
+            assert node.actions is None, "cannot propagate global action restriction to an already restricted modality"
+            node["actions"] = restr.actions
+        for fair in restr.fairness :
+            getattr(node, fair.kind).append(fair)
     _not_atom = re.compile("^[AEXFGURWM]+$")
     def atom (self, token) :
         value = token.value
         if self._not_atom.match(value) :
             raise ValueError(f"variable {value} should be quoted")
-        if value == "True" :
+        if self._scope.get(value) :
+            # bound names are the same shared node at all their occurrences
+            self._shared = True
+            return self._scope[value][-1]
+        elif self._index and value.rpartition("_")[2] in self._index :
+            name, _, index = value.rpartition("_")
+            return self.c("iname", value=name, index=index)
+        elif value == "True" :
             return self.c("bool", value=True)
         elif value == "False" :
             return self.c("bool", value=False)
@@ -263,6 +618,37 @@ class PhiTransformer (Transformer) :
             return self.c("name", value=ast.literal_eval(value))
         else :
             return self.c("name", value=value)
+    def var (self, token) :
+        return self.c("var", value=token.value[1:])
+    def iatom (self, token) :
+        from .family import expr
+        pos = token.value.rindex("_{")
+        name, index = token.value[:pos], expr(token.value[pos+2:-1])
+        if isinstance(index, int) :
+            return self.c("name", value=f"{name}_{index}")
+        return self.c("iname", value=name, index=index)
+    def family_head (self, token) :
+        # reduced before the body of the family is parsed
+        from .family import header
+        op, index, low, high = head = header(token.value)
+        self._index.append(index)
+        return head
+    def family (self, head, body) :
+        op, index, low, high = head
+        self._index.pop()
+        return self.c("family", body, op=op, index=index, low=low, high=high)
+    def bind (self, name, form) :
+        # reduced before the body of let is parsed
+        value = name.value
+        if value in ("True", "False") or value[0] in ("'", '"') :
+            raise ValueError(f"cannot bind {value}")
+        self._scope.setdefault(value, []).append(form)
+        return value
+    def let (self, _, *items) :
+        *names, _, body = items
+        for name in names :
+            self._scope[name].pop()
+        return body
     def nop (self, child) :
         return child
     def not_op (self, phi) :
@@ -294,6 +680,10 @@ class PhiTransformer (Transformer) :
                 for fair in q.fairness :
                     assert quant[-1].kind in "EA", f"cannot have fairness on {quant[-1].kind}"
                     getattr(quant[-1], fair.kind).append(fair)
+        if self._global is not None and not self._fairness :
+            for q in quant :
+                if q.kind in ("A", "E") :
+                    self._propagate(q)
         for q in reversed(quant) :
             q.children = (form,)
             form = q
@@ -315,8 +705,13 @@ class PhiTransformer (Transformer) :
         else :
             assert False, "multiple action formulas not allowed"
         return form
+    def fair_open (self, fair) :
+        # global restrictions are not propagated within fairness constraints
+        self._fairness += 1
+        return fair
     def fair (self, *items) :
-        # fair : "[" FAIR (act | bool) [THEN (act | bool)] "]"  -> fair
+        # fair : fair_open (act | bool) [THEN (act | bool)] "]"  -> fair
+        self._fairness -= 1
         fair, *rest = items
         if rest[-1] is None :
             cond, then = None, rest[0]
@@ -331,8 +726,19 @@ class PhiTransformer (Transformer) :
                       condition=cond,
                       then=then)
 
-def parse (form, phiclass=Phi) :
+def parse (form, phiclass=Phi, defs=None) :
     class _Transformer (PhiTransformer) :
         c = phiclass
-    parser = Lark_StandAlone(transformer=_Transformer())
+    trans = _Transformer()
+    if defs :
+        trans._scope.update((name, [phi]) for name, phi in defs.items())
+    parser = Lark_StandAlone(transformer=trans)
     return parser.parse(form)
+
+def template (text, parser=parse) :
+    from .templates import Template
+    return Template(text, parser)
+
+def eval_traces (phi, traces, atoms=None) :
+    from .ltlf import eval_traces
+    return eval_traces(phi, traces, atoms)
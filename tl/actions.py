@@ -0,0 +1,98 @@
+"""Compilation of action formulas
+
+Action restrictions (attributes `actions`, `left_actions`, and
+`right_actions`, as well as the action-based fairness constraints) are
+Boolean formulas over action names. Given a fixed alphabet of actions, an
+`ActionCompiler` evaluates such formulas once into the set of actions they
+accept, represented either as a NumPy Boolean mask indexed like the alphabet
+(`mode="mask"`), or as an integer whose bit `i` is set iff the `i`-th action
+of the alphabet is accepted (`mode="bitset"`). Compiled formulas are
+memoized, so that repeated action formulas are compiled only once.
+`compile_actions` uses a cache of compilers that only keeps one
+representative for each distinct formula, not every formula passed to it.
+Names that are not in the alphabet are accepted by no action.
+"""
+
+import functools
+from .hashcons import HashCons
+
+class ActionCompiler (object) :
+    def __init__ (self, alphabet, mode="mask") :
+        if mode not in ("mask", "bitset") :
+            raise ValueError(f"unknown mode {mode!r}")
+        self.alphabet = tuple(alphabet)
+        self.index = {name : num for num, name in enumerate(self.alphabet)}
+        self.mode = mode
+        self.hc = HashCons()
+        self.cache = {}
+        if mode == "mask" :
+            import numpy
+            self.full = numpy.ones(len(self.alphabet), dtype=bool)
+            self.empty = numpy.zeros(len(self.alphabet), dtype=bool)
+            self.full.flags.writeable = self.empty.flags.writeable = False
+        else :
+            self.full = (1 << len(self.alphabet)) - 1
+            self.empty = 0
+    def _name (self, name) :
+        if name not in self.index :
+            return self.empty
+        elif self.mode == "bitset" :
+            return 1 << self.index[name]
+        mask = self.empty.copy()
+        mask[self.index[name]] = True
+        return mask
+    def _op (self, node, args) :
+        if node.kind == "name" :
+            return self._name(node.value)
+        elif node.kind == "bool" :
+            return self.full if node.value else self.empty
+        elif node.kind == "actions" :
+            return args[0]
+        elif node.kind == "not" :
+            return self.full ^ args[0]
+        elif node.kind == "and" :
+            return functools.reduce(lambda a, b : a & b, args)
+        elif node.kind == "or" :
+            return functools.reduce(lambda a, b : a | b, args)
+        elif node.kind == "imply" :
+            return (self.full ^ args[0]) | args[1]
+        elif node.kind == "iff" :
+            return functools.reduce(lambda a, b : self.full ^ (a ^ b), args)
+        raise ValueError(f"invalid action formula ({node.kind!r} not accepted)")
+    def __call__ (self, actions) :
+        hc, cache = self.hc, self.cache
+        ident = hc(actions)
+        if ident not in cache :
+            for node in actions._postorder() :
+                key = hc(node)
+                if key not in cache :
+                    cache[key] = self._op(node, [cache[hc(child)]
+                                                 for child in node.children])
+                    if self.mode == "mask" :
+                        # compiled masks are shared and must not be modified
+                        cache[key].flags.writeable = False
+        return cache[ident]
+    def edges (self, actions, labels) :
+        # labels is a NumPy array of action numbers, one for each edge
+        if self.mode == "mask" :
+            return self(actions)[labels]
+        return self._bits(self(actions))[labels]
+    def _bits (self, bitset) :
+        import numpy
+        size = len(self.alphabet)
+        raw = bitset.to_bytes((size + 7) // 8 or 1, "little")
+        bits = numpy.unpackbits(numpy.frombuffer(raw, dtype=numpy.uint8),
+                                bitorder="little")
+        return bits[:size].astype(bool)
+
+@functools.lru_cache(maxsize=32)
+def _compiler (alphabet, mode) :
+    return ActionCompiler(alphabet, mode)
+
+def compile_actions (actions, alphabet, mode="mask") :
+    # cached compilers live long, they only keep the distinct formulas
+    compiler = _compiler(tuple(alphabet), mode)
+    try :
+        return compiler(actions)
+    finally :
+        compiler.hc.forget(actions)
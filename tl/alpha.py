@@ -0,0 +1,88 @@
+"""Renaming of atoms
+
+`rename(phi, names)` returns `phi` in which every atom (`name` node) whose
+value is a key of `names` is replaced by an atom named after the
+corresponding value. Sub-formulas without renamed atoms are shared with
+`phi` instead of being copied.
+
+`alpha(phi, prefix)` renames the atoms of `phi` by order of first occurrence
+into `prefix0`, `prefix1`, etc., and returns the renamed formula together
+with the substitution that maps the new names back to the original ones.
+Occurrences are ordered by a preorder traversal in which the attributes of
+a node (in the alphabetical order of their names) are visited before its
+children, state atoms and action names are renamed alike. So, formulas that
+are equal up to a consistent renaming of their atoms, like
+`A G (req_1 => A F ack_1)` and `A G (req_2 => A F ack_2)`, have the same
+renamed form, and `template_key(phi)` returns its fingerprint along with
+the substitution, so that it may be used to key artifacts that depend only
+on the shape of a formula.
+"""
+
+from . import Phi
+
+def _items (value) :
+    if isinstance(value, Phi) :
+        return [value]
+    elif isinstance(value, list) :
+        return [v for v in value if isinstance(v, Phi)]
+    return []
+
+def _rebuild (node, done) :
+    changed = False
+    attr = {}
+    for key, value in node.items() :
+        if isinstance(value, Phi) :
+            attr[key] = done[id(value)]
+            changed = changed or attr[key] is not value
+        elif isinstance(value, list) :
+            attr[key] = [done[id(v)] if isinstance(v, Phi) else v
+                         for v in value]
+            changed = changed or any(new is not old for new, old
+                                     in zip(attr[key], value))
+        else :
+            attr[key] = value
+    children = [done[id(child)] for child in node.children]
+    if not changed and all(new is old for new, old
+                           in zip(children, node.children)) :
+        return node
+    return node.__class__(node.kind, *children, **attr)
+
+def rename (phi, names) :
+    done = {}
+    stack = [(phi, False)]
+    while stack :
+        node, ready = stack.pop()
+        if id(node) in done :
+            continue
+        elif node.kind == "name" :
+            if node.value in names :
+                done[id(node)] = node.__class__("name", value=names[node.value])
+            else :
+                done[id(node)] = node
+        elif ready :
+            done[id(node)] = _rebuild(node, done)
+        else :
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.children)
+            for value in node.values() :
+                stack.extend((sub, False) for sub in _items(value))
+    return done[id(phi)]
+
+def alpha (phi, prefix="_") :
+    names = {}
+    stack = [phi]
+    while stack :
+        node = stack.pop()
+        if node.kind == "name" :
+            if node.value not in names :
+                names[node.value] = f"{prefix}{len(names)}"
+            continue
+        # pushed in reverse order of visit
+        stack.extend(reversed(node.children))
+        for key in sorted(node.keys(), reverse=True) :
+            stack.extend(reversed(_items(node[key])))
+    return rename(phi, names), {new : old for old, new in names.items()}
+
+def template_key (phi, prefix="_") :
+    renamed, subst = alpha(phi, prefix)
+    return renamed.fingerprint(), subst
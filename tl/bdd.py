@@ -0,0 +1,501 @@
+"""Binary decision diagrams
+
+`BDD` is a manager of reduced ordered binary decision diagrams in plain
+Python. Nodes are integers (`0` and `1` being the terminals) whose level
+and children are stored in lists, and that are made unique by a table
+keyed by `(level, low, high)`, so that equivalent functions are the same
+node. The operations (`ite`, Boolean operators, existential
+quantification, the relational product `and_exist` that conjoins and
+quantifies in a single pass, and the renaming of variables) are memoized in
+a computed cache that is direct-mapped on a fixed number of slots: its
+memory is bounded since a new entry evicts the one that hashes to the same
+slot. The operations are recursive, but their depth is bounded by the
+number of variables.
+
+Users handle `Function` objects rather than nodes: they count the
+references to the nodes they hold, and support `&`, `|`, `^`, `~`, and `==`
+(equivalence, that is a comparison of nodes). When the unique table has
+grown beyond `threshold` nodes, the next operation starts by collecting
+garbage: the nodes reachable from referenced ones are marked, the others
+are freed to be reused, and the computed cache is cleared (`threshold` is
+doubled if most of the nodes are still alive).
+
+Variables are declared by name with `declare(*names)`, at the bottom of the
+current order. `reorder(order)` rebuilds all the live functions for a new
+order, and `hook`, if given, is called with the manager after each garbage
+collection so that it may decide to reorder the variables. `stats()`
+returns the node counts and the hit rate of the computed cache, to tune the
+order, the size of the cache, and the threshold.
+"""
+
+import weakref
+
+# level of the terminals, below every variable
+LEAF = 1 << 30
+
+class Function (object) :
+    __slots__ = ["bdd", "node", "__weakref__"]
+    def __init__ (self, bdd, node) :
+        self.bdd = bdd
+        self.node = node
+        bdd.refs[node] += 1
+        bdd.functions[id(self)] = self
+    def __del__ (self) :
+        self.bdd.refs[self.node] -= 1
+    def __and__ (self, other) :
+        return self.bdd.apply("and", self, other)
+    def __or__ (self, other) :
+        return self.bdd.apply("or", self, other)
+    def __xor__ (self, other) :
+        return self.bdd.apply("xor", self, other)
+    def __invert__ (self) :
+        return self.bdd.apply("not", self)
+    def __eq__ (self, other) :
+        return (isinstance(other, Function) and self.bdd is other.bdd
+                and self.node == other.node)
+    def __ne__ (self, other) :
+        return not self == other
+    def __hash__ (self) :
+        return hash(self.node)
+    def __len__ (self) :
+        return self.bdd.size(self)
+    def __repr__ (self) :
+        if self.node < 2 :
+            return f"<Function {bool(self.node)}>"
+        return f"<Function {self.node} ({len(self)} nodes)>"
+
+class BDD (object) :
+    def __init__ (self, names=(), cache=1<<16, threshold=1<<16, hook=None) :
+        if cache < 1 or cache & (cache - 1) :
+            raise ValueError("cache size must be a power of 2")
+        self.level = [LEAF, LEAF]
+        self.low = [0, 1]
+        self.high = [0, 1]
+        self.refs = [0, 0]
+        self.free = []
+        self.unique = {}
+        self.names = []
+        self.index = {}
+        self.mask = cache - 1
+        self.table = [None] * cache
+        self.hits = self.misses = 0
+        self.threshold = threshold
+        self.peak = 0
+        self.collections = 0
+        self.hook = hook
+        self.functions = weakref.WeakValueDictionary()
+        self.renamings = {}
+        self.maps = []
+        self.false = Function(self, 0)
+        self.true = Function(self, 1)
+        self.declare(*names)
+    def __len__ (self) :
+        return len(self.unique)
+    ##
+    ## variables
+    ##
+    def declare (self, *names) :
+        for name in names :
+            if name in self.index :
+                raise ValueError(f"variable {name!r} already declared")
+            self.index[name] = len(self.names)
+            self.names.append(name)
+    def _level (self, name) :
+        try :
+            return self.index[name]
+        except KeyError :
+            raise ValueError(f"unknown variable {name!r}")
+    def var (self, name) :
+        return Function(self, self._mk(self._level(name), 0, 1))
+    def cube (self, values) :
+        # conjunction of literals, values is either a dict that maps names
+        # to Booleans, or an iterable of names that are all true
+        if not isinstance(values, dict) :
+            values = dict.fromkeys(values, True)
+        node = 1
+        for level, value in sorted(((self._level(name), bool(value))
+                                    for name, value in values.items()),
+                                   reverse=True) :
+            node = self._mk(level, 0, node) if value else self._mk(level, node, 0)
+        return Function(self, node)
+    ##
+    ## nodes and computed cache
+    ##
+    def _mk (self, level, low, high) :
+        if low == high :
+            return low
+        key = (level, low, high)
+        node = self.unique.get(key)
+        if node is None :
+            if self.free :
+                node = self.free.pop()
+                self.level[node] = level
+                self.low[node] = low
+                self.high[node] = high
+            else :
+                node = len(self.level)
+                self.level.append(level)
+                self.low.append(low)
+                self.high.append(high)
+                self.refs.append(0)
+            self.unique[key] = node
+        return node
+    def _lookup (self, key) :
+        entry = self.table[hash(key) & self.mask]
+        if entry is not None and entry[0] == key :
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+    def _store (self, key, node) :
+        self.table[hash(key) & self.mask] = (key, node)
+        return node
+    def _split (self, node, level) :
+        if self.level[node] == level :
+            return self.low[node], self.high[node]
+        return node, node
+    ##
+    ## operations on nodes
+    ##
+    def _not (self, f) :
+        if f < 2 :
+            return 1 - f
+        key = ("not", f)
+        res = self._lookup(key)
+        if res is None :
+            res = self._store(key, self._mk(self.level[f], self._not(self.low[f]),
+                                            self._not(self.high[f])))
+        return res
+    def _and (self, f, g) :
+        if f == 0 or g == 0 :
+            return 0
+        elif f == 1 :
+            return g
+        elif g == 1 or f == g :
+            return f
+        elif f > g :
+            f, g = g, f
+        key = ("and", f, g)
+        res = self._lookup(key)
+        if res is None :
+            top = min(self.level[f], self.level[g])
+            f0, f1 = self._split(f, top)
+            g0, g1 = self._split(g, top)
+            res = self._store(key, self._mk(top, self._and(f0, g0), self._and(f1, g1)))
+        return res
+    def _or (self, f, g) :
+        if f == 1 or g == 1 :
+            return 1
+        elif f == 0 :
+            return g
+        elif g == 0 or f == g :
+            return f
+        elif f > g :
+            f, g = g, f
+        key = ("or", f, g)
+        res = self._lookup(key)
+        if res is None :
+            top = min(self.level[f], self.level[g])
+            f0, f1 = self._split(f, top)
+            g0, g1 = self._split(g, top)
+            res = self._store(key, self._mk(top, self._or(f0, g0), self._or(f1, g1)))
+        return res
+    def _xor (self, f, g) :
+        if f == g :
+            return 0
+        elif f == 0 :
+            return g
+        elif g == 0 :
+            return f
+        elif f == 1 :
+            return self._not(g)
+        elif g == 1 :
+            return self._not(f)
+        elif f > g :
+            f, g = g, f
+        key = ("xor", f, g)
+        res = self._lookup(key)
+        if res is None :
+            top = min(self.level[f], self.level[g])
+            f0, f1 = self._split(f, top)
+            g0, g1 = self._split(g, top)
+            res = self._store(key, self._mk(top, self._xor(f0, g0), self._xor(f1, g1)))
+        return res
+    def _ite (self, f, g, h) :
+        if f == 1 or g == h :
+            return g
+        elif f == 0 :
+            return h
+        elif g == 1 and h == 0 :
+            return f
+        elif g == 0 and h == 1 :
+            return self._not(f)
+        key = ("ite", f, g, h)
+        res = self._lookup(key)
+        if res is None :
+            top = min(self.level[f], self.level[g], self.level[h])
+            f0, f1 = self._split(f, top)
+            g0, g1 = self._split(g, top)
+            h0, h1 = self._split(h, top)
+            res = self._store(key, self._mk(top, self._ite(f0, g0, h0),
+                                            self._ite(f1, g1, h1)))
+        return res
+    def _exist (self, f, cube) :
+        if f < 2 :
+            return f
+        level = self.level[f]
+        while self.level[cube] < level :
+            cube = self.high[cube]
+        if cube == 1 :
+            return f
+        key = ("exist", f, cube)
+        res = self._lookup(key)
+        if res is None :
+            if self.level[cube] == level :
+                rest = self.high[cube]
+                res = self._exist(self.low[f], rest)
+                if res != 1 :
+                    res = self._or(res, self._exist(self.high[f], rest))
+            else :
+                res = self._mk(level, self._exist(self.low[f], cube),
+                               self._exist(self.high[f], cube))
+            self._store(key, res)
+        return res
+    def _and_exist (self, f, g, cube) :
+        # exists cube . f & g, without building f & g
+        if f == 0 or g == 0 :
+            return 0
+        elif f == 1 or f == g :
+            return self._exist(g, cube)
+        elif g == 1 :
+            return self._exist(f, cube)
+        elif f > g :
+            f, g = g, f
+        top = min(self.level[f], self.level[g])
+        while self.level[cube] < top :
+            cube = self.high[cube]
+        if cube == 1 :
+            return self._and(f, g)
+        key = ("and_exist", f, g, cube)
+        res = self._lookup(key)
+        if res is None :
+            f0, f1 = self._split(f, top)
+            g0, g1 = self._split(g, top)
+            if self.level[cube] == top :
+                rest = self.high[cube]
+                res = self._and_exist(f0, g0, rest)
+                if res != 1 :
+                    res = self._or(res, self._and_exist(f1, g1, rest))
+            else :
+                res = self._mk(top, self._and_exist(f0, g0, cube),
+                               self._and_exist(f1, g1, cube))
+            self._store(key, res)
+        return res
+    def _rename (self, f, num) :
+        if f < 2 :
+            return f
+        key = ("rename", f, num)
+        res = self._lookup(key)
+        if res is None :
+            level = self.maps[num].get(self.level[f], self.level[f])
+            low = self._rename(self.low[f], num)
+            high = self._rename(self.high[f], num)
+            if level < self.level[low] and level < self.level[high] :
+                res = self._mk(level, low, high)
+            else :
+                res = self._ite(self._mk(level, 0, 1), high, low)
+            self._store(key, res)
+        return res
+    ##
+    ## operations on functions
+    ##
+    def _node (self, f) :
+        if not isinstance(f, Function) or f.bdd is not self :
+            raise ValueError("not a function of this manager")
+        return f.node
+    def _cube (self, names) :
+        if isinstance(names, Function) :
+            return self._node(names)
+        return self.cube(names).node
+    def _result (self, node) :
+        if len(self.unique) > self.peak :
+            self.peak = len(self.unique)
+        return Function(self, node)
+    def _gc (self) :
+        if len(self.unique) >= self.threshold :
+            self.collect()
+    def apply (self, op, f, g=None) :
+        self._gc()
+        if op == "not" :
+            return self._result(self._not(self._node(f)))
+        elif op not in ("and", "or", "xor", "imply", "iff") :
+            raise ValueError(f"unknown operator {op!r}")
+        f, g = self._node(f), self._node(g)
+        if op == "imply" :
+            return self._result(self._or(self._not(f), g))
+        elif op == "iff" :
+            return self._result(self._not(self._xor(f, g)))
+        return self._result(getattr(self, f"_{op}")(f, g))
+    def ite (self, f, g, h) :
+        self._gc()
+        return self._result(self._ite(self._node(f), self._node(g), self._node(h)))
+    def exist (self, f, names) :
+        # names is an iterable of variables or their cube
+        self._gc()
+        return self._result(self._exist(self._node(f), self._cube(names)))
+    def forall (self, f, names) :
+        self._gc()
+        return self._result(self._not(self._exist(self._not(self._node(f)),
+                                                  self._cube(names))))
+    def and_exist (self, f, g, names) :
+        self._gc()
+        return self._result(self._and_exist(self._node(f), self._node(g),
+                                            self._cube(names)))
+    def rename (self, f, mapping) :
+        # mapping maps variables to variables
+        self._gc()
+        key = tuple(sorted((self._level(old), self._level(new))
+                           for old, new in mapping.items()))
+        if key not in self.renamings :
+            self.renamings[key] = len(self.maps)
+            self.maps.append(dict(key))
+        return self._result(self._rename(self._node(f), self.renamings[key]))
+    def let (self, f, values) :
+        # cofactor of f with respect to values (that maps names to Booleans)
+        cube = self.cube(values)
+        return self.and_exist(f, cube, list(values))
+    ##
+    ## queries
+    ##
+    def _reach (self, node) :
+        seen = {node}
+        stack = [node]
+        while stack :
+            node = stack.pop()
+            if node > 1 :
+                for child in (self.low[node], self.high[node]) :
+                    if child not in seen :
+                        seen.add(child)
+                        stack.append(child)
+        return seen
+    def size (self, f) :
+        return len(self._reach(self._node(f)))
+    def support (self, f) :
+        return {self.names[self.level[node]]
+                for node in self._reach(self._node(f)) if node > 1}
+    def count (self, f, names=None) :
+        # number of satisfying valuations of names (all the variables by
+        # default), f must not depend on other variables
+        top = len(self.names)
+        def level (node) :
+            return top if node < 2 else self.level[node]
+        root = self._node(f)
+        count = {0 : 0, 1 : 1}
+        stack = [root]
+        while stack :
+            node = stack[-1]
+            if node in count :
+                stack.pop()
+                continue
+            low, high = self.low[node], self.high[node]
+            if low in count and high in count :
+                stack.pop()
+                count[node] = ((count[low] << (level(low) - level(node) - 1))
+                               + (count[high] << (level(high) - level(node) - 1)))
+            else :
+                stack.extend(child for child in (low, high) if child not in count)
+        total = count[root] << level(root)
+        if names is not None :
+            total >>= top - len(set(names))
+        return total
+    def pick (self, f) :
+        # one satisfying valuation of the variables on a path to 1, or None
+        node = self._node(f)
+        if node == 0 :
+            return None
+        values = {}
+        while node > 1 :
+            name = self.names[self.level[node]]
+            if self.low[node] != 0 :
+                values[name] = False
+                node = self.low[node]
+            else :
+                values[name] = True
+                node = self.high[node]
+        return values
+    def stats (self) :
+        lookups = self.hits + self.misses
+        return {"nodes" : len(self.unique),
+                "peak" : max(self.peak, len(self.unique)),
+                "allocated" : len(self.level),
+                "free" : len(self.free),
+                "referenced" : sum(1 for r in self.refs if r > 0),
+                "variables" : len(self.names),
+                "cache" : len(self.table),
+                "hits" : self.hits,
+                "misses" : self.misses,
+                "hit rate" : self.hits / lookups if lookups else 0.0,
+                "collections" : self.collections,
+                "threshold" : self.threshold}
+    ##
+    ## garbage collection and reordering
+    ##
+    def _sweep (self) :
+        marked = bytearray(len(self.level))
+        marked[0] = marked[1] = 1
+        stack = [node for node, count in enumerate(self.refs) if count > 0]
+        while stack :
+            node = stack.pop()
+            if not marked[node] :
+                marked[node] = 1
+                stack.append(self.low[node])
+                stack.append(self.high[node])
+        self.unique = {key : node for key, node in self.unique.items()
+                       if marked[node]}
+        self.free = [node for node in range(len(marked) - 1, 1, -1)
+                     if not marked[node]]
+        self.table = [None] * len(self.table)
+    def collect (self) :
+        if len(self.unique) > self.peak :
+            self.peak = len(self.unique)
+        self._sweep()
+        self.collections += 1
+        if 2 * len(self.unique) > self.threshold :
+            self.threshold *= 2
+        if self.hook is not None :
+            self.hook(self)
+    def reorder (self, order) :
+        order = list(order)
+        if sorted(order) != sorted(self.names) :
+            raise ValueError("order must be a permutation of the variables")
+        names, level, low, high = self.names, self.level, self.low, self.high
+        live = list(self.functions.values())
+        self.names = order
+        self.index = {name : num for num, name in enumerate(order)}
+        self.level = [LEAF, LEAF]
+        self.low = [0, 1]
+        self.high = [0, 1]
+        self.refs = [0, 0]
+        self.free = []
+        self.unique = {}
+        self.table = [None] * len(self.table)
+        self.renamings = {}
+        self.maps = []
+        # rebuild every live node bottom-up with the new levels
+        new = {0 : 0, 1 : 1}
+        for func in live :
+            stack = [func.node]
+            while stack :
+                node = stack[-1]
+                if node in new :
+                    stack.pop()
+                elif low[node] in new and high[node] in new :
+                    stack.pop()
+                    var = self._mk(self.index[names[level[node]]], 0, 1)
+                    new[node] = self._ite(var, new[high[node]], new[low[node]])
+                else :
+                    stack.extend(child for child in (low[node], high[node])
+                                 if child not in new)
+        for func in live :
+            func.node = new[func.node]
+            self.refs[func.node] += 1
+        self._sweep()
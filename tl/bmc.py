@@ -0,0 +1,276 @@
+"""Bounded model-checking
+
+A `System(size, init, trans, atoms, aux=0)` is a transition system given
+as CNF clauses (lists of DIMACS literals): a state is a valuation of the
+variables `1..size`, `init` constrains the initial states over them,
+`trans` relates a state (variables `1..size`) to its successor (variables
+`size+1..2*size`) possibly using auxiliary variables
+(`2*size+1..2*size+aux`), and `atoms` maps every atom to a literal over
+the state variables. The transition relation is expected to be total.
+
+`Unrolling(phi, system, sink)` encodes the existence of a path of the
+system that satisfies the LTL formula `phi` as clauses that are sent to
+`sink.add(clause)` as soon as they are produced. Each call to `deepen()`
+extends the unrolling by one step, sending only the new clauses, and
+returns an activation literal under which the clauses correspond to the
+current bound `k`: a satisfying assignment that makes it true is a path of
+`k+1` states that satisfies `phi`, either because it has a loop (the last
+state leads back to an earlier one) or because its finite prefix is a
+witness (with the bounded semantics, that is without loop, formulas
+required after the last state do not hold). The encoding follows the
+linear and incremental encoding of Heljanko, Junttila, and Latvala: the
+formula is put in negation normal form and hash-consed (see
+`tl.buchi.Formulas`) and each sub-formula has one variable per step that is
+defined by clauses instantiated from a template that is computed once per
+sub-formula, loops are selected by variables `l_i` (the last state equals
+the one before step `i`), the step after the last one is related to the
+loop state under the activation literal of the bound, and eventualities
+are checked along the loop by auxiliary variables.
+
+`check(phi, system, bound)` searches bounds from `0` to `bound` with the
+SAT solver from `tl.sat` and returns the first `Path(states, loop)` found
+(`states` being tuples of Booleans and `loop` the position to which the last
+state loops back, or `None`), or `None` if there is no such path. If `phi`
+is of the form `E psi`, the path is a witness of `phi`, otherwise (`A psi`
+or an LTL formula without quantifiers) it is a counterexample. Nested path
+quantifiers are not supported. `write(phi, system, bound, stream)` streams
+the same encoding in the iCNF format (clauses followed by an assumption line
+for each bound) and `write_dimacs(phi, system, bound, path)` writes a plain
+DIMACS file for a single bound.
+"""
+
+import collections
+from . import parse, Phi
+from .monitor import TRUE, FALSE
+from .buchi import Formulas
+from .sat import Solver
+
+System = collections.namedtuple("System", ["size", "init", "trans", "atoms", "aux"],
+                                defaults=[0])
+
+Path = collections.namedtuple("Path", ["states", "loop"])
+
+class Unrolling (object) :
+    def __init__ (self, phi, system, sink) :
+        if isinstance(phi, str) :
+            phi = parse(phi)
+        self.system = system
+        self.sink = sink
+        self.formulas = f = Formulas(phi)
+        for name in f.atoms :
+            if name not in system.atoms :
+                raise ValueError(f"unknown atom {name!r}")
+        self.count = 0
+        # the closure of phi, with the formulas that are needed after the
+        # last step (in loops) and the eventualities
+        self.closure = []
+        seen = set()
+        stack = [f.initial]
+        while stack :
+            num = stack.pop()
+            if num in seen :
+                continue
+            seen.add(num)
+            self.closure.append(num)
+            node = f.nodes[num]
+            if node[0] in ("and", "or") :
+                stack.extend(node[1])
+            elif node[0] == "X" :
+                stack.append(node[1])
+            elif node[0] in ("U", "R") :
+                stack.extend(node[1:])
+        self.later = [num for num in self.closure
+                      if f.nodes[num][0] in ("U", "R")]
+        self.later.extend(f.nodes[num][1] for num in self.closure
+                          if f.nodes[num][0] == "X")
+        self.later = sorted(set(self.later) - {TRUE, FALSE})
+        self.until = [num for num in self.closure if f.nodes[num][0] == "U"]
+        self.templates = {}
+        self.vars = {}
+        self.states = []
+        self.k = -1
+        # constant false, the loop state, and the value of formulas in it
+        self.false = self._fresh()
+        self._add([-self.false])
+        self.loop = [self._fresh() for _ in range(system.size)]
+        self.at_loop = {num : self._fresh() for num in self.later}
+        # loop selectors l_i, whether step i is in the loop, and chains
+        self.select = [None]
+        self.inloop = [self.false]
+        self.chain = {num : [self.false] for num in self.later}
+        self.event = {num : [self.false] for num in self.until}
+    ##
+    ## variables and clauses
+    ##
+    def _fresh (self) :
+        self.count += 1
+        return self.count
+    def _add (self, clause) :
+        self.sink.add(clause)
+    def var (self, num, step) :
+        # the literal telling whether formula num holds at step
+        node = self.formulas.nodes[num]
+        if num == TRUE :
+            return -self.false
+        elif num == FALSE :
+            return self.false
+        elif node[0] == "lit" :
+            lit = self.system.atoms[self.formulas.atoms[node[1]]]
+            lit = self.state(step)[abs(lit) - 1] * (1 if lit > 0 else -1)
+            return lit if node[2] else -lit
+        elif (num, step) not in self.vars :
+            self.vars[num, step] = self._fresh()
+        return self.vars[num, step]
+    def template (self, num) :
+        # clauses defining formula num as lists of (sign, formula, offset)
+        if num not in self.templates :
+            node = self.formulas.nodes[num]
+            op = node[0]
+            this = (-1, num, 0)
+            if op == "and" :
+                clauses = [[this, (1, sub, 0)] for sub in node[1]]
+            elif op == "or" :
+                clauses = [[this] + [(1, sub, 0) for sub in node[1]]]
+            elif op == "X" :
+                clauses = [[this, (1, node[1], 1)]]
+            elif op == "U" :
+                # p U q => q | (p & X (p U q))
+                clauses = [[this, (1, node[2], 0), (1, node[1], 0)],
+                           [this, (1, node[2], 0), (1, num, 1)]]
+            elif op == "R" :
+                # p R q => q & (p | X (p R q))
+                clauses = [[this, (1, node[2], 0)],
+                           [this, (1, node[1], 0), (1, num, 1)]]
+            else :
+                clauses = []
+            self.templates[num] = clauses
+        return self.templates[num]
+    ##
+    ## unrolling
+    ##
+    def state (self, step) :
+        # the variables of a state, that may be needed one step ahead
+        while len(self.states) <= step :
+            self.states.append([self._fresh() for _ in range(self.system.size)])
+        return self.states[step]
+    def _step (self, step) :
+        size, aux = self.system.size, self.system.aux
+        if step == 0 :
+            state = self.state(0)
+            for clause in self.system.init :
+                self._add([state[abs(l) - 1] * (1 if l > 0 else -1) for l in clause])
+            self._add([self.var(self.formulas.initial, 0)])
+            return
+        prev, state = self.state(step - 1), self.state(step)
+        extra = [self._fresh() for _ in range(aux)]
+        def rename (lit) :
+            var = abs(lit)
+            if var <= size :
+                var = prev[var - 1]
+            elif var <= 2 * size :
+                var = state[var - size - 1]
+            else :
+                var = extra[var - 2 * size - 1]
+            return var if lit > 0 else -var
+        for clause in self.system.trans :
+            self._add([rename(lit) for lit in clause])
+        # l_i => prev == loop state, and in loop_i <=> in loop_i-1 | l_i
+        select, inloop, before = self._fresh(), self._fresh(), self.inloop[-1]
+        self.select.append(select)
+        self.inloop.append(inloop)
+        for var, loop in zip(prev, self.loop) :
+            self._add([-select, -var, loop])
+            self._add([-select, var, -loop])
+        self._add([-inloop, before, select])
+        self._add([inloop, -before])
+        self._add([inloop, -select])
+        self._add([-select, -before])
+    def deepen (self) :
+        self.k = step = self.k + 1
+        self._step(step)
+        for num in self.closure :
+            for clause in self.template(num) :
+                self._add([sign * self.var(sub, step + offset)
+                           for sign, sub, offset in clause])
+        if step :
+            # loop values of formulas and eventualities along the loop
+            for num in self.later :
+                chain, pick = self._fresh(), self._fresh()
+                self._add([-chain, self.chain[num][-1], pick])
+                self._add([-pick, self.select[step]])
+                self._add([-pick, self.var(num, step)])
+                self.chain[num].append(chain)
+            for num in self.until :
+                event, pick = self._fresh(), self._fresh()
+                self._add([-event, self.event[num][-1], pick])
+                self._add([-pick, self.inloop[step]])
+                self._add([-pick, self.var(self.formulas.nodes[num][2], step)])
+                self.event[num].append(event)
+        # the step after the last one is the loop state
+        act = self._fresh()
+        for var, loop in zip(self.state(step), self.loop) :
+            self._add([-act, -var, loop])
+            self._add([-act, var, -loop])
+        for num in self.later :
+            after = self.var(num, step + 1)
+            self._add([-act, -after, self.inloop[step]])
+            self._add([-act, -after, self.at_loop[num]])
+            self._add([-act, -self.at_loop[num], self.chain[num][step]])
+        for num in self.until :
+            self._add([-act, -self.var(num, step + 1), self.event[num][step]])
+        return act
+    def path (self, model) :
+        states = [tuple(model.get(var, False) for var in state)
+                  for state in self.states[:self.k + 1]]
+        for step, select in enumerate(self.select) :
+            if select is not None and model.get(select, False) :
+                return Path(states, step)
+        return Path(states, None)
+
+def _ltl (phi) :
+    # the LTL formula whose paths are searched for, and whether they are
+    # counterexamples
+    if isinstance(phi, str) :
+        phi = parse(phi)
+    if phi.kind == "E" :
+        return phi.children[0], False
+    elif phi.kind == "A" :
+        return Phi("not", phi.children[0]), True
+    return Phi("not", phi), True
+
+def check (phi, system, bound, solver=None) :
+    if solver is None :
+        solver = Solver()
+    unroll = Unrolling(_ltl(phi)[0], system, solver)
+    for _ in range(bound + 1) :
+        act = unroll.deepen()
+        if solver.solve([act]) :
+            return unroll.path(solver.model)
+
+class _Writer (object) :
+    def __init__ (self, stream) :
+        self.stream = stream
+        self.clauses = 0
+    def add (self, clause) :
+        self.stream.write(" ".join(map(str, clause)) + " 0\n")
+        self.clauses += 1
+
+def write (phi, system, bound, stream) :
+    stream.write("p inccnf\n")
+    writer = _Writer(stream)
+    unroll = Unrolling(_ltl(phi)[0], system, writer)
+    for _ in range(bound + 1) :
+        stream.write(f"a {unroll.deepen()} 0\n")
+
+def write_dimacs (phi, system, bound, path) :
+    # the header is rewritten at the end, once the counts are known
+    header = "p cnf {} {}"
+    with open(path, "w") as stream :
+        stream.write(" " * 40 + "\n")
+        writer = _Writer(stream)
+        unroll = Unrolling(_ltl(phi)[0], system, writer)
+        for _ in range(bound + 1) :
+            act = unroll.deepen()
+        writer.add([act])
+        stream.seek(0)
+        stream.write(header.format(unroll.count, writer.clauses).ljust(40))
@@ -0,0 +1,265 @@
+"""Büchi automata from LTL formulas
+
+`Tableau(phi)` is the on-the-fly tableau construction of an LTL formula
+(on infinite traces) into a generalized Büchi automaton with acceptance on
+transitions, in the style of GPVW and of its transition-based variant by
+Couvreur. Formulas are put in negation normal form and hash-consed as in
+`tl.monitor` (class `Obligations`), so that a state is the obligation that
+the rest of the trace has to satisfy, that is the conjunction of the
+formulas to be satisfied from the next position on, and two states are
+equal iff they are the same set of formulas. The expansion of each
+obligation into a disjunction of terms (literals that hold now, formulas
+for the next position, and `U` formulas whose right operand is postponed)
+is memoized, so that sub-formulas shared by states are expanded once.
+There is one acceptance set for every `p U q` sub-formula, that contains
+the transitions that do not postpone `q`. `successors(state)` computes the
+transitions of a state on demand, and `automaton()` explores all the states
+reachable from the initial one.
+
+A `Buchi` automaton has transitions `(pos, neg, target, acc)` where `pos`
+and `neg` are the bitmasks of the atoms that must be true and false, and
+`acc` the bitmask of the acceptance sets it belongs to. `degeneralize()`
+returns an equivalent automaton with a single set of accepting states
+(using a counter over the acceptance sets), and `hoa()` exports an
+automaton in the HOA format.
+"""
+
+from . import parse
+from .monitor import Obligations, TRUE, FALSE
+
+class Formulas (Obligations) :
+    def next (self, arg, strong=True) :
+        # on infinite traces, X is its own dual
+        if arg in (TRUE, FALSE) :
+            return arg
+        return self._node(("X", arg))
+    def _bool (self, op, args) :
+        flat = set()
+        for arg in args :
+            if self.nodes[arg][0] == op :
+                flat.update(self.nodes[arg][1])
+            else :
+                flat.add(arg)
+        # p R q implies q, and q implies p U q
+        kind = "R" if op == "and" else "U"
+        implied = {self.nodes[arg][2] for arg in flat if self.nodes[arg][0] == kind}
+        return Obligations._bool(self, op, flat - implied)
+    def conjuncts (self, num) :
+        if num == TRUE :
+            return frozenset()
+        elif self.nodes[num][0] == "and" :
+            return frozenset(self.nodes[num][1])
+        return frozenset([num])
+
+class Tableau (object) :
+    def __init__ (self, phi) :
+        if isinstance(phi, str) :
+            phi = parse(phi)
+        self.formulas = Formulas(phi)
+        self.atoms = self.formulas.atoms
+        self.initial = self.formulas.initial
+        # acceptance sets are the until sub-formulas
+        self.until = {}
+        nodes = self.formulas.nodes
+        seen = set()
+        stack = [self.initial]
+        while stack :
+            num = stack.pop()
+            if num in seen :
+                continue
+            seen.add(num)
+            node = nodes[num]
+            if node[0] in ("and", "or") :
+                stack.extend(node[1])
+            elif node[0] == "X" :
+                stack.append(node[1])
+            elif node[0] in ("U", "R") :
+                stack.extend(node[1:])
+                if node[0] == "U" :
+                    self.until[num] = len(self.until)
+        self.sets = len(self.until)
+        self.terms = {}
+        self.conj = {}
+        self.succ = {}
+    ##
+    ## terms (pos, neg, next, postponed) where next is the obligation for
+    ## the next position
+    ##
+    def _product (self, left, right) :
+        out = []
+        for pos, neg, nxt, post in left :
+            for p, n, x, u in right :
+                if (pos | p) & (neg | n) :
+                    continue
+                nx = self.conj.get((nxt, x))
+                if nx is None :
+                    nx = self.conj[nxt, x] = self.formulas.conj(nxt, x)
+                if nx != FALSE :
+                    out.append((pos | p, neg | n, nx, post | u))
+        return out
+    def _prune (self, terms) :
+        # remove duplicated terms and those that require more than another
+        terms = set(terms)
+        if len(terms) > 256 :
+            return list(terms)
+        conjuncts = self.formulas.conjuncts
+        kept = []
+        for pos, neg, nxt, post in sorted(terms, key=lambda t : (
+                bin(t[0]).count("1") + bin(t[1]).count("1")
+                + len(conjuncts(t[2])) + bin(t[3]).count("1"))) :
+            if not any(p & pos == p and n & neg == n and u & post == u
+                       and conjuncts(x) <= conjuncts(nxt)
+                       for p, n, x, u in kept) :
+                kept.append((pos, neg, nxt, post))
+        return kept
+    def expand (self, state) :
+        nodes = self.formulas.nodes
+        stack = [(state, False)]
+        while stack :
+            num, ready = stack.pop()
+            if num in self.terms :
+                continue
+            node = nodes[num]
+            op = node[0]
+            if op == "true" :
+                self.terms[num] = [(0, 0, TRUE, 0)]
+            elif op == "false" :
+                self.terms[num] = []
+            elif op == "lit" :
+                bit = 1 << node[1]
+                self.terms[num] = [(bit, 0, TRUE, 0) if node[2]
+                                   else (0, bit, TRUE, 0)]
+            elif op == "X" :
+                self.terms[num] = [(0, 0, node[1], 0)]
+            elif op not in ("and", "or", "U", "R") :
+                raise ValueError(f"unsupported obligation {op!r}")
+            elif not ready :
+                stack.append((num, True))
+                subs = node[1] if op in ("and", "or") else node[1:]
+                stack.extend((sub, False) for sub in subs if sub not in self.terms)
+            elif op == "and" :
+                terms = self.terms[node[1][0]]
+                for sub in node[1][1:] :
+                    terms = self._prune(self._product(terms, self.terms[sub]))
+                self.terms[num] = terms
+            elif op == "or" :
+                self.terms[num] = self._prune([t for sub in node[1]
+                                               for t in self.terms[sub]])
+            elif op == "U" :
+                # p U q = q | (p & X (p U q)), postponing q
+                wait = [(0, 0, num, 1 << self.until[num])]
+                self.terms[num] = self._prune(self.terms[node[2]]
+                                              + self._product(self.terms[node[1]], wait))
+            else :
+                # p R q = q & (p | X (p R q))
+                wait = [(0, 0, num, 0)]
+                self.terms[num] = self._prune(self._product(self.terms[node[2]],
+                                                            self.terms[node[1]] + wait))
+        return self.terms[state]
+    def successors (self, state) :
+        # transitions (pos, neg, target, acc) of a state
+        if state not in self.succ :
+            full = (1 << self.sets) - 1
+            self.succ[state] = [(pos, neg, nxt, full & ~post)
+                                for pos, neg, nxt, post in self.expand(state)]
+        return self.succ[state]
+    def automaton (self) :
+        number = {self.initial : 0}
+        order = [self.initial]
+        edges = []
+        while len(edges) < len(order) :
+            trans = []
+            for pos, neg, target, acc in self.successors(order[len(edges)]) :
+                if target not in number :
+                    number[target] = len(order)
+                    order.append(target)
+                trans.append((pos, neg, number[target], acc))
+            edges.append(trans)
+        return Buchi(self.atoms, edges, self.sets)
+
+class Buchi (object) :
+    def __init__ (self, atoms, edges, sets=0, initial=0, accepting=None) :
+        # accepting is None for acceptance on transitions, or the Boolean
+        # list telling which states are accepting
+        self.atoms = list(atoms)
+        self.edges = edges
+        self.sets = sets
+        self.initial = initial
+        self.accepting = accepting
+    def __len__ (self) :
+        return len(self.edges)
+    def degeneralize (self) :
+        if self.accepting is not None :
+            return self
+        sets = self.sets
+        # states (state, level) where level counts the acceptance sets
+        # visited in order, level == sets is accepting (and counts again)
+        start = (self.initial, sets)
+        number = {start : 0}
+        order = [start]
+        edges = []
+        while len(edges) < len(order) :
+            state, level = order[len(edges)]
+            if level == sets :
+                level = 0
+            trans = []
+            for pos, neg, target, acc in self.edges[state] :
+                up = level
+                while up < sets and acc >> up & 1 :
+                    up += 1
+                if (target, up) not in number :
+                    number[target, up] = len(order)
+                    order.append((target, up))
+                trans.append((pos, neg, number[target, up], 0))
+            edges.append(trans)
+        return self.__class__(self.atoms, edges, 1, 0,
+                              [level == sets for _, level in order])
+    ##
+    ## HOA export
+    ##
+    def _label (self, pos, neg) :
+        lits = []
+        for num in range(len(self.atoms)) :
+            if pos >> num & 1 :
+                lits.append(str(num))
+            elif neg >> num & 1 :
+                lits.append(f"!{num}")
+        return " & ".join(lits) or "t"
+    def hoa (self, name=None) :
+        def quote (text) :
+            return '"{}"'.format(text.replace("\\", "\\\\").replace('"', '\\"'))
+        lines = ["HOA: v1"]
+        if name is not None :
+            lines.append(f"name: {quote(name)}")
+        lines.extend([f"States: {len(self.edges)}",
+                      f"Start: {self.initial}",
+                      " ".join([f"AP: {len(self.atoms)}"]
+                               + [quote(a) for a in self.atoms])])
+        if self.accepting is not None :
+            lines.extend(["acc-name: Buchi", "Acceptance: 1 Inf(0)",
+                          "properties: trans-labels explicit-labels state-acc"])
+        elif self.sets :
+            lines.extend([f"acc-name: generalized-Buchi {self.sets}",
+                          "Acceptance: {} {}".format(self.sets, "&".join(
+                              f"Inf({num})" for num in range(self.sets))),
+                          "properties: trans-labels explicit-labels trans-acc"])
+        else :
+            lines.extend(["acc-name: all", "Acceptance: 0 t",
+                          "properties: trans-labels explicit-labels"])
+        lines.append("--BODY--")
+        for state, trans in enumerate(self.edges) :
+            if self.accepting is not None and self.accepting[state] :
+                lines.append(f"State: {state} {{0}}")
+            else :
+                lines.append(f"State: {state}")
+            for pos, neg, target, acc in trans :
+                sets = " ".join(str(n) for n in range(self.sets) if acc >> n & 1)
+                if self.accepting is None and sets :
+                    lines.append(f"[{self._label(pos, neg)}] {target} {{{sets}}}")
+                else :
+                    lines.append(f"[{self._label(pos, neg)}] {target}")
+        lines.append("--END--")
+        return "\n".join(lines) + "\n"
+
+def translate (phi) :
+    return Tableau(phi).automaton()
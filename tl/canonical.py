@@ -0,0 +1,81 @@
+"""Canonical form of formulas
+
+`canonical(phi)` returns a formula equivalent to `phi` in which:
+
+ - nested `and` (resp. `or`) are flattened, their operands are sorted by
+   fingerprint and duplicates are removed (a conjunction or disjunction
+   with a single operand is replaced by this operand)
+ - the two operands of binary equivalences are sorted by fingerprint
+ - lists of fairness constraints are sorted by fingerprint and duplicates
+   are removed
+ - attributes that are `None` or empty lists are removed
+ - action formulas and fairness conditions are themselves canonical
+
+So, formulas that differ only by the order or the grouping of operands of
+commutative and associative operators have the same canonical form and the
+same fingerprint. The canonical form is computed without recursion from
+the hash-consed form of `phi`, so that nothing is cached on the nodes of
+`phi` that may thus be modified afterwards, and the fingerprint is cached on
+each canonical node (canonical formulas must not be modified).
+"""
+
+from . import Phi, _subterms, _digest
+from .hashcons import HashCons
+
+def _frozen (node) :
+    # canonical nodes carry their fingerprint
+    return node.__dict__.get("_fingerprint") is not None
+
+def canonical (phi) :
+    if _frozen(phi) :
+        return phi
+    # the sub-formulas are identified by structure, structurally equal
+    # ones being canonicalized once, hash-consed nodes come bottom-up
+    hc = HashCons()
+    hc(phi)
+    canon = []
+    for node in hc.nodes :
+        canon.append(node if _frozen(node) else _canonical(node, canon, hc))
+    return canon[hc(phi)]
+
+def _canonical (node, canon, hc) :
+    attr = {}
+    for key, value in node.items() :
+        if isinstance(value, Phi) :
+            attr[key] = canon[hc(value)]
+        elif isinstance(value, (list, tuple)) :
+            if value :
+                attr[key] = _sort([canon[hc(v)] if isinstance(v, Phi) else v
+                                   for v in value])
+        elif value is not None :
+            attr[key] = value
+    children = [canon[hc(child)] for child in node.children]
+    if node.kind in ("and", "or") :
+        flat = []
+        for child in children :
+            if child.kind == node.kind :
+                flat.extend(child.children)
+            else :
+                flat.append(child)
+        children = _sort(flat)
+    elif node.kind == "iff" and len(children) == 2 :
+        children = _sort(children, False)
+    if node.kind in ("and", "or") and len(children) == 1 :
+        return children[0]
+    new = node.__class__(node.kind, *children, **attr)
+    digests = {id(sub) : sub._fingerprint for sub in _subterms(new)}
+    new._fingerprint = _digest(new, digests)
+    return new
+
+def _sort (items, unique=True) :
+    if not all(isinstance(item, Phi) for item in items) :
+        return items
+    keyed = {} if unique else []
+    for item in items :
+        if unique :
+            keyed.setdefault(item._fingerprint, item)
+        else :
+            keyed.append((item._fingerprint, item))
+    if unique :
+        keyed = keyed.items()
+    return [item for _, item in sorted(keyed, key=lambda pair : pair[0])]
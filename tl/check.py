@@ -0,0 +1,354 @@
+"""Explicit-state CTL model-checking
+
+A `Kripke` structure has states numbered from `0` to `size-1`, its
+successor relation is given in compressed sparse row (CSR) format: the
+successors of state `s` are `indices[indptr[s]:indptr[s+1]]`, and each atom
+is labelled by a Boolean array indexed by the states. A `Checker` evaluates
+the formulas returned by `Phi.ctl()` on such a structure: the satisfaction
+set of every sub-formula is computed once as a Boolean NumPy array, and
+memoized (through hash-consing) across all the formulas checked by the
+same `Checker`.
+
+All the operators are reduced to `EX`, `EU`, and `EG` that are computed by
+vectorized pre-images: `EX` counts the successors in a set, `EU` is a
+backward breadth-first search from its right operand, and `EG` removes
+states from its operand layer after layer as they lose their last
+successor within the set. So, there is one NumPy operation per layer of
+search but never a Python loop over states. Like for usual Kripke
+structures, the successor relation is expected to be total: a state without
+successors satisfies no `EX` (and thus every `AX`) and no `EG`.
+
+An `LTS` is a `Kripke` structure built from arrays of edges (source,
+target, and action number in an alphabet). On such structures, a `Checker`
+also evaluates the formulas returned by `Phi.arctl()`: the action formula
+of a node is compiled into a mask of the edges it accepts (using
+`tl.actions.ActionCompiler`), that is computed once for all the nodes that
+share the same action formula, and the pre-images are restricted to these
+edges.
+"""
+
+import numpy
+from . import parse
+from .hashcons import HashCons
+from .actions import ActionCompiler
+from .scc import tarjan
+
+def _edges (indptr, states) :
+    # numbers of the edges outgoing from states
+    starts = indptr[states]
+    lens = indptr[states + 1] - starts
+    total = int(lens.sum())
+    if not total :
+        return numpy.zeros(0, dtype=numpy.int64)
+    shift = numpy.repeat(starts - numpy.cumsum(lens) + lens, lens)
+    return shift + numpy.arange(total, dtype=numpy.int64)
+
+def _unique (states, counts=False) :
+    # sorting is faster than numpy.unique on large arrays of states
+    states = numpy.sort(states)
+    first = numpy.flatnonzero(numpy.concatenate(([states.size > 0],
+                                                 states[1:] != states[:-1])))
+    if counts :
+        return states[first], numpy.diff(numpy.append(first, len(states)))
+    return states[first]
+
+class Kripke (object) :
+    def __init__ (self, indptr, indices, labels, initial=None) :
+        self.indptr = numpy.asarray(indptr, dtype=numpy.int64)
+        self.indices = numpy.asarray(indices, dtype=numpy.int64)
+        self.size = size = len(self.indptr) - 1
+        if size < 0 or self.indptr[0] != 0 or self.indptr[-1] != len(self.indices) :
+            raise ValueError("invalid CSR successor arrays")
+        elif len(self.indices) and (self.indices.min() < 0
+                                    or self.indices.max() >= size) :
+            raise ValueError("successor out of range")
+        self.labels = {}
+        for name, value in labels.items() :
+            # copied, so that the caller's arrays are neither aliased nor
+            # frozen when they are cached as satisfaction sets
+            value = numpy.array(value, dtype=bool)
+            if value.shape != (size,) :
+                raise ValueError(f"invalid labelling for atom {name!r}")
+            self.labels[name] = value
+        if initial is None :
+            initial = [0]
+        self.initial = numpy.asarray(initial, dtype=numpy.int64)
+        self.outdeg = numpy.diff(self.indptr)
+        # source of each edge
+        self.src = numpy.repeat(numpy.arange(size, dtype=numpy.int64), self.outdeg)
+        # predecessors in CSR format, rorder gives the edge numbers
+        self.rorder = numpy.argsort(self.indices, kind="stable")
+        self.rindices = self.src[self.rorder]
+        self.rindptr = numpy.zeros(size + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(self.indices, minlength=size),
+                     out=self.rindptr[1:])
+    def __len__ (self) :
+        return self.size
+    def pre (self, states) :
+        # predecessors of states (as an array of state numbers) with the
+        # numbers of the corresponding edges
+        edges = self.rorder[_edges(self.rindptr, states)]
+        return self.src[edges], edges
+
+class LTS (Kripke) :
+    def __init__ (self, src, dst, actions, alphabet, labels, size=None,
+                  initial=None) :
+        src = numpy.asarray(src, dtype=numpy.int64)
+        dst = numpy.asarray(dst, dtype=numpy.int64)
+        actions = numpy.asarray(actions, dtype=numpy.int64)
+        if not (src.shape == dst.shape == actions.shape) :
+            raise ValueError("edge arrays have distinct lengths")
+        elif len(actions) and (actions.min() < 0 or actions.max() >= len(alphabet)) :
+            raise ValueError("action out of range")
+        if size is None :
+            size = int(max(src.max(initial=-1), dst.max(initial=-1))) + 1
+        elif len(src) and src.max() >= size :
+            raise ValueError("source out of range")
+        order = numpy.argsort(src, kind="stable")
+        indptr = numpy.zeros(size + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(src, minlength=size), out=indptr[1:])
+        super().__init__(indptr, dst[order], labels, initial)
+        # action of each edge, in CSR order
+        self.actions = actions[order]
+        self.alphabet = tuple(alphabet)
+
+class Checker (object) :
+    def __init__ (self, kripke) :
+        self.kripke = kripke
+        self.hc = HashCons()
+        self.cache = {}
+        self.true = numpy.ones(kripke.size, dtype=bool)
+        self.false = numpy.zeros(kripke.size, dtype=bool)
+        self.true.flags.writeable = self.false.flags.writeable = False
+        if isinstance(kripke, LTS) :
+            self.compiler = ActionCompiler(kripke.alphabet)
+        else :
+            self.compiler = None
+        self.masks = {}
+        self.constraints = {}
+        self.fair = {}
+    def __call__ (self, phi) :
+        hc, cache = self.hc, self.cache
+        ident = hc(phi)
+        if ident not in cache :
+            for node in phi._postorder() :
+                key = hc(node)
+                if key not in cache :
+                    cache[key] = self._sat(node, [cache[hc(child)]
+                                                  for child in node.children])
+                    # satisfaction sets are shared and must not be modified
+                    cache[key].flags.writeable = False
+        return cache[ident]
+    def _sat (self, node, args) :
+        handler = getattr(self, f"_sat_{node.kind}", None)
+        if handler is None :
+            raise ValueError(f"cannot check {node.kind!r}")
+        return handler(node, *args)
+    def edges (self, actions) :
+        # mask of the edges accepted by action formula actions
+        if actions is None :
+            return None
+        elif self.compiler is None :
+            raise ValueError("actions require an LTS")
+        key = self.compiler.hc(actions)
+        if key not in self.masks :
+            self.masks[key] = mask = self.compiler.edges(actions,
+                                                         self.kripke.actions)
+            mask.flags.writeable = False
+        return self.masks[key]
+    def fairness (self, node) :
+        # key of the fairness constraints of node, that are compiled into
+        # triples (kind, condition, then) where conditions are pairs
+        # (states, edges) with one of them set to None
+        fair = [(kind, f) for kind in ("ufair", "wfair", "sfair")
+                for f in node.get(kind) or ()]
+        if not fair :
+            return None
+        key = tuple(sorted({(kind, self.hc(f)) for kind, f in fair}))
+        if key not in self.constraints :
+            self.constraints[key] = [(kind, self._condition(f.condition),
+                                      self._condition(f.then))
+                                     for kind, f in fair]
+        return key
+    def _condition (self, phi) :
+        if phi is None :
+            return None
+        elif phi.kind == "actions" :
+            return None, self.edges(phi)
+        return self(phi), None
+    ##
+    ## primitives
+    ##
+    def ex (self, sat, edges=None) :
+        k = self.kripke
+        ok = sat[k.indices]
+        if edges is not None :
+            ok &= edges
+        return numpy.bincount(k.src[ok], minlength=k.size) > 0
+    def eu (self, left, right, edges=None) :
+        reach = right.copy()
+        frontier = numpy.flatnonzero(right)
+        while frontier.size :
+            pred, num = self.kripke.pre(frontier)
+            if edges is not None :
+                pred = pred[edges[num]]
+            pred = pred[left[pred] & ~reach[pred]]
+            frontier = _unique(pred)
+            reach[frontier] = True
+        return reach
+    def eg (self, sat, edges=None) :
+        k = self.kripke
+        keep = sat.copy()
+        ok = keep[k.indices]
+        if edges is not None :
+            ok &= edges
+        count = numpy.bincount(k.src[ok], minlength=k.size)
+        drop = numpy.flatnonzero(keep & (count == 0))
+        while drop.size :
+            keep[drop] = False
+            pred, num = k.pre(drop)
+            if edges is not None :
+                pred = pred[edges[num]]
+            pred, num = _unique(pred[keep[pred]], True)
+            count[pred] -= num
+            drop = pred[count[pred] == 0]
+        return keep
+    def fair_eg (self, sat, edges, constraints) :
+        # states from which a fair SCC can be reached within sat, fair SCCs
+        # are searched in the sub-graph of sat, and refined when a strong
+        # fairness constraint is violated by removing its condition
+        k = self.kripke
+        ok = sat[k.src] & sat[k.indices]
+        if edges is not None :
+            ok &= edges
+        fair = numpy.zeros(k.size, dtype=bool)
+        todo = [numpy.flatnonzero(ok)]
+        while todo :
+            sub = todo.pop()
+            indptr = numpy.zeros(k.size + 1, dtype=numpy.int64)
+            numpy.cumsum(numpy.bincount(k.src[sub], minlength=k.size),
+                         out=indptr[1:])
+            comp = tarjan(indptr, k.indices[sub], _unique(k.src[sub]))
+            internal = sub[comp[k.src[sub]] == comp[k.indices[sub]]]
+            if not internal.size :
+                continue
+            owner = comp[k.src[internal]]
+            count = int(owner.max()) + 1
+            def hits (cond) :
+                states, marks = cond
+                if states is not None :
+                    sel = states[k.src[internal]]
+                else :
+                    sel = marks[internal]
+                return numpy.bincount(owner[sel], minlength=count) > 0
+            good = numpy.ones(count, dtype=bool)
+            retry = numpy.zeros(count, dtype=bool)
+            drop = numpy.zeros(len(internal), dtype=bool)
+            for kind, cond, then in constraints :
+                if kind == "ufair" :
+                    good &= hits(then)
+                elif kind == "wfair" :
+                    states, marks = cond
+                    good &= hits((None if states is None else ~states,
+                                  None if marks is None else ~marks)) | hits(then)
+                else :
+                    bad = hits(cond) & ~hits(then)
+                    retry |= bad
+                    states, marks = cond
+                    if states is not None :
+                        touch = states[k.src[internal]] | states[k.indices[internal]]
+                    else :
+                        touch = marks[internal]
+                    drop |= bad[owner] & touch
+            fair[k.src[internal[(good & ~retry)[owner]]]] = True
+            again = internal[(good & retry)[owner] & ~drop]
+            if again.size :
+                todo.append(again)
+        return self.eu(sat, fair, edges)
+    def _eg_fair (self, key, actions, sat) :
+        # memoized for all the nodes with the same fairness and actions
+        akey = None if actions is None else self.compiler.hc(actions)
+        mkey = (key, akey, numpy.packbits(sat).tobytes())
+        if mkey not in self.fair :
+            self.fair[mkey] = self.fair_eg(sat, self.edges(actions),
+                                           self.constraints[key])
+        return self.fair[mkey]
+    def _ex (self, node, sat) :
+        key = self.fairness(node)
+        if key is not None :
+            sat = sat & self._eg_fair(key, node.actions, self.true)
+        return self.ex(sat, self.edges(node.actions))
+    def _eu (self, node, left, right) :
+        key = self.fairness(node)
+        if key is not None :
+            right = right & self._eg_fair(key, node.actions, self.true)
+        return self.eu(left, right, self.edges(node.actions))
+    def _eg (self, node, sat) :
+        key = self.fairness(node)
+        if key is not None :
+            return self._eg_fair(key, node.actions, sat)
+        return self.eg(sat, self.edges(node.actions))
+    ##
+    ## state formulas
+    ##
+    def _sat_name (self, node) :
+        try :
+            return self.kripke.labels[node.value]
+        except KeyError :
+            raise ValueError(f"unknown atom {node.value!r}")
+    def _sat_bool (self, node) :
+        return self.true if node.value else self.false
+    def _sat_not (self, node, sat) :
+        return ~sat
+    def _sat_and (self, node, *sats) :
+        return numpy.logical_and.reduce(sats)
+    def _sat_or (self, node, *sats) :
+        return numpy.logical_or.reduce(sats)
+    def _sat_imply (self, node, left, right) :
+        return ~left | right
+    def _sat_iff (self, node, first, *rest) :
+        for sat in rest :
+            first = first == sat
+        return first
+    ##
+    ## temporal formulas
+    ##
+    def _sat_EX (self, node, sat) :
+        return self._ex(node, sat)
+    def _sat_AX (self, node, sat) :
+        return ~self._ex(node, ~sat)
+    def _sat_EF (self, node, sat) :
+        return self._eu(node, self.true, sat)
+    def _sat_AF (self, node, sat) :
+        return ~self._eg(node, ~sat)
+    def _sat_EG (self, node, sat) :
+        return self._eg(node, sat)
+    def _sat_AG (self, node, sat) :
+        return ~self._eu(node, self.true, ~sat)
+    def _sat_EU (self, node, left, right) :
+        return self._eu(node, left, right)
+    def _sat_AU (self, node, left, right) :
+        return ~(self._eu(node, ~right, ~left & ~right) | self._eg(node, ~right))
+    def _sat_ER (self, node, left, right) :
+        # p R q = ~(~p U ~q)
+        return ~self._sat_AU(node, ~left, ~right)
+    def _sat_AR (self, node, left, right) :
+        return ~self._eu(node, ~left, ~right)
+    def _sat_EW (self, node, left, right) :
+        # p W q = (p U q) | G p
+        return self._eu(node, left, right) | self._eg(node, left)
+    def _sat_AW (self, node, left, right) :
+        return ~self._eu(node, ~right, ~left & ~right)
+    def _sat_EM (self, node, left, right) :
+        # p M q = q U (p & q)
+        return self._eu(node, right, left & right)
+    def _sat_AM (self, node, left, right) :
+        return self._sat_AU(node, right, left & right)
+
+def check (phi, kripke, syntax="ctl") :
+    if syntax not in ("ctl", "arctl") :
+        raise ValueError(f"unsupported syntax {syntax!r}")
+    elif isinstance(phi, str) :
+        phi = parse(phi)
+    sat = Checker(kripke)(getattr(phi, syntax)())
+    return bool(sat[kripke.initial].all())
@@ -0,0 +1,252 @@
+"""Deterministic finite automata from LTL formulas on finite traces
+
+`build(phi)` compiles an LTL formula into a `DFA` that accepts exactly the
+non-empty finite traces that satisfy `phi` (with the semantics of
+`tl.eval_traces`). Its states are the obligations reached by formula
+progression (see `tl.monitor`) from the initial one, each obligation being
+progressed only on the valuations of the atoms it actually reads, and its
+transitions are stored as a dense table indexed by states and valuations
+(an int whose bit `i` is the value of atom `atoms[i]`), so that a step is a
+single look-up. `minimize(dfa)` merges the equivalent states using
+Hopcroft's algorithm on the alphabet in which valuations that lead every
+state to the same target are a single letter, and `DFA.guards(state)`
+gives the transitions of a state as cubes over the atoms, computed by
+Shannon decomposition of its row.
+
+Exploration stops with a `ValueError` when more than `limit` states
+(`LIMIT` by default) have been reached.
+
+`compile_dfa(phi, cache)` does both, and may store the automata in an on-disk
+`AutomatonCache` keyed by the fingerprint of the canonical template of
+`phi` (see `tl.alpha`): the formulas that have the same shape up to a
+renaming of their atoms, like `G (req_1 => F ack_1)` and
+`G (req_2 => F ack_2)`, share the same automaton that is only renamed.
+"""
+
+import json, sqlite3
+import numpy
+from . import parse
+from .alpha import alpha
+from .monitor import Progression, DENSE
+
+LIMIT = 1 << 16
+
+class DFA (object) :
+    def __init__ (self, atoms, table, accepting, initial=0) :
+        self.atoms = list(atoms)
+        self.index = {name : num for num, name in enumerate(self.atoms)}
+        self.table = numpy.asarray(table, dtype=numpy.int32)
+        self.accepting = numpy.asarray(accepting, dtype=bool)
+        self.initial = initial
+        if self.table.shape != (len(self.accepting), 1 << len(self.atoms)) :
+            raise ValueError("table does not match states and atoms")
+    def __len__ (self) :
+        return len(self.table)
+    def rename (self, names) :
+        return self.__class__([names.get(a, a) for a in self.atoms],
+                              self.table, self.accepting, self.initial)
+    ##
+    ## running
+    ##
+    def code (self, event) :
+        # valuation of the atoms as an int, from a dict or a set of atoms
+        if isinstance(event, dict) :
+            event = (name for name, value in event.items() if value)
+        return sum(1 << self.index[name] for name in set(event)
+                   if name in self.index)
+    def step (self, state, event) :
+        return int(self.table[state, self.code(event)])
+    def run (self, events) :
+        state = self.initial
+        for event in events :
+            state = self.table[state, self.code(event)]
+        return bool(self.accepting[state])
+    def run_many (self, traces, atoms=None) :
+        # traces is an array (trace x time x atom) of Booleans
+        traces = numpy.asarray(traces, dtype=bool)
+        if atoms is None :
+            atoms = self.atoms
+        elif traces.shape[-1] != len(atoms) :
+            raise ValueError("last axis of traces does not match atoms")
+        weights = numpy.array([1 << self.index[name] if name in self.index else 0
+                               for name in atoms], dtype=numpy.int64)
+        codes = traces.astype(numpy.int64) @ weights
+        states = numpy.full(codes.shape[:-1], self.initial, dtype=numpy.int32)
+        for step in range(codes.shape[-1]) :
+            states = self.table[states, codes[..., step]]
+        return self.accepting[states]
+    ##
+    ## guards
+    ##
+    def guards (self, state) :
+        # cubes (mask, value) grouped by target, valuation code matches a
+        # cube if code & mask == value
+        out = {}
+        stack = [(self.table[state], len(self.atoms) - 1, 0, 0)]
+        while stack :
+            row, bit, mask, value = stack.pop()
+            if (row == row[0]).all() :
+                out.setdefault(int(row[0]), []).append((mask, value))
+                continue
+            half = len(row) // 2
+            low, high = row[:half], row[half:]
+            if (low == high).all() :
+                stack.append((low, bit - 1, mask, value))
+            else :
+                stack.append((high, bit - 1, mask | 1 << bit, value | 1 << bit))
+                stack.append((low, bit - 1, mask | 1 << bit, value))
+        return out
+    def cube (self, mask, value) :
+        # a cube as a conjunction of literals in the syntax of formulas
+        lits = [name if value >> num & 1 else f"~{name}"
+                for num, name in enumerate(self.atoms) if mask >> num & 1]
+        return " & ".join(lits) or "True"
+    ##
+    ## serialization
+    ##
+    def dumps (self) :
+        return json.dumps({"atoms" : self.atoms,
+                           "initial" : int(self.initial),
+                           "accepting" : self.accepting.astype(int).tolist(),
+                           "table" : self.table.tolist()})
+    @classmethod
+    def loads (cls, data) :
+        data = json.loads(data)
+        return cls(data["atoms"], numpy.array(data["table"], dtype=numpy.int32)
+                   .reshape(len(data["accepting"]), 1 << len(data["atoms"])),
+                   data["accepting"], data["initial"])
+
+def build (phi, limit=LIMIT) :
+    if isinstance(phi, str) :
+        phi = parse(phi)
+    prog = Progression(phi)
+    width = len(prog.atoms)
+    if width > DENSE :
+        raise ValueError(f"too many atoms ({width} > {DENSE})")
+    codes = numpy.arange(1 << width, dtype=numpy.int64)
+    # state 0 is the initial obligation, that is not accepting since the
+    # empty trace is rejected, it is distinct from the other states so
+    # that the initial obligation may also be reached as usual
+    number = {}
+    obligations = [prog.initial]
+    accepting = [False]
+    rows = []
+    while len(rows) < len(obligations) :
+        state = obligations[len(rows)]
+        support = [bit for bit in range(width) if prog.support(state) >> bit & 1]
+        # the valuations of the support, and the position of every
+        # valuation of all the atoms among them
+        index = numpy.zeros(len(codes), dtype=numpy.int64)
+        for pos, bit in enumerate(support) :
+            index |= (codes >> bit & 1) << pos
+        targets = []
+        for sub in range(1 << len(support)) :
+            code = sum(1 << bit for pos, bit in enumerate(support) if sub >> pos & 1)
+            target = prog.progress(state, code)
+            if target not in number :
+                if len(obligations) >= limit :
+                    raise ValueError(f"too many states (more than {limit})")
+                number[target] = len(obligations)
+                obligations.append(target)
+                accepting.append(prog.final[target])
+            targets.append(number[target])
+        rows.append(numpy.array(targets, dtype=numpy.int32)[index])
+    return DFA(prog.atoms, numpy.array(rows, dtype=numpy.int32), accepting)
+
+def minimize (dfa) :
+    size = len(dfa)
+    # valuations that lead every state to the same target are one letter
+    letters = numpy.unique(dfa.table, axis=1)
+    # predecessors through each letter, in CSR format
+    preds = []
+    for col in letters.T :
+        order = numpy.argsort(col, kind="stable")
+        indptr = numpy.searchsorted(col[order], numpy.arange(size + 1))
+        preds.append((indptr.tolist(), order.tolist()))
+    block = dfa.accepting.astype(numpy.int64).tolist()
+    members = [set(), set()]
+    for state, num in enumerate(block) :
+        members[num].add(state)
+    if not members[0] :
+        members.pop(0)
+        block = [0] * size
+    elif not members[1] :
+        members.pop()
+    work = {(num, letter) for num in range(len(members))
+            for letter in range(len(preds))}
+    while work :
+        splitter, letter = work.pop()
+        indptr, order = preds[letter]
+        found = set()
+        for state in members[splitter] :
+            found.update(order[indptr[state]:indptr[state + 1]])
+        touched = {}
+        for state in found :
+            touched.setdefault(block[state], set()).add(state)
+        for num, inside in touched.items() :
+            if len(inside) == len(members[num]) :
+                continue
+            outside = members[num] - inside
+            # the smaller part gets a new block
+            small, large = sorted((inside, outside), key=len)
+            members[num] = large
+            new = len(members)
+            members.append(small)
+            for state in small :
+                block[state] = new
+            # whether (num, other) is pending or not, the new block is
+            # the smaller part and is enough as a splitter
+            work.update((new, other) for other in range(len(preds)))
+    # renumber blocks in the order of their first state
+    block = numpy.array(block, dtype=numpy.int64)
+    reps = numpy.sort(numpy.unique(block, return_index=True)[1])
+    renum = numpy.empty(len(members), dtype=numpy.int32)
+    renum[block[reps]] = numpy.arange(len(reps), dtype=numpy.int32)
+    block = renum[block]
+    return DFA(dfa.atoms, block[dfa.table[reps]], dfa.accepting[reps],
+               int(block[dfa.initial]))
+
+##
+## cache
+##
+
+def shape (phi) :
+    # the canonical template of phi, its fingerprint, and the substitution
+    # that maps its atoms back to those of phi
+    renamed, first = alpha(phi.expand())
+    template, second = alpha(renamed.canonical())
+    return (template.fingerprint(), template,
+            {new : first[old] for new, old in second.items()})
+
+class AutomatonCache (object) :
+    def __init__ (self, path) :
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS automata"
+                        " (template TEXT PRIMARY KEY, dfa TEXT)")
+        self.db.commit()
+    def get (self, template) :
+        row = self.db.execute("SELECT dfa FROM automata WHERE template=?",
+                              (template,)).fetchone()
+        if row is not None :
+            return DFA.loads(row[0])
+    def put (self, template, dfa) :
+        self.db.execute("INSERT OR REPLACE INTO automata VALUES (?, ?)",
+                        (template, dfa.dumps()))
+        self.db.commit()
+    def close (self) :
+        self.db.close()
+
+def compile_dfa (phi, cache=None, limit=LIMIT) :
+    if isinstance(phi, str) :
+        phi = parse(phi)
+    if cache is None :
+        return minimize(build(phi, limit))
+    elif isinstance(cache, str) :
+        cache = AutomatonCache(cache)
+    key, template, subst = shape(phi)
+    dfa = cache.get(key)
+    if dfa is None :
+        dfa = minimize(build(template, limit))
+        cache.put(key, dfa)
+    return dfa.rename(subst)
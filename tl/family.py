@@ -0,0 +1,193 @@
+"""Indexed families of formulas
+
+A family `&_{i in LOW..HIGH} phi` (resp. `|_{...}`) is the conjunction
+(resp. disjunction) of the instances of `phi` for every integer `i` from
+`LOW` to `HIGH` (both included). Within `phi`, atoms `name_i` and
+`name_{EXPR}` are indexed atoms whose index is evaluated for each instance,
+for example `crit_{i+1}` is instantiated as `crit_4` when `i` is `3`. Bounds
+and indexes are integer expressions over integers, `+`, `-`, `*`, `//`, and
+`%`, the indexes of the enclosing families, and parameters whose values are
+provided later on.
+
+A family is parsed as a node of kind `family` whose single child is its body
+and whose attributes are `op` (`"and"` or `"or"`), `index`, `low`, and
+`high`, and an indexed atom is parsed as a node of kind `iname` whose
+attributes are `value` (the name without the index) and `index`. Families
+are kept symbolic until they are expanded by `expand(phi, params)`, or
+their instances are enumerated one at a time by `instances(node, params)`.
+"""
+
+import ast, functools, re
+from . import Phi
+
+_header = re.compile(r"^([&|])_\{\s*(\w+)\s+in\s+(.+?)\s*\.\.\s*(.+?)\s*\}$")
+
+_allowed = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Name,
+            ast.Load, ast.Add, ast.Sub, ast.Mult, ast.FloorDiv, ast.Mod,
+            ast.USub, ast.UAdd)
+
+def _parse (text) :
+    try :
+        tree = ast.parse(text.strip(), mode="eval")
+    except SyntaxError :
+        raise ValueError(f"invalid index expression {text!r}")
+    for node in ast.walk(tree) :
+        if not isinstance(node, _allowed) :
+            raise ValueError(f"invalid index expression {text!r}")
+        elif isinstance(node, ast.Constant) and not isinstance(node.value, int) :
+            raise ValueError(f"invalid index expression {text!r}")
+    return tree
+
+def expr (text) :
+    # normalized text of an index expression, or an int if it is constant
+    names, code = _compile(text)
+    if names :
+        return ast.unparse(_parse(text))
+    return eval(code, {"__builtins__" : {}})
+
+def header (text) :
+    match = _header.match(text)
+    if not match :
+        raise ValueError(f"invalid family {text!r}")
+    op, index, low, high = match.groups()
+    return ("and" if op == "&" else "or"), index, expr(low), expr(high)
+
+class _Subst (ast.NodeTransformer) :
+    def __init__ (self, env) :
+        self.env = env
+    def visit_Name (self, node) :
+        if node.id in self.env :
+            return ast.copy_location(ast.Constant(self.env[node.id]), node)
+        return node
+
+@functools.lru_cache(maxsize=None)
+def _compile (text) :
+    tree = _parse(text)
+    names = frozenset(node.id for node in ast.walk(tree)
+                      if isinstance(node, ast.Name))
+    return names, compile(tree, "<index>", "eval")
+
+def subst (text, env) :
+    if isinstance(text, int) :
+        return text
+    names, code = _compile(text)
+    if all(name in env for name in names) :
+        return eval(code, {"__builtins__" : {}}, {n : env[n] for n in names})
+    elif not any(name in env for name in names) :
+        return text
+    tree = ast.fix_missing_locations(_Subst(env).visit(_parse(text)))
+    return ast.unparse(tree)
+
+def _value (text, env) :
+    value = subst(text, env)
+    if not isinstance(value, int) :
+        raise ValueError(f"unbound index {value!r}")
+    return value
+
+def _rebuild (node, children, attr) :
+    if (all(new is old for new, old in zip(children, node.children))
+        and all(attr[key] is node[key] for key in attr)) :
+        return node
+    return node.__class__(node.kind, *children, **attr)
+
+def instantiate (phi, env) :
+    # substitute the values in env to the indexes and parameters of phi,
+    # sharing the sub-formulas that are not changed
+    done = {}
+    stack = [(phi, False)]
+    while stack :
+        node, ready = stack.pop()
+        if id(node) in done :
+            continue
+        elif node.kind == "iname" :
+            index = subst(node.index, env)
+            if isinstance(index, int) :
+                done[id(node)] = node.__class__("name", value=f"{node.value}_{index}")
+            elif index == node.index :
+                done[id(node)] = node
+            else :
+                done[id(node)] = node.__class__("iname", value=node.value,
+                                                index=index)
+        elif node.kind == "family" :
+            # the index of the family hides that of enclosing families
+            inner = {k : v for k, v in env.items() if k != node.index}
+            body = instantiate(node.children[0], inner)
+            low, high = subst(node.low, env), subst(node.high, env)
+            if body is node.children[0] and low == node.low and high == node.high :
+                done[id(node)] = node
+            else :
+                done[id(node)] = node.__class__("family", body, op=node.op,
+                                                index=node.index,
+                                                low=low, high=high)
+        elif ready :
+            attr = {}
+            for key, value in node.items() :
+                if isinstance(value, Phi) :
+                    attr[key] = done[id(value)]
+                elif isinstance(value, list) :
+                    new = [done[id(v)] if isinstance(v, Phi) else v for v in value]
+                    if all(a is b for a, b in zip(new, value)) :
+                        new = value
+                    attr[key] = new
+                else :
+                    attr[key] = value
+            done[id(node)] = _rebuild(node, [done[id(c)] for c in node.children],
+                                      attr)
+        else :
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.children)
+            for value in node.values() :
+                if isinstance(value, Phi) :
+                    stack.append((value, False))
+                elif isinstance(value, list) :
+                    stack.extend((v, False) for v in value if isinstance(v, Phi))
+    return done[id(phi)]
+
+def instances (node, params=None) :
+    env = dict(params or {})
+    low, high = _value(node.low, env), _value(node.high, env)
+    for num in range(low, high + 1) :
+        env[node.index] = num
+        yield instantiate(node.children[0], env)
+
+def expand (phi, params=None) :
+    phi = instantiate(phi, params or {})
+    done = {}
+    stack = [(phi, False)]
+    while stack :
+        node, ready = stack.pop()
+        if id(node) in done :
+            continue
+        elif node.kind == "family" :
+            items = [expand(inst) for inst in instances(node)]
+            if not items :
+                done[id(node)] = node.__class__("bool", value=node.op == "and")
+            elif len(items) == 1 :
+                done[id(node)] = items[0]
+            else :
+                done[id(node)] = node.__class__(node.op, *items)
+        elif node.kind == "iname" :
+            raise ValueError(f"unbound index {node.index!r}")
+        elif ready :
+            attr = {}
+            for key, value in node.items() :
+                if isinstance(value, Phi) :
+                    attr[key] = done[id(value)]
+                elif isinstance(value, list) :
+                    new = [done[id(v)] if isinstance(v, Phi) else v for v in value]
+                    if all(a is b for a, b in zip(new, value)) :
+                        new = value
+                    attr[key] = new
+                else :
+                    attr[key] = value
+            done[id(node)] = _rebuild(node, [done[id(c)] for c in node.children],
+                                      attr)
+        else :
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.children)
+            for value in node.values() :
+                if isinstance(value, Phi) :
+                    stack.append((value, False))
+                elif isinstance(value, list) :
+                    stack.extend((v, False) for v in value if isinstance(v, Phi))
+    return done[id(phi)]
@@ -0,0 +1,74 @@
+"""Hash-consing of formulas
+
+A `HashCons` table gives the same integer identifier to structurally equal
+formulas (attributes that are `None` or empty lists are ignored, as in
+`Phi.key`), and keeps the first node seen for each identifier as its
+representative. Identifiers are computed bottom-up without recursion and
+memoized per node, so that identifying a whole tree is linear in its size.
+Memoized nodes are kept alive (their `id` must not be reused), and
+`forget(node)` drops the memo for the sub-formulas of `node` that are not
+representatives, so that long-lived tables only keep the representatives.
+"""
+
+from . import Phi, _subterms
+
+class HashCons (object) :
+    def __init__ (self) :
+        self._table = {}
+        self._ident = {}
+        # id => node, so that memoized ids are not reused
+        self._alive = {}
+        self.nodes = []
+    def __len__ (self) :
+        return len(self.nodes)
+    def __contains__ (self, node) :
+        return id(node) in self._ident
+    def _attr (self, value) :
+        if isinstance(value, Phi) :
+            return ("phi", self._ident[id(value)])
+        elif isinstance(value, (list, tuple)) :
+            return tuple(self._attr(v) for v in value)
+        else :
+            return value
+    def key (self, node) :
+        return (node.kind,
+                tuple(self._ident[id(child)] for child in node.children),
+                tuple(sorted((k, self._attr(v)) for k, v in node.items()
+                             if v is not None and not (isinstance(v, list)
+                                                       and not v))))
+    def __call__ (self, node) :
+        ident = self._ident.get(id(node))
+        if ident is not None :
+            return ident
+        stack = [(node, False)]
+        while stack :
+            top, ready = stack.pop()
+            if id(top) in self._ident :
+                continue
+            elif not ready :
+                stack.append((top, True))
+                stack.extend((sub, False) for sub in _subterms(top)
+                             if id(sub) not in self._ident)
+                continue
+            key = self.key(top)
+            ident = self._table.get(key)
+            if ident is None :
+                ident = self._table[key] = len(self.nodes)
+                self.nodes.append(top)
+            self._ident[id(top)] = ident
+            self._alive[id(top)] = top
+        return self._ident[id(node)]
+    def unique (self, node) :
+        return self.nodes[self(node)]
+    def forget (self, node) :
+        # drop the identifiers memoized for the sub-formulas of node that
+        # are not representatives, the table itself is kept
+        stack = [node]
+        while stack :
+            top = stack.pop()
+            ident = self._ident.get(id(top))
+            if ident is None or self.nodes[ident] is top :
+                continue
+            del self._ident[id(top)]
+            del self._alive[id(top)]
+            stack.extend(_subterms(top))
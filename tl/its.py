@@ -0,0 +1,98 @@
+"""Batch property files for ITS-tools
+
+A `PropertyFile` collects many formulas and writes them into a single
+property file, one property per line, so that one run of `its-ctl` or
+`its-ltl` checks them all. Property `n` of the file is line `n` (counting
+from 0), which is also how the tools number the properties they report.
+
+Properties may also be read from a text with one formula per line, starting
+with an optional definitions section made of lines `let NAME = FORMULA`
+terminated by a line `in`. Each definition is parsed once and the resulting
+formula is shared by all the properties that use it. Formulas added in a
+batch (by `extend` or `loads`) are all parsed and translated before the
+first one is added, so that a batch with an invalid formula leaves the file
+unchanged.
+"""
+
+import collections, re
+from . import parse
+
+Property = collections.namedtuple("Property",
+                                  ["index", "phi", "text", "fingerprint", "line"])
+
+class PropertyFile (object) :
+    def __init__ (self, formulas=(), syntax="ctl", parser=parse) :
+        if syntax not in ("ctl", "ltl") :
+            raise ValueError(f"unsupported ITS syntax {syntax!r}")
+        self.syntax = syntax
+        self.parser = parser
+        self.properties = []
+        self._fingerprints = collections.defaultdict(list)
+        self.defs = {}
+        self.extend(formulas)
+    def _parse (self, text) :
+        if self.defs :
+            return self.parser(text, defs=self.defs)
+        return self.parser(text)
+    def define (self, name, phi) :
+        if isinstance(phi, str) :
+            phi = self._parse(phi)
+        self.defs[name] = phi
+        return phi
+    def _prepare (self, phi) :
+        if isinstance(phi, str) :
+            text, phi = phi, self._parse(phi)
+        else :
+            text = None
+        return phi, text, getattr(phi, f"its_{self.syntax}")()
+    def _append (self, phi, text, line) :
+        prop = Property(len(self.properties), phi, text, phi.fingerprint(), line)
+        self.properties.append(prop)
+        self._fingerprints[prop.fingerprint].append(prop.index)
+        return prop.index
+    def add (self, phi) :
+        return self._append(*self._prepare(phi))
+    def extend (self, formulas) :
+        # all the formulas are translated before any is added, so that
+        # an invalid formula leaves the file unchanged
+        batch = [self._prepare(phi) for phi in formulas]
+        return [self._append(*prep) for prep in batch]
+    def __len__ (self) :
+        return len(self.properties)
+    def __iter__ (self) :
+        return iter(self.properties)
+    def __getitem__ (self, index) :
+        return self.properties[index]
+    def lookup (self, fingerprint) :
+        return [self.properties[i] for i in self._fingerprints.get(fingerprint, [])]
+    _let = re.compile(r"^\s*let\s+(\w+)\s*=(.*)$")
+    def loads (self, text) :
+        lines = [line for line in text.splitlines() if line.strip()]
+        defs = dict(self.defs)
+        try :
+            if any(line.strip() == "in" for line in lines) :
+                end = [line.strip() for line in lines].index("in")
+                for line in lines[:end] :
+                    match = self._let.match(line)
+                    if not match :
+                        raise ValueError(f"invalid definition {line!r}")
+                    self.define(*match.groups())
+                lines = lines[end+1:]
+            return self.extend(lines)
+        except Exception :
+            # the definitions of a text that cannot be loaded are dropped
+            self.defs = defs
+            raise
+    def read (self, source) :
+        if isinstance(source, str) :
+            with open(source, encoding="utf-8") as stream :
+                return self.loads(stream.read())
+        return self.loads(source.read())
+    def dumps (self) :
+        return "".join(f"{prop.line}\n" for prop in self.properties)
+    def write (self, out) :
+        if isinstance(out, str) :
+            with open(out, "w", encoding="utf-8") as stream :
+                stream.write(self.dumps())
+        else :
+            out.write(self.dumps())
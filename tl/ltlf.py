@@ -0,0 +1,122 @@
+"""LTL on finite traces
+
+`eval_traces(phi, traces, atoms)` evaluates an LTL formula on finite traces
+(LTLf semantics) at every position of every trace. Traces are given either
+as a Boolean array whose last axis is the atoms (ordered like `atoms`) and
+the axis before it is the time, or as a `dict` that maps every atom to a
+Boolean array whose last axis is the time. So, a single trace is a 2-D
+array `time x atom` (or a `dict` of 1-D columns), and a batch of traces of
+the same length is a 3-D array `trace x time x atom` (or a `dict` of 2-D
+columns). The result is a Boolean array with the shape of a column, that is
+whether `phi` holds at each position of each trace.
+
+Every sub-formula is evaluated once, as a whole column, by NumPy operations
+along the time axis, backward in time: `F` and `G` are reverse cumulative
+`or` and `and`, and `p U q` holds at position `i` iff the first position
+`j >= i` where `q` holds exists and is not after the first position `k >= i`
+where `p` does not hold, both being computed as reverse cumulative minima of
+positions. `X` is the strong next (it does not hold at the last position of
+a trace), `R`, `W`, and `M` are derived from `U` and `G`.
+"""
+
+import numpy
+from . import parse
+from .hashcons import HashCons
+
+class _Traces (object) :
+    def __init__ (self, traces, atoms) :
+        if isinstance(traces, dict) :
+            self.columns = {name : numpy.asarray(col, dtype=bool)
+                            for name, col in traces.items()}
+            shapes = {col.shape for col in self.columns.values()}
+            if len(shapes) != 1 :
+                raise ValueError("columns have distinct shapes")
+            self.shape = shapes.pop()
+        else :
+            traces = numpy.asarray(traces, dtype=bool)
+            if atoms is None :
+                raise ValueError("atoms must be given for an array of traces")
+            elif traces.ndim < 2 or traces.shape[-1] != len(atoms) :
+                raise ValueError("last axis of traces does not match atoms")
+            self.columns = {name : traces[..., num]
+                            for num, name in enumerate(atoms)}
+            self.shape = traces.shape[:-1]
+        if not self.shape or not self.shape[-1] :
+            raise ValueError("empty traces")
+        self.length = self.shape[-1]
+        self.true = numpy.ones(self.shape, dtype=bool)
+        self.false = numpy.zeros(self.shape, dtype=bool)
+        # positions along the time axis, shaped to broadcast over columns
+        dtype = numpy.int32 if self.length < 2**31 - 1 else numpy.int64
+        self.positions = numpy.arange(self.length, dtype=dtype)
+    def first (self, col) :
+        # for each position i, the first position j >= i where col holds,
+        # or the length of the trace if there is none
+        pos = numpy.where(col, self.positions, self.positions.dtype.type(self.length))
+        return numpy.minimum.accumulate(pos[..., ::-1], axis=-1)[..., ::-1]
+
+class Evaluator (object) :
+    def __init__ (self, traces, atoms=None) :
+        self.traces = _Traces(traces, atoms)
+        self.hc = HashCons()
+        self.cache = {}
+    def __call__ (self, phi) :
+        if isinstance(phi, str) :
+            phi = parse(phi)
+        phi = phi.expand()
+        hc, cache = self.hc, self.cache
+        for node in phi._postorder() :
+            key = hc(node)
+            if key not in cache :
+                handler = getattr(self, f"_eval_{node.kind}", None)
+                if handler is None :
+                    raise ValueError(f"cannot evaluate {node.kind!r}")
+                elif node.actions is not None :
+                    raise ValueError("actions not supported")
+                cache[key] = handler(node, *(cache[hc(child)]
+                                             for child in node.children))
+        return cache[hc(phi)]
+    def _eval_name (self, node) :
+        try :
+            return self.traces.columns[node.value]
+        except KeyError :
+            raise ValueError(f"unknown atom {node.value!r}")
+    def _eval_bool (self, node) :
+        return self.traces.true if node.value else self.traces.false
+    def _eval_not (self, node, col) :
+        return ~col
+    def _eval_and (self, node, *cols) :
+        return numpy.logical_and.reduce(cols)
+    def _eval_or (self, node, *cols) :
+        return numpy.logical_or.reduce(cols)
+    def _eval_imply (self, node, left, right) :
+        return ~left | right
+    def _eval_iff (self, node, first, *rest) :
+        for col in rest :
+            first = first == col
+        return first
+    def _eval_X (self, node, col) :
+        out = numpy.zeros_like(col)
+        out[..., :-1] = col[..., 1:]
+        return out
+    def _eval_F (self, node, col) :
+        return numpy.logical_or.accumulate(col[..., ::-1], axis=-1)[..., ::-1]
+    def _eval_G (self, node, col) :
+        return numpy.logical_and.accumulate(col[..., ::-1], axis=-1)[..., ::-1]
+    def _until (self, left, right) :
+        stop = self.traces.first(right)
+        return (stop < self.traces.length) & (stop <= self.traces.first(~left))
+    def _eval_U (self, node, left, right) :
+        return self._until(left, right)
+    def _eval_R (self, node, left, right) :
+        # p R q = ~(~p U ~q)
+        return ~self._until(~left, ~right)
+    def _eval_W (self, node, left, right) :
+        # p W q = (p U q) | G p
+        return self._until(left, right) | self._eval_G(node, left)
+    def _eval_M (self, node, left, right) :
+        # p M q = q U (p & q)
+        return self._until(right, left & right)
+
+def eval_traces (phi, traces, atoms=None) :
+    return Evaluator(traces, atoms)(phi)
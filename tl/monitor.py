@@ -0,0 +1,428 @@
+"""Runtime monitoring of LTL formulas on finite traces
+
+A `Progression` compiles an LTL formula into obligations that are rewritten
+by formula progression: after each event (a valuation of the atoms), the
+obligation becomes what remains to be satisfied by the rest of the trace.
+Obligations are hash-consed into integers, put in negation normal form
+using the finite traces duals (the dual of the strong next `X` is the weak
+next, that also holds at the end of the trace), and simplified so that an
+obligation that is `True` (resp. `False`) is a definite verdict: every
+continuation of the trace satisfies (resp. violates) the formula. Two
+internal constants tell whether the rest of the trace is non-empty or
+empty, so that an obligation also tells whether the trace read so far
+satisfies the formula if it stops there. Class `Obligations` implements
+the hash-consing and the conversion from `Phi`, it is extended by
+`Progression` with the progression itself. `Progression` also keeps its
+obligations in disjunctive normal form with absorption (no cube contains
+another one): since progression only combines the temporal obligations of
+the closure of the formula, there are finitely many such obligations and
+the number of nodes stays bounded however long the trace is.
+
+Transitions are memoized for each obligation (and sub-obligation) and
+valuation of the atoms it reads, so that each step costs a table look-up
+once the reachable obligations have been explored, and at most one
+progression (linear in the size of the obligation) otherwise. A `Monitor` follows one
+trace, and a `Monitors` instance follows many independent traces at once,
+using a dense transition table indexed by obligations and valuations when
+there are at most `DENSE` atoms.
+"""
+
+import numpy
+from . import parse, Phi
+
+DENSE = 16
+
+TRUE, FALSE, NONEMPTY, END = range(4)
+
+class Obligations (object) :
+    def __init__ (self, phi) :
+        if isinstance(phi, str) :
+            phi = parse(phi)
+        self.phi = phi = phi.expand()
+        self.atoms = sorted({node.value for node in phi._postorder()
+                             if node.kind == "name"})
+        self.index = {name : num for num, name in enumerate(self.atoms)}
+        self.nodes = [("true",), ("false",), ("nonempty",), ("end",)]
+        self.ident = {node : num for num, node in enumerate(self.nodes)}
+        self.final = []
+        self.initial = self._convert(phi)
+        for num in range(len(self.nodes)) :
+            self._final(num)
+    ##
+    ## obligations
+    ##
+    def _node (self, node) :
+        num = self.ident.get(node)
+        if num is None :
+            num = self.ident[node] = len(self.nodes)
+            self.nodes.append(node)
+            self._final(num)
+        return num
+    def _final (self, num) :
+        # whether obligation num holds on the empty trace
+        while len(self.final) <= num :
+            node = self.nodes[len(self.final)]
+            if node[0] in ("true", "end") :
+                self.final.append(True)
+            elif node[0] == "and" :
+                self.final.append(all(self.final[n] for n in node[1]))
+            elif node[0] == "or" :
+                self.final.append(any(self.final[n] for n in node[1]))
+            else :
+                self.final.append(False)
+    def _bool (self, op, args) :
+        unit, zero = (TRUE, FALSE) if op == "and" else (FALSE, TRUE)
+        flat = set()
+        for arg in args :
+            if self.nodes[arg][0] == op :
+                flat.update(self.nodes[arg][1])
+            else :
+                flat.add(arg)
+        flat.discard(unit)
+        if zero in flat or {NONEMPTY, END} <= flat :
+            return zero
+        for arg in flat :
+            node = self.nodes[arg]
+            if node[0] == "lit" and self.ident.get(("lit", node[1], not node[2])) in flat :
+                return zero
+        if not flat :
+            return unit
+        elif len(flat) == 1 :
+            return flat.pop()
+        return self._node((op, tuple(sorted(flat))))
+    def conj (self, *args) :
+        return self._bool("and", args)
+    def disj (self, *args) :
+        return self._bool("or", args)
+    def next (self, arg, strong=True) :
+        if arg in (TRUE, FALSE) and (arg == FALSE) == strong :
+            return arg
+        return self._node(("X" if strong else "N", arg))
+    def until (self, left, right) :
+        if right in (TRUE, FALSE) :
+            return right
+        return self._node(("U", left, right))
+    def release (self, left, right) :
+        if right in (TRUE, FALSE) :
+            return right
+        return self._node(("R", left, right))
+    ##
+    ## compilation from Phi
+    ##
+    def _subs (self, node, pol) :
+        if node.kind == "not" :
+            return [(node.children[0], not pol)]
+        elif node.kind == "imply" :
+            return [(node.children[0], not pol), (node.children[1], pol)]
+        elif node.kind == "iff" :
+            first, second = self._iff(node)
+            return [(child, p) for child in (first, second) for p in (True, False)]
+        return [(child, pol) for child in node.children]
+    def _iff (self, node) :
+        # a <=> b <=> c is (a <=> b) <=> c
+        if len(node.children) == 2 :
+            return node.children
+        elif id(node) not in self._folds :
+            self._folds[id(node)] = (Phi("iff", *node.children[:-1]), node)
+        return self._folds[id(node)][0], node.children[-1]
+    def _convert (self, phi) :
+        done = {}
+        # folded iff nodes (and their originals) kept alive while converting
+        self._folds = {}
+        stack = [(phi, True, False)]
+        while stack :
+            node, pol, ready = stack.pop()
+            if (id(node), pol) in done :
+                continue
+            elif node.kind in ("A", "E") or node.actions is not None :
+                raise ValueError(f"unsupported {node.kind!r} with actions or quantifiers")
+            subs = self._subs(node, pol)
+            if not ready :
+                stack.append((node, pol, True))
+                stack.extend((child, p, False) for child, p in subs
+                             if (id(child), p) not in done)
+                continue
+            args = [done[id(child), p] for child, p in subs]
+            done[id(node), pol] = self._combine(node, pol, args)
+        del self._folds
+        return done[id(phi), True]
+    def _combine (self, node, pol, args) :
+        kind = node.kind
+        if kind == "name" :
+            return self._node(("lit", self.index[node.value], pol))
+        elif kind == "bool" :
+            return TRUE if node.value == pol else FALSE
+        elif kind == "not" :
+            return args[0]
+        elif kind in ("and", "or") :
+            return self.conj(*args) if (kind == "and") == pol else self.disj(*args)
+        elif kind == "imply" :
+            return self.disj(*args) if pol else self.conj(*args)
+        elif kind == "iff" :
+            pos_a, neg_a, pos_b, neg_b = args
+            if pol :
+                return self.disj(self.conj(pos_a, pos_b), self.conj(neg_a, neg_b))
+            return self.disj(self.conj(pos_a, neg_b), self.conj(neg_a, pos_b))
+        elif kind == "X" :
+            return self.next(args[0], pol)
+        elif kind == "F" :
+            return self.until(TRUE, args[0]) if pol else self.release(FALSE, args[0])
+        elif kind == "G" :
+            return self.release(FALSE, args[0]) if pol else self.until(TRUE, args[0])
+        elif kind == "U" :
+            return self.until(*args) if pol else self.release(*args)
+        elif kind == "R" :
+            return self.release(*args) if pol else self.until(*args)
+        elif kind == "W" :
+            # p W q = q R (q | p)
+            left, right = args
+            if pol :
+                return self.release(right, self.disj(left, right))
+            return self.until(right, self.conj(left, right))
+        elif kind == "M" :
+            # p M q = q U (q & p)
+            left, right = args
+            if pol :
+                return self.until(right, self.conj(left, right))
+            return self.release(right, self.disj(left, right))
+        raise ValueError(f"unsupported operator {kind!r}")
+
+class Progression (Obligations) :
+    def __init__ (self, phi) :
+        self.delta = {}
+        self.supports = {}
+        self.cubes = {TRUE : frozenset([frozenset()]), FALSE : frozenset()}
+        self.bools = {}
+        Obligations.__init__(self, phi)
+        self.table = None
+        if len(self.atoms) <= DENSE :
+            self.table = numpy.full((16, 1 << len(self.atoms)), -1,
+                                    dtype=numpy.int32)
+    ##
+    ## obligations in disjunctive normal form, so that they range over a
+    ## finite set (the disjunctions of cubes over the temporal obligations
+    ## and literals of the closure, without cubes that contain others)
+    ##
+    def _cubes (self, num) :
+        cubes = self.cubes.get(num)
+        if cubes is None :
+            node = self.nodes[num]
+            if node[0] == "or" :
+                cubes = frozenset(cube for sub in node[1] for cube in self._cubes(sub))
+            elif node[0] == "and" :
+                cubes = frozenset([frozenset(node[1])])
+            else :
+                cubes = frozenset([frozenset([num])])
+            self.cubes[num] = cubes
+        return cubes
+    def _absurd (self, cube) :
+        if NONEMPTY in cube and END in cube :
+            return True
+        for num in cube :
+            node = self.nodes[num]
+            if node[0] == "lit" and self.ident.get(("lit", node[1], not node[2])) in cube :
+                return True
+        return False
+    def _bool (self, op, args) :
+        key = (op, frozenset(args))
+        if key in self.bools :
+            return self.bools[key]
+        if op == "or" :
+            cubes = {cube for arg in args for cube in self._cubes(arg)}
+        else :
+            cubes = {frozenset()}
+            for arg in args :
+                cubes = {left | right for left in cubes for right in self._cubes(arg)}
+                cubes = {cube for cube in cubes if not self._absurd(cube)}
+        # absorption: x | (x & y) = x
+        kept = []
+        for cube in sorted(cubes, key=len) :
+            if not any(other <= cube for other in kept) :
+                kept.append(cube)
+        num = Obligations._bool(self, "or", [Obligations._bool(self, "and", cube)
+                                             for cube in kept])
+        if num not in self.cubes :
+            self.cubes[num] = frozenset(kept)
+        self.bools[key] = num
+        return num
+    ##
+    ## progression
+    ##
+    def progress (self, state, code) :
+        # transitions are memoized for every sub-obligation on the atoms it
+        # reads, so that conjuncts over distinct atoms are progressed once
+        # for each valuation of their own atoms
+        mask = self.supports.get(state)
+        if mask is None :
+            mask = self.support(state)
+        key = (state, code & mask)
+        if key in self.delta :
+            return self.delta[key]
+        done = {}
+        stack = [(state, False)]
+        while stack :
+            num, ready = stack.pop()
+            if num in done :
+                continue
+            node = self.nodes[num]
+            op = node[0]
+            if op in ("true", "false") :
+                done[num] = num
+            elif op == "nonempty" :
+                done[num] = TRUE
+            elif op == "end" :
+                done[num] = FALSE
+            elif op == "lit" :
+                done[num] = TRUE if bool(code >> node[1] & 1) == node[2] else FALSE
+            elif op == "X" :
+                done[num] = self.conj(NONEMPTY, node[1])
+            elif op == "N" :
+                done[num] = self.disj(END, node[1])
+            elif (num, code & self.supports[num]) in self.delta :
+                done[num] = self.delta[num, code & self.supports[num]]
+            elif not ready :
+                stack.append((num, True))
+                subs = node[1] if op in ("and", "or") else node[1:]
+                stack.extend((sub, False) for sub in subs if sub not in done)
+            else :
+                if op in ("and", "or") :
+                    done[num] = self._bool(op, [done[sub] for sub in node[1]])
+                elif op == "U" :
+                    done[num] = self.disj(done[node[2]],
+                                          self.conj(done[node[1]], NONEMPTY, num))
+                else :
+                    done[num] = self.conj(done[node[2]],
+                                          self.disj(done[node[1]], END, num))
+                self.delta[num, code & self.supports[num]] = done[num]
+        return done[state]
+    def support (self, state) :
+        # bitmask of the atoms read when obligation state is progressed
+        stack = [(state, False)]
+        while stack :
+            num, ready = stack.pop()
+            if num in self.supports :
+                continue
+            node = self.nodes[num]
+            if node[0] == "lit" :
+                self.supports[num] = 1 << node[1]
+                continue
+            elif node[0] in ("and", "or") :
+                subs = node[1]
+            elif node[0] in ("U", "R") :
+                subs = node[1:]
+            else :
+                self.supports[num] = 0
+                continue
+            if ready :
+                mask = 0
+                for sub in subs :
+                    mask |= self.supports[sub]
+                self.supports[num] = mask
+            else :
+                stack.append((num, True))
+                stack.extend((sub, False) for sub in subs)
+        return self.supports[state]
+    def code (self, event) :
+        # valuation of the atoms as an int, from a dict or a set of atoms
+        code = 0
+        if isinstance(event, dict) :
+            for name, num in self.index.items() :
+                if event.get(name) :
+                    code |= 1 << num
+        else :
+            for name in event :
+                if name in self.index :
+                    code |= 1 << self.index[name]
+        return code
+    def codes (self, events, atoms=None) :
+        events = numpy.asarray(events, dtype=bool)
+        if atoms is None :
+            atoms = self.atoms
+        elif events.shape[-1] != len(atoms) :
+            raise ValueError("last axis of events does not match atoms")
+        weights = numpy.array([1 << self.index[name] if name in self.index else 0
+                               for name in atoms], dtype=numpy.int64)
+        return events.astype(numpy.int64) @ weights
+    def step_many (self, states, codes) :
+        if self.table is None :
+            pairs, inverse = numpy.unique(states.astype(numpy.int64) << len(self.atoms)
+                                          | codes, return_inverse=True)
+            mask = (1 << len(self.atoms)) - 1
+            nxt = numpy.array([self.progress(int(p >> len(self.atoms)), int(p & mask))
+                               for p in pairs], dtype=numpy.int32)
+            return nxt[inverse.reshape(states.shape)]
+        nxt = self.table[states, codes] if len(self.table) > states.max() else None
+        if nxt is None or (nxt < 0).any() :
+            if nxt is None :
+                todo = zip(states.tolist(), codes.tolist())
+            else :
+                miss = nxt < 0
+                todo = zip(states[miss].tolist(), codes[miss].tolist())
+            for state, code in set(todo) :
+                target = self.progress(state, code)
+                if max(state, target) >= len(self.table) :
+                    grow = numpy.full((2 * max(state, target) + 2, self.table.shape[1]),
+                                      -1, dtype=numpy.int32)
+                    grow[:len(self.table)] = self.table
+                    self.table = grow
+                self.table[state, code] = target
+            nxt = self.table[states, codes]
+        return nxt
+    def verdict (self, state) :
+        if state == TRUE :
+            return True
+        elif state == FALSE :
+            return False
+
+class Monitor (object) :
+    def __init__ (self, phi) :
+        if not isinstance(phi, Progression) :
+            phi = Progression(phi)
+        self.progression = phi
+        self.state = phi.initial
+        self.steps = 0
+    def reset (self) :
+        self.state = self.progression.initial
+        self.steps = 0
+    def step (self, event) :
+        prog = self.progression
+        self.state = prog.progress(self.state, prog.code(event))
+        self.steps += 1
+        return prog.verdict(self.state)
+    @property
+    def verdict (self) :
+        return self.progression.verdict(self.state)
+    @property
+    def accepting (self) :
+        return self.steps > 0 and self.progression.final[self.state]
+
+class Monitors (object) :
+    def __init__ (self, phi, count, atoms=None) :
+        if not isinstance(phi, Progression) :
+            phi = Progression(phi)
+        self.progression = phi
+        self.atoms = atoms
+        self.states = numpy.full(count, phi.initial, dtype=numpy.int32)
+        self.steps = 0
+    def __len__ (self) :
+        return len(self.states)
+    def reset (self) :
+        self.states[:] = self.progression.initial
+        self.steps = 0
+    def step_many (self, events) :
+        # events is an array (monitor x atom) of Booleans
+        prog = self.progression
+        self.states = prog.step_many(self.states, prog.codes(events, self.atoms))
+        self.steps += 1
+        return self.verdicts()
+    def verdicts (self) :
+        # 1 if satisfied, 0 if violated, -1 if undetermined
+        out = numpy.full(len(self.states), -1, dtype=numpy.int8)
+        out[self.states == TRUE] = 1
+        out[self.states == FALSE] = 0
+        return out
+    def accepting (self) :
+        final = numpy.array(self.progression.final, dtype=bool)
+        if not self.steps :
+            return numpy.zeros(len(self.states), dtype=bool)
+        return final[self.states]
@@ -0,0 +1,117 @@
+"""Negation normal form
+
+`nnf(phi)` pushes negations down to the atoms in a single iterative pass
+that tracks the polarity of each node, using the dual operators: `and`/`or`,
+`X`/`X`, `F`/`G`, `U`/`R`, `W`/`M`, and `A`/`E`, the negation of a family
+being the dual family of the negated body. Implications and
+equivalences are expanded, chained equivalences being grouped to the left.
+Every pair (sub-formula, polarity) is translated once and hash-consed, so
+that the sub-formulas of an equivalence, that occur with both polarities,
+are shared instead of being copied, and the result has a size that is
+linear in that of the original formula. Actions and fairness constraints
+are kept on their nodes and are themselves put in negation normal form.
+"""
+
+from .hashcons import HashCons
+
+_dual = {"and" : "or", "or" : "and",
+         "X" : "X", "F" : "G", "G" : "F",
+         "U" : "R", "R" : "U", "W" : "M", "M" : "W",
+         "A" : "E", "E" : "A"}
+
+def _attributes (node) :
+    for value in node.values() :
+        if isinstance(value, list) :
+            yield from (item for item in value if hasattr(item, "kind"))
+        elif hasattr(value, "kind") :
+            yield value
+
+class _NNF (object) :
+    def __init__ (self) :
+        self.hc = HashCons()
+        self.done = {}
+        self.iff = {}
+    def binary (self, node) :
+        # a <=> b <=> c is (a <=> b) <=> c
+        if len(node.children) == 2 :
+            return node.children
+        ident = self.hc(node)
+        if ident not in self.iff :
+            first = node.children[0]
+            for child in node.children[1:-1] :
+                first = node.__class__("iff", first, child)
+            self.iff[ident] = (first, node.children[-1])
+        return self.iff[ident]
+    def deps (self, node, pol) :
+        yield from ((sub, True) for sub in _attributes(node))
+        if node.kind == "not" :
+            yield node.children[0], not pol
+        elif node.kind == "imply" :
+            yield node.children[0], not pol
+            yield node.children[1], pol
+        elif node.kind == "iff" :
+            for child in self.binary(node) :
+                yield child, True
+                yield child, False
+        elif node.kind in _dual or node.kind == "family" :
+            yield from ((child, pol) for child in node.children)
+        elif not pol and node.kind not in ("name", "iname", "bool") :
+            raise ValueError(f"cannot negate {node.kind!r}")
+        else :
+            yield from ((child, True) for child in node.children)
+    def get (self, node, pol) :
+        return self.done[self.hc(node), pol]
+    def attributes (self, node) :
+        attr = {}
+        for key, value in node.items() :
+            if isinstance(value, list) :
+                attr[key] = [self.get(item, True) if hasattr(item, "kind") else item
+                             for item in value]
+            elif hasattr(value, "kind") :
+                attr[key] = self.get(value, True)
+            else :
+                attr[key] = value
+        return attr
+    def build (self, node, pol) :
+        make = node.__class__
+        if node.kind == "not" :
+            return self.get(node.children[0], not pol)
+        elif node.kind == "bool" :
+            return node if pol else make("bool", value=not node.value)
+        elif node.kind in ("name", "iname") :
+            return node if pol else make("not", node)
+        elif node.kind == "family" :
+            attr = self.attributes(node)
+            if not pol :
+                attr["op"] = _dual[node.op]
+            return make("family", self.get(node.children[0], pol), **attr)
+        elif node.kind == "imply" :
+            left, right = node.children
+            return make("or" if pol else "and",
+                        self.get(left, not pol), self.get(right, pol))
+        elif node.kind == "iff" :
+            left, right = self.binary(node)
+            return make("or",
+                        make("and", self.get(left, True), self.get(right, pol)),
+                        make("and", self.get(left, False), self.get(right, not pol)))
+        return make(node.kind if pol else _dual[node.kind],
+                    *(self.get(child, pol) for child in node.children),
+                    **self.attributes(node))
+    def __call__ (self, phi) :
+        hc, done = self.hc, self.done
+        stack = [(phi, True, False)]
+        while stack :
+            node, pol, ready = stack.pop()
+            key = (hc(node), pol)
+            if key in done :
+                continue
+            elif ready :
+                done[key] = self.build(node, pol)
+            else :
+                stack.append((node, pol, True))
+                stack.extend((sub, p, False) for sub, p in self.deps(node, pol)
+                             if (hc(sub), p) not in done)
+        return done[hc(phi), True]
+
+def nnf (phi) :
+    return _NNF()(phi)
@@ -0,0 +1,142 @@
+"""On-the-fly LTL model-checking
+
+`check(phi, initial, successors, label)` checks an LTL formula (on infinite
+paths) against a model given implicitly: `initial` is an iterable of
+initial states, `successors(state)` returns an iterable of the successors
+of a state, and `label(state, atom)` tells whether an atom holds in a
+state. States may be any hashable objects. The product of the model with
+the Büchi automaton of `~phi` (see `tl.buchi.Tableau`, degeneralized on the
+fly by counting the acceptance sets visited) is explored on demand by a
+nested depth-first search (both searches use explicit stacks), that stops
+at the first accepting cycle. The result is `None` if `phi` holds on every
+infinite path from every initial state, and a `Lasso(prefix, cycle)` of
+model states otherwise, that is a counterexample path that follows
+`prefix` and then repeats `cycle` forever. Finite paths (ending in states
+without successors) are not considered.
+
+By default, visited states are stored exactly. With `bits=N`, they are
+instead stored by bitstate hashing into a table of `2**N` bits (for each of
+the two searches), so that the memory is bounded whatever the number of
+states, at the price of missing the counterexamples that go through states
+whose hash collides with that of already visited ones. In both cases, the
+states on the stack of the search are stored exactly, so that the returned
+lassos are always genuine counterexamples.
+"""
+
+import collections
+from . import parse, Phi
+from .buchi import Tableau
+
+Lasso = collections.namedtuple("Lasso", ["prefix", "cycle"])
+
+class Bitstate (object) :
+    def __init__ (self, bits) :
+        self.mask = (1 << bits) - 1
+        self.table = bytearray(max(1, 1 << bits >> 3))
+        self.count = 0
+    def add (self, key) :
+        code = hash(key) & self.mask
+        self.table[code >> 3] |= 1 << (code & 7)
+        self.count += 1
+    def __contains__ (self, key) :
+        code = hash(key) & self.mask
+        return bool(self.table[code >> 3] >> (code & 7) & 1)
+    def __len__ (self) :
+        return self.count
+
+class Search (object) :
+    def __init__ (self, phi, successors, label, bits=None) :
+        if isinstance(phi, str) :
+            phi = parse(phi)
+        self.tableau = Tableau(Phi("not", phi))
+        self.atoms = self.tableau.atoms
+        self.sets = self.tableau.sets
+        self.succ = successors
+        self.label = label
+        if bits is None :
+            self.blue, self.red = set(), set()
+        else :
+            self.blue, self.red = Bitstate(bits), Bitstate(bits)
+    ##
+    ## product
+    ##
+    def _code (self, state) :
+        code = 0
+        for num, atom in enumerate(self.atoms) :
+            if self.label(state, atom) :
+                code |= 1 << num
+        return code
+    def successors (self, node) :
+        # node is (state, automaton state, level), levels count the
+        # acceptance sets visited in order, level == sets is accepting
+        state, auto, level = node
+        if level == self.sets :
+            level = 0
+        code = self._code(state)
+        targets = None
+        for pos, neg, target, acc in self.tableau.successors(auto) :
+            if code & pos != pos or code & neg :
+                continue
+            up = level
+            while up < self.sets and acc >> up & 1 :
+                up += 1
+            if targets is None :
+                targets = list(self.succ(state))
+            for succ in targets :
+                yield (succ, target, up)
+    ##
+    ## nested DFS
+    ##
+    def run (self, initial) :
+        for state in initial :
+            root = (state, self.tableau.initial, self.sets)
+            if root not in self.blue :
+                lasso = self._blue(root)
+                if lasso is not None :
+                    return lasso
+    def _blue (self, root) :
+        self.blue.add(root)
+        path = [root]
+        onstack = {root : 0}
+        todo = [self.successors(root)]
+        while todo :
+            for succ in todo[-1] :
+                if succ not in self.blue :
+                    self.blue.add(succ)
+                    onstack[succ] = len(path)
+                    path.append(succ)
+                    todo.append(self.successors(succ))
+                    break
+            else :
+                todo.pop()
+                node = path[-1]
+                if node[2] == self.sets :
+                    cycle = self._red(node, onstack)
+                    if cycle is not None :
+                        start = onstack[cycle[-1]]
+                        return Lasso([n[0] for n in path[:start]],
+                                     [n[0] for n in path[start:] + cycle[:-1]])
+                path.pop()
+                del onstack[node]
+    def _red (self, seed, onstack) :
+        # search a path from seed to a node on the blue stack, returned
+        # without seed and ending with this node
+        path = []
+        todo = [self.successors(seed)]
+        while todo :
+            for succ in todo[-1] :
+                if succ in onstack :
+                    path.append(succ)
+                    return path
+                elif succ not in self.red :
+                    self.red.add(succ)
+                    path.append(succ)
+                    todo.append(self.successors(succ))
+                    break
+            else :
+                todo.pop()
+                if path :
+                    path.pop()
+
+def check (phi, initial, successors, label, bits=None) :
+    return Search(phi, successors, label, bits).run(initial)
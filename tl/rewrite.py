@@ -0,0 +1,234 @@
+"""Rewriting formulas with rules
+
+A `Rule` rewrites formulas that match its left-hand side, a pattern, into
+its right-hand side. Patterns are `Phi` trees in which `Var` instances may
+appear as children or as attribute values: a variable matches any node
+(possibly restricted to some kinds) and must match structurally equal nodes
+at all its occurrences. All the attributes of a pattern node have to match
+and the nodes that have extra attributes are not matched. The right-hand
+side is a pattern whose variables are replaced by the nodes they matched,
+or a function that is called with the node and a `dict` of bindings, and
+returns a new node or `None` if the rule does not apply.
+
+A `RuleSet` indexes its rules by the kind of the root of their left-hand
+side so that only candidate rules are tried on each node, and rewrites
+formulas to a fixpoint using either a `"bottomup"` strategy (children are
+rewritten first) or a `"topdown"` strategy (nodes are rewritten before their
+children and again after them if they changed). Every sub-formula is
+hash-consed and rewritten once, traversals do not use recursion. A
+rewriting that reaches a term containing one being rewritten (for instance
+with a rule `p & q -> q & p`) does not terminate and raises `ValueError`,
+as does one that applies more than `max_steps` rules (if given).
+"""
+
+from . import parse, Phi
+from .hashcons import HashCons
+
+class Var (object) :
+    def __init__ (self, name, kinds=None) :
+        self.name = name
+        if isinstance(kinds, str) :
+            kinds = kinds.split()
+        self.kinds = None if kinds is None else frozenset(kinds)
+    def __repr__ (self) :
+        if self.kinds is None :
+            return f"{self.__class__.__name__}({self.name!r})"
+        kinds = " ".join(sorted(self.kinds))
+        return f"{self.__class__.__name__}({self.name!r}, {kinds!r})"
+
+def pattern (text, variables=(), parser=parse) :
+    if isinstance(variables, str) :
+        variables = variables.split()
+    variables = set(variables)
+    def convert (node) :
+        if not isinstance(node, Phi) :
+            return node
+        elif node.kind in ("name", "var") and node.value in variables :
+            return Var(node.value)
+        attr = {}
+        for key, value in node.items() :
+            if isinstance(value, list) :
+                attr[key] = [convert(v) for v in value]
+            else :
+                attr[key] = convert(value)
+        return node.__class__(node.kind, *(convert(c) for c in node.children),
+                              **attr)
+    return convert(parser(text))
+
+def _empty (value) :
+    return value is None or (isinstance(value, list) and not value)
+
+class Rule (object) :
+    def __init__ (self, lhs, rhs, variables=(), name=None, parser=parse) :
+        if isinstance(lhs, str) :
+            lhs = pattern(lhs, variables, parser)
+        if isinstance(rhs, str) :
+            rhs = pattern(rhs, variables, parser)
+        self.lhs = lhs
+        self.rhs = rhs
+        self.name = name
+    def __repr__ (self) :
+        return f"{self.__class__.__name__}({self.lhs!r}, {self.rhs!r})"
+    def match (self, node, hc) :
+        binding = {}
+        todo = [(self.lhs, node)]
+        while todo :
+            pat, sub = todo.pop()
+            if isinstance(pat, Var) :
+                if not isinstance(sub, Phi) :
+                    return
+                elif pat.kinds is not None and sub.kind not in pat.kinds :
+                    return
+                elif pat.name in binding :
+                    if hc(binding[pat.name]) != hc(sub) :
+                        return
+                else :
+                    binding[pat.name] = sub
+            elif isinstance(pat, Phi) :
+                if (not isinstance(sub, Phi) or pat.kind != sub.kind
+                    or len(pat.children) != len(sub.children)) :
+                    return
+                todo.extend(zip(pat.children, sub.children))
+                keys = ({k for k, v in pat.items() if not _empty(v)}
+                        | {k for k, v in sub.items() if not _empty(v)})
+                todo.extend((pat.get(k), sub.get(k)) for k in keys)
+            elif isinstance(pat, list) :
+                if not isinstance(sub, list) or len(pat) != len(sub) :
+                    return
+                todo.extend(zip(pat, sub))
+            elif _empty(pat) :
+                if not _empty(sub) :
+                    return
+            elif pat != sub :
+                return
+        return binding
+    def instantiate (self, pat, binding) :
+        if isinstance(pat, Var) :
+            return binding[pat.name]
+        elif isinstance(pat, Phi) :
+            attr = {}
+            for key, value in pat.items() :
+                attr[key] = self.instantiate(value, binding)
+            return pat.__class__(pat.kind,
+                                 *(self.instantiate(c, binding) for c in pat.children),
+                                 **attr)
+        elif isinstance(pat, list) :
+            return [self.instantiate(p, binding) for p in pat]
+        return pat
+    def __call__ (self, node, hc) :
+        binding = self.match(node, hc)
+        if binding is None :
+            return
+        elif callable(self.rhs) and not isinstance(self.rhs, Phi) :
+            return self.rhs(node, binding)
+        result = self.instantiate(self.rhs, binding)
+        if isinstance(result, Phi) and not isinstance(self.rhs, Var) :
+            result = node.__class__(result.kind, *result.children, **result)
+        return result
+
+class RuleSet (object) :
+    def __init__ (self, rules=()) :
+        self.index = {}
+        self.generic = []
+        self.fired = {}
+        for rule in rules :
+            self.add(rule)
+    def add (self, rule) :
+        if isinstance(rule.lhs, Var) :
+            self.generic.append(rule)
+        else :
+            self.index.setdefault(rule.lhs.kind, []).append(rule)
+        return rule
+    def extend (self, rules) :
+        for rule in rules :
+            self.add(rule)
+    def __iter__ (self) :
+        for rules in self.index.values() :
+            yield from rules
+        yield from self.generic
+    def __add__ (self, other) :
+        return self.__class__(list(self) + list(other))
+    def apply (self, node, hc) :
+        ident = hc(node)
+        for rule in self.index.get(node.kind, []) + self.generic :
+            result = rule(node, hc)
+            if result is not None and hc(result) != ident :
+                if rule.name is not None :
+                    self.fired[rule.name] = self.fired.get(rule.name, 0) + 1
+                return result
+    def rewrite (self, phi, strategy="bottomup", hc=None, memo=None, max_steps=None) :
+        if strategy not in ("bottomup", "topdown") :
+            raise ValueError(f"unknown strategy {strategy!r}")
+        topdown = strategy == "topdown"
+        if hc is None :
+            hc = HashCons()
+        if memo is None :
+            memo = {}
+        # (node, phase, other): phase 0 starts rewriting node, phase 1 takes
+        # into account its rewritten children, phase 2 forwards to the
+        # result of rewriting other
+        stack = [(phi, 0, None)]
+        # nodes being rewritten: meeting one again means that it rewrites
+        # to a term that contains it, which loops forever
+        active = set()
+        steps = 0
+        def loop (node) :
+            return ValueError(f"rewriting does not terminate"
+                              f" (cycle through {node.kind!r} node)")
+        def step (node, new) :
+            nonlocal steps
+            steps += 1
+            if max_steps is not None and steps > max_steps :
+                raise ValueError(f"rewriting did not terminate within"
+                                 f" {max_steps} steps")
+            # only the part of new that is not rewritten yet is searched
+            todo = [new]
+            while todo :
+                top = todo.pop()
+                ident = hc(top)
+                if ident in active :
+                    raise loop(top)
+                elif ident not in memo :
+                    todo.extend(top.children)
+            stack.extend([(node, 2, new), (new, 0, None)])
+        while stack :
+            node, phase, other = stack.pop()
+            ident = hc(node)
+            if phase == 2 :
+                memo[ident] = memo[hc(other)]
+                active.discard(ident)
+                continue
+            elif ident in memo :
+                continue
+            elif phase == 0 :
+                if ident in active :
+                    raise loop(node)
+                active.add(ident)
+                if topdown :
+                    new = self.apply(node, hc)
+                    if new is not None :
+                        step(node, new)
+                        continue
+                stack.append((node, 1, None))
+                stack.extend((child, 0, None) for child in node.children
+                             if hc(child) not in memo)
+                continue
+            children = [memo[hc(child)] for child in node.children]
+            done = node
+            if any(hc(new) != hc(old) for new, old in zip(children, node.children)) :
+                done = node.__class__(node.kind, *children, **node)
+                if topdown :
+                    stack.extend([(node, 2, done), (done, 0, None)])
+                    continue
+            if not topdown :
+                new = self.apply(done, hc)
+                if new is not None :
+                    step(node, new)
+                    continue
+            memo[ident] = memo[hc(done)] = done
+            active.discard(ident)
+        return memo[hc(phi)]
+    def rewrite_all (self, formulas, strategy="bottomup", max_steps=None) :
+        hc, memo = HashCons(), {}
+        for phi in formulas :
+            yield self.rewrite(phi, strategy, hc, memo, max_steps)
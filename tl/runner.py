@@ -0,0 +1,182 @@
+"""Run external model-checkers over many formulas
+
+A `Runner` drives a checker binary given as a command template in which
+`{model}` is replaced by the path of the model and `{props}` by the path of
+a property file (see `tl.its.PropertyFile`). Formulas are batched per model,
+batches are run by a bounded pool of subprocesses, and verdicts are streamed
+back as soon as a batch completes. Formulas that cannot be parsed or
+translated get a verdict with an error instead of a value. A batch whose run
+times out gets a "timeout" error for all its formulas, it is neither retried
+nor split. Verdicts may be stored in an on-disk cache keyed by the hash of
+the model file, the fingerprint of the formula and the tool.
+"""
+
+import collections, concurrent.futures, hashlib, os, re, shlex, sqlite3, \
+    subprocess, tempfile
+from . import parse
+from .its import PropertyFile
+from .tlparse import LarkError
+
+ITS_CTL = "its-ctl -i {model} -t GAL -ctl {props}"
+ITS_LTL = "its-ltl -i {model} -t GAL -LTL {props}"
+
+Verdict = collections.namedtuple("Verdict",
+                                 ["model", "phi", "tool", "value", "cached", "error"])
+
+class VerdictCache (object) :
+    def __init__ (self, path) :
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS verdicts"
+                        " (model TEXT, formula TEXT, tool TEXT, value INTEGER,"
+                        "  PRIMARY KEY (model, formula, tool))")
+        self.db.commit()
+    def get (self, model, formula, tool) :
+        row = self.db.execute("SELECT value FROM verdicts WHERE model=?"
+                              " AND formula=? AND tool=?",
+                              (model, formula, tool)).fetchone()
+        if row is not None :
+            return bool(row[0])
+    def put (self, model, formula, tool, value) :
+        self.db.execute("INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?)",
+                        (model, formula, tool, int(value)))
+        self.db.commit()
+    def close (self) :
+        self.db.close()
+
+def file_hash (path) :
+    digest = hashlib.sha1()
+    with open(path, "rb") as stream :
+        for block in iter(lambda: stream.read(1 << 16), b"") :
+            digest.update(block)
+    return digest.hexdigest()
+
+class Runner (object) :
+    _verdict = re.compile(r"^\s*Formula\s+(\d+)\s+is\s+(TRUE|FALSE)\b",
+                          re.MULTILINE | re.IGNORECASE)
+    def __init__ (self, command=ITS_CTL, syntax="ctl", tool=None, jobs=None,
+                  batch=100, timeout=None, cache=None, pattern=None,
+                  fingerprint=None, parser=parse) :
+        if isinstance(command, str) :
+            command = shlex.split(command)
+        self.command = list(command)
+        self.syntax = syntax
+        self.tool = tool or " ".join(self.command)
+        self.jobs = jobs or os.cpu_count() or 1
+        self.batch = batch
+        self.timeout = timeout
+        if isinstance(cache, str) :
+            cache = VerdictCache(cache)
+        self.cache = cache
+        if pattern is not None :
+            self._verdict = re.compile(pattern, re.MULTILINE)
+        self.fingerprint = fingerprint or (lambda phi : phi.canonical().fingerprint())
+        self.parser = parser
+        self._hashes = {}
+        # id(phi) => (fingerprint, count) of the formulas being checked
+        self._pending = {}
+    def model_hash (self, model) :
+        stat = os.stat(model)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._hashes.get(model, (None,))[0] != stamp :
+            self._hashes[model] = (stamp, file_hash(model))
+        return self._hashes[model][1]
+    def _batches (self, tasks) :
+        pending = collections.defaultdict(list)
+        for model, phi in tasks :
+            if isinstance(phi, str) :
+                try :
+                    phi = self.parser(phi)
+                except (LarkError, AssertionError, ValueError) as err :
+                    yield Verdict(model, phi, self.tool, None, False, str(err))
+                    continue
+            if self.cache is not None :
+                key = self.fingerprint(phi)
+                value = self.cache.get(self.model_hash(model), key, self.tool)
+                if value is not None :
+                    yield Verdict(model, phi, self.tool, value, True, None)
+                    continue
+                # kept until the verdicts are collected
+                count = self._pending.get(id(phi), (key, 0))[1]
+                self._pending[id(phi)] = (key, count + 1)
+            pending[model].append(phi)
+            if len(pending[model]) >= self.batch :
+                yield pending.pop(model), model
+        for model, formulas in pending.items() :
+            yield formulas, model
+    def _run (self, model, formulas) :
+        props = PropertyFile(syntax=self.syntax)
+        invalid = []
+        for phi in formulas :
+            try :
+                props.add(phi)
+            except ValueError as err :
+                invalid.append(Verdict(model, phi, self.tool, None, False, str(err)))
+        if not len(props) :
+            return invalid
+        fd, path = tempfile.mkstemp(suffix=f".{self.syntax}")
+        try :
+            with os.fdopen(fd, "w", encoding="utf-8") as stream :
+                props.write(stream)
+            argv = [arg.format(model=model, props=path) for arg in self.command]
+            try :
+                proc = subprocess.run(argv, stdout=subprocess.PIPE,
+                                      stderr=subprocess.STDOUT,
+                                      timeout=self.timeout,
+                                      universal_newlines=True)
+            except subprocess.TimeoutExpired :
+                return invalid + [Verdict(model, prop.phi, self.tool, None,
+                                          False, "timeout")
+                                  for prop in props]
+            except OSError as err :
+                return invalid + [Verdict(model, prop.phi, self.tool, None,
+                                          False, str(err))
+                                  for prop in props]
+        finally :
+            os.unlink(path)
+        values = {}
+        for match in self._verdict.finditer(proc.stdout) :
+            values[int(match.group(1))] = match.group(2).upper() == "TRUE"
+        if proc.returncode :
+            error = f"{argv[0]} exited with status {proc.returncode}"
+        else :
+            error = "no verdict"
+        return invalid + [Verdict(model, prop.phi, self.tool,
+                                  values.get(prop.index), False,
+                                  None if prop.index in values else error)
+                          for prop in props]
+    def run (self, tasks) :
+        if isinstance(tasks, dict) :
+            tasks = ((model, phi) for model, formulas in tasks.items()
+                     for phi in formulas)
+        with concurrent.futures.ThreadPoolExecutor(self.jobs) as pool :
+            running = set()
+            for item in self._batches(tasks) :
+                if isinstance(item, Verdict) :
+                    yield item
+                    continue
+                if len(running) >= 2 * self.jobs :
+                    done, running = concurrent.futures.wait(
+                        running, return_when=concurrent.futures.FIRST_COMPLETED)
+                    yield from self._collect(done)
+                formulas, model = item
+                running.add(pool.submit(self._run, model, formulas))
+            for future in concurrent.futures.as_completed(running) :
+                yield from self._collect([future])
+    def _collect (self, done) :
+        for future in done :
+            for verdict in future.result() :
+                key = self._unpend(verdict.phi)
+                if key is not None and verdict.value is not None :
+                    self.cache.put(self.model_hash(verdict.model), key,
+                                   self.tool, verdict.value)
+                yield verdict
+    def _unpend (self, phi) :
+        if id(phi) not in self._pending :
+            return None
+        key, count = self._pending[id(phi)]
+        if count > 1 :
+            self._pending[id(phi)] = (key, count - 1)
+        else :
+            del self._pending[id(phi)]
+        return key
@@ -0,0 +1,242 @@
+"""A small CDCL SAT solver
+
+`Solver` is a plain Python conflict-driven clause-learning solver, in the
+style of MiniSat: two watched literals per clause, learning of the first
+unique implication point with non-chronological backjumping, activity
+based branching with phase saving, and restarts. Variables are positive
+ints and literals are non-zero ints (DIMACS convention). Clauses may be
+added between calls to `solve(assumptions)` that tells whether the clauses
+are satisfiable when the literals in `assumptions` are true, so that it can
+be used incrementally (learnt clauses are kept from one call to the next).
+After a successful call, `model` maps every variable to its value.
+
+It is intended as a stand-in for real solvers on small problems (see
+`tl.bmc`), and `read(stream)` loads a DIMACS CNF (or incremental iCNF) file
+into a solver.
+"""
+
+import heapq
+
+class Solver (object) :
+    def __init__ (self) :
+        self.clauses = []
+        self.watches = {}
+        self.value = {}
+        self.level = {}
+        self.reason = {}
+        self.activity = {}
+        self.phase = {}
+        self.heap = []
+        self.trail = []
+        self.limits = []
+        self.head = 0
+        self.bump = 1.0
+        self.ok = True
+        self.model = None
+        self.conflicts = 0
+    ##
+    ## variables and clauses
+    ##
+    def _var (self, var) :
+        if var not in self.activity :
+            self.activity[var] = 0.0
+            self.watches[var] = []
+            self.watches[-var] = []
+            heapq.heappush(self.heap, (0.0, var))
+    def _val (self, lit) :
+        val = self.value.get(abs(lit))
+        if val is None :
+            return None
+        return val if lit > 0 else not val
+    def add (self, clause) :
+        if self.limits :
+            self._backtrack(0)
+        lits = set()
+        for lit in clause :
+            self._var(abs(lit))
+            if -lit in lits :
+                return
+            lits.add(lit)
+        lits = [lit for lit in lits if self._val(lit) is not False]
+        if not self.ok or any(self._val(lit) for lit in lits) :
+            return
+        elif not lits :
+            self.ok = False
+        elif len(lits) == 1 :
+            self._enqueue(lits[0], None)
+            self.ok = self._propagate() is None
+        else :
+            self._attach(lits)
+    def _attach (self, lits) :
+        self.clauses.append(lits)
+        self.watches[lits[0]].append(lits)
+        self.watches[lits[1]].append(lits)
+    ##
+    ## search
+    ##
+    def _enqueue (self, lit, reason) :
+        var = abs(lit)
+        self.value[var] = lit > 0
+        self.level[var] = len(self.limits)
+        self.reason[var] = reason
+        self.trail.append(lit)
+    def _propagate (self) :
+        # watches[lit] holds the clauses watching lit, visited when lit
+        # becomes false
+        while self.head < len(self.trail) :
+            false = -self.trail[self.head]
+            self.head += 1
+            watching = self.watches[false]
+            keep = []
+            conflict = None
+            for pos, clause in enumerate(watching) :
+                if clause[0] == false :
+                    clause[0], clause[1] = clause[1], false
+                if self._val(clause[0]) :
+                    keep.append(clause)
+                    continue
+                for num in range(2, len(clause)) :
+                    if self._val(clause[num]) is not False :
+                        clause[1], clause[num] = clause[num], false
+                        self.watches[clause[1]].append(clause)
+                        break
+                else :
+                    keep.append(clause)
+                    if self._val(clause[0]) is False :
+                        conflict = clause
+                        keep.extend(watching[pos + 1:])
+                        break
+                    self._enqueue(clause[0], clause)
+            self.watches[false] = keep
+            if conflict is not None :
+                return conflict
+    def _analyze (self, conflict) :
+        # first unique implication point, the asserting literal is first
+        # and a literal of the backjump level is second
+        seen = set()
+        learnt = [None]
+        count = 0
+        top = len(self.limits)
+        index = len(self.trail)
+        clause = conflict
+        lit = None
+        while True :
+            for other in clause :
+                var = abs(other)
+                if other == lit or var in seen or self.level[var] == 0 :
+                    continue
+                seen.add(var)
+                self._bump(var)
+                if self.level[var] == top :
+                    count += 1
+                else :
+                    learnt.append(other)
+            while True :
+                index -= 1
+                lit = self.trail[index]
+                if abs(lit) in seen :
+                    break
+            count -= 1
+            if not count :
+                break
+            clause = self.reason[abs(lit)]
+        learnt[0] = -lit
+        if len(learnt) == 1 :
+            return learnt, 0
+        best = max(range(1, len(learnt)), key=lambda n : self.level[abs(learnt[n])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self.level[abs(learnt[1])]
+    def _bump (self, var) :
+        self.activity[var] += self.bump
+        if self.activity[var] > 1e100 :
+            for other in self.activity :
+                self.activity[other] *= 1e-100
+            self.bump *= 1e-100
+            self.heap = [(-act, v) for v, act in self.activity.items()
+                         if v not in self.value]
+            heapq.heapify(self.heap)
+        elif var not in self.value :
+            heapq.heappush(self.heap, (-self.activity[var], var))
+    def _backtrack (self, level) :
+        if len(self.limits) <= level :
+            return
+        for lit in self.trail[self.limits[level]:] :
+            var = abs(lit)
+            self.phase[var] = lit > 0
+            del self.value[var]
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        del self.trail[self.limits[level]:]
+        del self.limits[level:]
+        self.head = len(self.trail)
+    def _decide (self) :
+        while self.heap :
+            act, var = heapq.heappop(self.heap)
+            if var not in self.value and -act == self.activity[var] :
+                return var if self.phase.get(var, False) else -var
+    def solve (self, assumptions=()) :
+        self.model = None
+        if not self.ok :
+            return False
+        for lit in assumptions :
+            self._var(abs(lit))
+        self._backtrack(0)
+        if self._propagate() is not None :
+            self.ok = False
+            return False
+        assumptions = list(assumptions)
+        limit = restart = 100
+        while True :
+            conflict = self._propagate()
+            if conflict is not None :
+                self.conflicts += 1
+                if not self.limits :
+                    self.ok = False
+                    return False
+                learnt, level = self._analyze(conflict)
+                self._backtrack(level)
+                if len(learnt) == 1 :
+                    self._enqueue(learnt[0], None)
+                else :
+                    self._attach(learnt)
+                    self._enqueue(learnt[0], learnt)
+                self.bump /= 0.95
+                restart -= 1
+                continue
+            elif restart <= 0 :
+                self._backtrack(0)
+                limit = restart = int(limit * 1.5)
+            level = len(self.limits)
+            if level < len(assumptions) :
+                lit = assumptions[level]
+                if self._val(lit) is False :
+                    self._backtrack(0)
+                    return False
+                self.limits.append(len(self.trail))
+                if self._val(lit) is None :
+                    self._enqueue(lit, None)
+                continue
+            lit = self._decide()
+            if lit is None :
+                self.model = dict(self.value)
+                self._backtrack(0)
+                return True
+            self.limits.append(len(self.trail))
+            self._enqueue(lit, None)
+
+def read (stream, solver=None) :
+    # clauses of a DIMACS CNF or iCNF stream, assumption lines are ignored
+    if solver is None :
+        solver = Solver()
+    clause = []
+    for line in stream :
+        line = line.strip()
+        if not line or line[0] in "cpa%" :
+            continue
+        for tok in line.split() :
+            lit = int(tok)
+            if lit :
+                clause.append(lit)
+            else :
+                solver.add(clause)
+                clause = []
+    return solver
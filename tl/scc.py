@@ -0,0 +1,67 @@
+"""Strongly connected components
+
+`tarjan(indptr, indices, roots)` computes the strongly connected components
+of a graph whose successor relation is given in CSR format (as in
+`tl.check.Kripke`), exploring it from the given roots (all the states by
+default). It is the usual Tarjan's algorithm in which the recursion is
+replaced by an explicit stack of pairs `(state, next edge)`, so that it is
+not bounded by Python's recursion limit. The result is a NumPy array that
+gives the number of the component of each state, or `-1` for the states
+that were not visited. Components are numbered in the order they are
+completed, which is a reverse topological order.
+"""
+
+import numpy
+
+def tarjan (indptr, indices, roots=None) :
+    size = len(indptr) - 1
+    ptr = numpy.asarray(indptr).tolist()
+    succ = numpy.asarray(indices).tolist()
+    if roots is None :
+        roots = range(size)
+    else :
+        roots = numpy.asarray(roots).tolist()
+    index = [-1] * size
+    low = [0] * size
+    comp = [-1] * size
+    stack = []
+    count = 0
+    found = 0
+    for root in roots :
+        if index[root] >= 0 :
+            continue
+        index[root] = low[root] = count
+        count += 1
+        stack.append(root)
+        calls = [(root, ptr[root])]
+        while calls :
+            state, edge = calls[-1]
+            end = ptr[state + 1]
+            while edge < end :
+                target = succ[edge]
+                edge += 1
+                if index[target] < 0 :
+                    # descend into target, resume state at edge later on
+                    calls[-1] = (state, edge)
+                    index[target] = low[target] = count
+                    count += 1
+                    stack.append(target)
+                    calls.append((target, ptr[target]))
+                    break
+                elif comp[target] < 0 and index[target] < low[state] :
+                    # target is still on the stack
+                    low[state] = index[target]
+            else :
+                calls.pop()
+                if low[state] == index[state] :
+                    while True :
+                        top = stack.pop()
+                        comp[top] = found
+                        if top == state :
+                            break
+                    found += 1
+                if calls :
+                    parent = calls[-1][0]
+                    if low[state] < low[parent] :
+                        low[parent] = low[state]
+    return numpy.array(comp, dtype=numpy.int64)
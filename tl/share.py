@@ -0,0 +1,76 @@
+"""Extraction of common sub-formulas
+
+`share(phi, min_size)` hash-conses `phi` into a DAG in which structurally
+equal sub-formulas are the same object, and names the sub-formulas that are
+referenced several times in this DAG and whose size (number of nodes when
+expanded as a tree) is at least `min_size`, except for the path formulas
+directly under a quantifier (like `F p` in `A F p`) that are never named.
+The result is a `Shared` instance that translates the DAG, each shared
+sub-formula being translated once and inlined at all its occurrences.
+"""
+
+from .hashcons import HashCons
+
+class Shared (object) :
+    def __init__ (self, root, defs, tree_size) :
+        self.root = root
+        self.defs = defs
+        self.names = {id(node) : name for name, node in defs}
+        self.tree_size = tree_size
+        seen = set()
+        stack = [root]
+        while stack :
+            node = stack.pop()
+            if id(node) not in seen :
+                seen.add(id(node))
+                stack.extend(node.children)
+        self.dag_size = len(seen)
+    def __getitem__ (self, name) :
+        for key, node in self.defs :
+            if key == name :
+                return node
+        raise KeyError(name)
+    def stats (self) :
+        return {"tree_size" : self.tree_size,
+                "dag_size" : self.dag_size,
+                "definitions" : len(self.defs),
+                "ratio" : self.dag_size / self.tree_size}
+    def emit (self, syntax) :
+        root = self.root
+        root._memo = {}
+        try :
+            return getattr(root, syntax)()
+        finally :
+            del root._memo
+
+def share (phi, min_size=2, prefix="_d") :
+    hc = HashCons()
+    size = {}
+    dag = {}
+    refs = {}
+    order = []
+    quantified = set()
+    count = 0
+    for node in phi._postorder() :
+        count += 1
+        ident = hc(node)
+        if ident in dag :
+            continue
+        children = [dag[hc(child)] for child in node.children]
+        size[ident] = 1 + sum(size[hc(child)] for child in node.children)
+        if all(new is old for new, old in zip(children, node.children)) :
+            dag[ident] = node
+        else :
+            dag[ident] = node.__class__(node.kind, *children, **node)
+        for child in node.children :
+            key = hc(child)
+            refs[key] = refs.get(key, 0) + 1
+            if node.kind in ("A", "E") :
+                quantified.add(key)
+        order.append(ident)
+    defs = []
+    for ident in order :
+        if (refs.get(ident, 0) > 1 and size[ident] >= min_size
+            and ident not in quantified) :
+            defs.append((f"{prefix}{len(defs)}", dag[ident]))
+    return Shared(dag[hc(phi)], defs, count)
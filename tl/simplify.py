@@ -0,0 +1,280 @@
+"""Simplification of formulas
+
+`Simplifier` rewrites a formula bottom-up using a set of named rules, each
+of which strictly decreases the size of the formula so that rewriting
+terminates. Nodes are hash-consed and simplified once, so that the result
+is reached in one pass that is linear in the size of the formula (plus the
+rewriting steps). The rules are:
+
+ - `not-const`: `~True` is `False`, `~False` is `True`
+ - `not-not`: `~~p` is `p`
+ - `flatten`: `p & (q & r)` is `p & q & r`, and so for `|`
+ - `const`: `p & True` is `p`, `p & False` is `False`, and so for `|`
+ - `idempotence`: `p & p` is `p`, and so for `|`
+ - `complement`: `p & ~p` is `False`, `p | ~p` is `True`
+ - `absorption`: `p & (p | q)` is `p`, `p | (p & q)` is `p`
+ - `imply-const`: `True => p` is `p`, `False => p` is `True`, `p => True`
+   is `True`, `p => False` is `~p`, `p => p` is `True`
+ - `iff-const`: `True <=> p` is `p`, `False <=> p` is `~p`, `p <=> p` is
+   `True`
+ - `temporal-const`: `X`, `F`, `G`, `A`, and `E` applied to `True` or
+   `False` are `True` or `False`
+ - `temporal-idempotence`: `F F p` is `F p`, `G G p` is `G p`, `F G F p`
+   is `G F p`, `G F G p` is `F G p`, `Q Q' p` is `Q' p` for quantifiers
+   `Q` and `Q'`, `Q G Q G p` is `Q G p` and `Q F Q F p` is `Q F p` for
+   the same quantifier `Q`
+ - `until-const`: identities of `U`, `R`, `W`, and `M` with `True`,
+   `False` or equal operands, like `p U True` that is `True`, `True U p`
+   that is `F p`, `p R p` that is `p`, etc.
+ - `quantifier`: `A p` and `E p` are `p` when `p` is a state formula, that
+   is when all its temporal operators are below nested quantifiers (for
+   instance after `A (p U p)` has been simplified to `A p`), so that CTL
+   formulas remain CTL formulas, while quantifiers over Boolean
+   combinations of path formulas like `E (G p & G q)` are kept
+
+Temporal rules are never applied to nodes that have actions or fairness
+constraints. Moreover, since a quantifier with actions or fairness
+constraints cannot be removed, the path formula below it is never
+simplified into a state formula. If `fired` is given, it counts the
+rewrites the result is built from, each distinct sub-formula being
+rewritten once.
+"""
+
+from . import _has_actions, _has_fairness
+from .hashcons import HashCons
+
+PATH = ("X", "F", "G", "U", "R", "W", "M")
+
+def _plain (node) :
+    return not (_has_actions(node) or _has_fairness(node))
+
+def _isbool (node, value) :
+    return node.kind == "bool" and node.value is value
+
+def _bool (node, value) :
+    return node.__class__("bool", value=value)
+
+def _not_const (node, hc) :
+    child = node.children[0]
+    if child.kind == "bool" :
+        return _bool(node, not child.value)
+
+def _not_not (node, hc) :
+    if node.children[0].kind == "not" :
+        return node.children[0].children[0]
+
+def _flatten (node, hc) :
+    if any(child.kind == node.kind for child in node.children) :
+        children = []
+        for child in node.children :
+            if child.kind == node.kind :
+                children.extend(child.children)
+            else :
+                children.append(child)
+        return node.__class__(node.kind, *children, **node)
+
+def _const (node, hc) :
+    zero = node.kind == "or"
+    if any(_isbool(child, zero) for child in node.children) :
+        return _bool(node, zero)
+    elif any(_isbool(child, not zero) for child in node.children) :
+        children = [child for child in node.children
+                    if not _isbool(child, not zero)]
+        if not children :
+            return _bool(node, not zero)
+        return node.__class__(node.kind, *children, **node)
+    elif len(node.children) == 1 :
+        return node.children[0]
+
+def _idempotence (node, hc) :
+    seen = set()
+    children = []
+    for child in node.children :
+        ident = hc(child)
+        if ident not in seen :
+            seen.add(ident)
+            children.append(child)
+    if len(children) < len(node.children) :
+        return node.__class__(node.kind, *children, **node)
+
+def _complement (node, hc) :
+    idents = {hc(child) for child in node.children}
+    for child in node.children :
+        if child.kind == "not" and hc(child.children[0]) in idents :
+            return _bool(node, node.kind == "or")
+
+def _absorption (node, hc) :
+    dual = "or" if node.kind == "and" else "and"
+    idents = {hc(child) for child in node.children}
+    children = [child for child in node.children
+                if not (child.kind == dual
+                        and any(hc(sub) in idents for sub in child.children))]
+    if len(children) < len(node.children) :
+        return node.__class__(node.kind, *children, **node)
+
+def _imply_const (node, hc) :
+    left, right = node.children
+    if _isbool(left, True) :
+        return right
+    elif _isbool(left, False) or _isbool(right, True) or hc(left) == hc(right) :
+        return _bool(node, True)
+    elif _isbool(right, False) :
+        return node.__class__("not", left)
+
+def _iff_const (node, hc) :
+    if len(node.children) != 2 :
+        return
+    left, right = node.children
+    if hc(left) == hc(right) :
+        return _bool(node, True)
+    for one, other in ((left, right), (right, left)) :
+        if _isbool(one, True) :
+            return other
+        elif _isbool(one, False) :
+            return node.__class__("not", other)
+
+def _temporal_const (node, hc) :
+    if _plain(node) and node.children[0].kind == "bool" :
+        return node.children[0]
+
+def _temporal_idempotence (node, hc) :
+    if not _plain(node) :
+        return
+    child = node.children[0]
+    if not _plain(child) :
+        return
+    if node.kind in "AE" :
+        if child.kind in "AE" :
+            return child
+        elif (child.kind in "FG" and child.children[0].kind == node.kind
+              and _plain(child.children[0])) :
+            grand = child.children[0].children[0]
+            if grand.kind == child.kind and _plain(grand) :
+                return child.children[0]
+    elif child.kind == node.kind :
+        return child
+    elif child.kind in "FG" and child.kind != node.kind :
+        grand = child.children[0]
+        if grand.kind == node.kind and _plain(grand) :
+            return child
+
+def _until_const (node, hc) :
+    if not _plain(node) :
+        return
+    left, right = node.children
+    if hc(left) == hc(right) :
+        return right
+    strong = node.kind in "UM"
+    if node.kind in "UW" :
+        if _isbool(right, True) :
+            return right
+        elif _isbool(left, False) :
+            return right
+        elif node.kind == "U" and _isbool(right, False) :
+            return right
+        elif node.kind == "U" and _isbool(left, True) :
+            return node.__class__("F", right)
+        elif node.kind == "W" and _isbool(right, False) :
+            return node.__class__("G", left)
+    else :
+        if _isbool(right, False) :
+            return right
+        elif _isbool(left, True) :
+            return right
+        elif node.kind == "R" and _isbool(right, True) :
+            return right
+        elif node.kind == "R" and _isbool(left, False) :
+            return node.__class__("G", right)
+        elif node.kind == "M" and _isbool(right, True) :
+            return node.__class__("F", left)
+
+def _state (node) :
+    # no temporal operator outside of a nested quantifier
+    stack = [node]
+    while stack :
+        top = stack.pop()
+        if top.kind in PATH :
+            return False
+        elif top.kind not in ("A", "E") :
+            stack.extend(top.children)
+    return True
+
+def _quantifier (node, hc) :
+    child = node.children[0]
+    if _plain(node) and _state(child) :
+        return child
+
+RULES = {"not-const" : ("not", _not_const),
+         "not-not" : ("not", _not_not),
+         "flatten" : ("and or", _flatten),
+         "const" : ("and or", _const),
+         "idempotence" : ("and or", _idempotence),
+         "complement" : ("and or", _complement),
+         "absorption" : ("and or", _absorption),
+         "imply-const" : ("imply", _imply_const),
+         "iff-const" : ("iff", _iff_const),
+         "temporal-const" : ("X F G A E", _temporal_const),
+         "temporal-idempotence" : ("F G A E", _temporal_idempotence),
+         "until-const" : ("U R W M", _until_const),
+         "quantifier" : ("A E", _quantifier)}
+
+class Simplifier (object) :
+    def __init__ (self, rules=None) :
+        if rules is None :
+            rules = RULES
+        self.rules = {}
+        for name in rules :
+            if name not in RULES :
+                raise ValueError(f"unknown simplification rule {name!r}")
+            kinds, rule = RULES[name]
+            for kind in kinds.split() :
+                self.rules.setdefault(kind, []).append((name, rule))
+    def __call__ (self, phi, fired=None) :
+        hc = HashCons()
+        memo = {}
+        # ident => (rules fired on the node, idents its result is built from)
+        trace = {}
+        rules = self.rules
+        def norm (node) :
+            ident = hc(node)
+            done = memo.get(ident)
+            if done is not None :
+                return done
+            subs = node.children
+            children = tuple(norm(child) for child in subs)
+            if node.kind in ("A", "E") and not _plain(node) :
+                old, new = node.children[0], children[0]
+                if old.kind in PATH and new.kind not in PATH :
+                    # keep a path formula, only its operands are simplified
+                    subs = old.children
+                    children = (old.__class__(old.kind, *(norm(sub) for sub in subs),
+                                              **old),)
+            if any(new is not old for new, old in zip(children, node.children)) :
+                node = node.__class__(node.kind, *children, **node)
+            names, deps = [], [hc(sub) for sub in subs]
+            for name, rule in rules.get(node.kind, ()) :
+                result = rule(node, hc)
+                if result is not None :
+                    names.append(name)
+                    node = norm(result)
+                    deps.append(hc(result))
+                    break
+            memo[ident] = memo[hc(node)] = node
+            trace[ident] = (names, deps)
+            trace.setdefault(hc(node), ((), ()))
+            return node
+        for node in phi._postorder() :
+            norm(node)
+        if fired is not None :
+            # only the rewrites the result is built from are counted
+            seen = set()
+            stack = [hc(phi)]
+            while stack :
+                ident = stack.pop()
+                if ident not in seen :
+                    seen.add(ident)
+                    names, deps = trace[ident]
+                    for name in names :
+                        fired[name] = fired.get(name, 0) + 1
+                    stack.extend(deps)
+        return memo[hc(phi)]
@@ -0,0 +1,350 @@
+"""Symbolic CTL model-checking
+
+A `Model` is a transition system whose sets of states and transitions are
+represented as BDDs (see `tl.bdd`): a state is a valuation of the
+`variables`, each of which has a primed copy `name'` for the target state
+of transitions. If the model has an `alphabet`, the action of each
+transition is encoded in binary by additional variables (`@0`, `@1`, etc.)
+that are shared by both copies. Unless the variables have already been
+declared in the manager (which allows to choose their order), the action
+variables are declared first and every variable is declared just before
+its primed copy, an order under which renaming from one copy to the other
+does not reorder nodes. Attribute `init` is the set of initial states,
+`trans` the transition relation (to which `add(relation, action=None)` adds
+transitions, labelled by `action` if the model has an alphabet), `labels`
+maps atoms to sets of states (atoms that are not labels are looked up among
+the variables), and `states` is the set of the states of the model (all the
+valuations by default).
+
+A `Checker` evaluates the formulas returned by `Phi.ctl()` (or
+`Phi.arctl()` if the model has actions) like `tl.check.Checker` does on
+explicit structures: satisfaction sets are BDDs memoized through
+hash-consing, and the operators are reduced to `EX` (the pre-image through
+the relational product of the transition relation and the renamed set),
+and to the fixpoints `EU` and `EG`. Action formulas are compiled (by
+`tl.actions.ActionCompiler`) into the sets of actions they accept, that
+restrict the transition relation. Fair `EG` is computed by the Emerson-Lei fixpoint, with
+fairness conditions seen as sets of transitions, strong fairness being
+split into paths that satisfy its `then` infinitely often and paths that
+end up avoiding its condition. The successor relation is expected to be
+total within `states`.
+
+`encode(kripke)` builds the `Model` of an explicit `tl.check.Kripke` (or
+`LTS`) by encoding state numbers in binary.
+"""
+
+import functools
+from . import parse
+from .hashcons import HashCons
+from .actions import ActionCompiler
+from .bdd import BDD
+
+class Model (object) :
+    def __init__ (self, variables, bdd=None, alphabet=()) :
+        if bdd is None :
+            bdd = BDD()
+        self.bdd = bdd
+        self.variables = list(variables)
+        self.primed = [f"{name}'" for name in self.variables]
+        # actions are encoded in binary by the letter variables
+        self.alphabet = list(alphabet)
+        width = (len(self.alphabet) - 1).bit_length() if self.alphabet else 0
+        self.letters = [f"@{num}" for num in range(width)]
+        bdd.declare(*(v for v in self.letters if v not in bdd.index))
+        for name, prime in zip(self.variables, self.primed) :
+            bdd.declare(*(v for v in (name, prime) if v not in bdd.index))
+        self.current = bdd.cube(self.variables + self.letters)
+        self.next = bdd.cube(self.primed + self.letters)
+        self.prime = dict(zip(self.variables, self.primed))
+        self.unprime = dict(zip(self.primed, self.variables))
+        self.codes = {name : bdd.cube({letter : bool(num >> pos & 1)
+                                       for pos, letter in enumerate(self.letters)})
+                      for num, name in enumerate(self.alphabet)}
+        self.init = bdd.true
+        self.states = bdd.true
+        self.trans = bdd.false
+        self.labels = {}
+    def var (self, name, primed=False) :
+        if name not in self.prime :
+            raise ValueError(f"unknown variable {name!r}")
+        return self.bdd.var(self.prime[name] if primed else name)
+    def state (self, values, primed=False) :
+        # values maps variables to Booleans
+        if primed :
+            values = {self.prime[name] : value for name, value in values.items()}
+        return self.bdd.cube(values)
+    def action (self, names) :
+        # set of actions, as a function of the letters
+        act = self.bdd.false
+        for name in names :
+            if name not in self.codes :
+                raise ValueError(f"unknown action {name!r}")
+            act |= self.codes[name]
+        return act
+    def add (self, relation, action=None) :
+        if self.alphabet :
+            if action is None :
+                raise ValueError("missing action")
+            relation = relation & self.action([action])
+        elif action is not None :
+            raise ValueError("model has no actions")
+        self.trans |= relation
+    def image (self, states, trans=None) :
+        if trans is None :
+            trans = self.trans
+        return self.bdd.rename(self.bdd.and_exist(trans, states, self.current),
+                               self.unprime)
+    def preimage (self, states, trans=None) :
+        if trans is None :
+            trans = self.trans
+        return self.bdd.and_exist(trans, self.bdd.rename(states, self.prime),
+                                  self.next)
+    def reachable (self) :
+        reach = frontier = self.init
+        while frontier != self.bdd.false :
+            frontier = self.image(frontier) & ~reach
+            reach |= frontier
+        return reach
+    def count (self, states) :
+        return self.bdd.count(states, self.variables)
+
+def encode (kripke, bdd=None) :
+    size = kripke.size
+    bits = max(1, (size - 1).bit_length())
+    model = Model([f"s{num}" for num in range(bits)], bdd,
+                  getattr(kripke, "alphabet", ()))
+    def code (num) :
+        return {name : bool(num >> pos & 1)
+                for pos, name in enumerate(model.variables)}
+    cur = [model.state(code(num)) for num in range(size)]
+    nxt = [model.state(code(num), True) for num in range(size)]
+    false = model.bdd.false
+    model.states = functools.reduce(lambda a, b : a | b, cur, false)
+    model.init = functools.reduce(lambda a, b : a | b,
+                                  (cur[num] for num in kripke.initial), false)
+    for name, value in kripke.labels.items() :
+        model.labels[name] = functools.reduce(lambda a, b : a | b,
+                                              (cur[num] for num in value.nonzero()[0]),
+                                              false)
+    actions = getattr(kripke, "actions", None)
+    if actions is None :
+        for src, dst in zip(kripke.src, kripke.indices) :
+            model.add(cur[src] & nxt[dst])
+    else :
+        for src, dst, act in zip(kripke.src, kripke.indices, actions) :
+            model.add(cur[src] & nxt[dst], kripke.alphabet[act])
+    return model
+
+class Checker (object) :
+    def __init__ (self, model) :
+        self.model = model
+        self.bdd = model.bdd
+        self.hc = HashCons()
+        self.cache = {}
+        self.true = model.states
+        self.false = model.bdd.false
+        if model.alphabet :
+            self.compiler = ActionCompiler(model.alphabet, "bitset")
+        else :
+            self.compiler = None
+        self.sets = {}
+        self.relations = {}
+        self.constraints = {}
+        self.fair = {}
+    def __call__ (self, phi) :
+        hc, cache = self.hc, self.cache
+        ident = hc(phi)
+        if ident not in cache :
+            for node in phi._postorder() :
+                key = hc(node)
+                if key not in cache :
+                    cache[key] = self._sat(node, [cache[hc(child)]
+                                                  for child in node.children])
+        return cache[ident]
+    def _sat (self, node, args) :
+        handler = getattr(self, f"_sat_{node.kind}", None)
+        if handler is None :
+            raise ValueError(f"cannot check {node.kind!r}")
+        return handler(node, *args)
+    def letters (self, actions) :
+        # set of the actions accepted by action formula actions
+        if self.compiler is None :
+            raise ValueError("actions require a model with actions")
+        key = self.compiler.hc(actions)
+        if key not in self.sets :
+            bits = self.compiler(actions)
+            self.sets[key] = self.model.action(
+                name for num, name in enumerate(self.compiler.alphabet)
+                if bits >> num & 1)
+        return self.sets[key]
+    def relation (self, actions) :
+        # transitions labelled by the actions accepted by action formula
+        if actions is None :
+            return self.model.trans
+        key = self.compiler.hc(actions) if self.compiler is not None else None
+        if key not in self.relations :
+            self.relations[key] = self.model.trans & self.letters(actions)
+        return self.relations[key]
+    def fairness (self, node) :
+        # key of the fairness constraints of node, that are compiled into
+        # triples (kind, condition, then) where conditions are either sets
+        # of states or sets of actions (both restrict transitions when
+        # conjoined with them)
+        fair = [(kind, f) for kind in ("ufair", "wfair", "sfair")
+                for f in node.get(kind) or ()]
+        if not fair :
+            return None
+        key = tuple(sorted({(kind, self.hc(f)) for kind, f in fair}))
+        if key not in self.constraints :
+            self.constraints[key] = [(kind, self._condition(f.condition),
+                                      self._condition(f.then))
+                                     for kind, f in fair]
+        return key
+    def _condition (self, phi) :
+        if phi is None :
+            return None
+        elif phi.kind == "actions" :
+            return self.letters(phi)
+        return self(phi)
+    def _neg (self, sat) :
+        return self.true & ~sat
+    ##
+    ## primitives
+    ##
+    def ex (self, sat, trans=None) :
+        return self.model.preimage(sat, trans)
+    def eu (self, left, right, trans=None) :
+        reach = frontier = right
+        while frontier != self.false :
+            frontier = left & self.ex(frontier, trans) & ~reach
+            reach |= frontier
+        return reach
+    def eg (self, sat, trans=None) :
+        keep = sat
+        while True :
+            new = keep & self.ex(keep, trans)
+            if new == keep :
+                return keep
+            keep = new
+    def fair_eg (self, sat, trans, constraints) :
+        if trans is None :
+            trans = self.model.trans
+        justice, compassion = [], []
+        for kind, cond, then in constraints :
+            if kind == "ufair" :
+                justice.append(trans & then)
+            elif kind == "wfair" :
+                justice.append(trans & (~cond | then))
+            else :
+                compassion.append((cond, then))
+        return self._fair_eg(sat, trans, justice, compassion)
+    def _fair_eg (self, sat, trans, justice, compassion) :
+        if compassion :
+            # either then infinitely often, or eventually never cond
+            (cond, then), rest = compassion[0], compassion[1:]
+            often = self._fair_eg(sat, trans, justice + [trans & then], rest)
+            avoid = trans & ~cond
+            never = self._fair_eg(sat, avoid, [j & avoid for j in justice], rest)
+            return often | self.eu(sat, never, trans)
+        elif not justice :
+            return self.eg(sat, trans)
+        # Emerson-Lei: each justice transition is taken within keep
+        keep = sat
+        while True :
+            new = keep
+            for edges in justice :
+                new &= self.eu(keep, keep & self.ex(keep, edges), trans)
+            if new == keep :
+                return keep
+            keep = new
+    def _eg_fair (self, key, actions, sat) :
+        # memoized for all the nodes with the same fairness and actions
+        akey = None if actions is None else self.compiler.hc(actions)
+        mkey = (key, akey, sat)
+        if mkey not in self.fair :
+            self.fair[mkey] = self.fair_eg(sat, self.relation(actions),
+                                           self.constraints[key])
+        return self.fair[mkey]
+    def _ex (self, node, sat) :
+        key = self.fairness(node)
+        if key is not None :
+            sat = sat & self._eg_fair(key, node.actions, self.true)
+        return self.ex(sat, self.relation(node.actions))
+    def _eu (self, node, left, right) :
+        key = self.fairness(node)
+        if key is not None :
+            right = right & self._eg_fair(key, node.actions, self.true)
+        return self.eu(left, right, self.relation(node.actions))
+    def _eg (self, node, sat) :
+        key = self.fairness(node)
+        if key is not None :
+            return self._eg_fair(key, node.actions, sat)
+        return self.eg(sat, self.relation(node.actions))
+    ##
+    ## state formulas
+    ##
+    def _sat_name (self, node) :
+        if node.value in self.model.labels :
+            return self.true & self.model.labels[node.value]
+        elif node.value in self.model.prime :
+            return self.true & self.model.var(node.value)
+        raise ValueError(f"unknown atom {node.value!r}")
+    def _sat_bool (self, node) :
+        return self.true if node.value else self.false
+    def _sat_not (self, node, sat) :
+        return self._neg(sat)
+    def _sat_and (self, node, *sats) :
+        return functools.reduce(lambda a, b : a & b, sats)
+    def _sat_or (self, node, *sats) :
+        return functools.reduce(lambda a, b : a | b, sats)
+    def _sat_imply (self, node, left, right) :
+        return self._neg(left) | right
+    def _sat_iff (self, node, first, *rest) :
+        for sat in rest :
+            first = self._neg(first ^ sat)
+        return first
+    ##
+    ## temporal formulas
+    ##
+    def _sat_EX (self, node, sat) :
+        return self._ex(node, sat)
+    def _sat_AX (self, node, sat) :
+        return self._neg(self._ex(node, self._neg(sat)))
+    def _sat_EF (self, node, sat) :
+        return self._eu(node, self.true, sat)
+    def _sat_AF (self, node, sat) :
+        return self._neg(self._eg(node, self._neg(sat)))
+    def _sat_EG (self, node, sat) :
+        return self._eg(node, sat)
+    def _sat_AG (self, node, sat) :
+        return self._neg(self._eu(node, self.true, self._neg(sat)))
+    def _sat_EU (self, node, left, right) :
+        return self._eu(node, left, right)
+    def _sat_AU (self, node, left, right) :
+        nleft, nright = self._neg(left), self._neg(right)
+        return self._neg(self._eu(node, nright, nleft & nright)
+                         | self._eg(node, nright))
+    def _sat_ER (self, node, left, right) :
+        # p R q = ~(~p U ~q)
+        return self._neg(self._sat_AU(node, self._neg(left), self._neg(right)))
+    def _sat_AR (self, node, left, right) :
+        return self._neg(self._eu(node, self._neg(left), self._neg(right)))
+    def _sat_EW (self, node, left, right) :
+        # p W q = (p U q) | G p
+        return self._eu(node, left, right) | self._eg(node, left)
+    def _sat_AW (self, node, left, right) :
+        nright = self._neg(right)
+        return self._neg(self._eu(node, nright, self._neg(left) & nright))
+    def _sat_EM (self, node, left, right) :
+        # p M q = q U (p & q)
+        return self._eu(node, right, left & right)
+    def _sat_AM (self, node, left, right) :
+        return self._sat_AU(node, right, left & right)
+
+def check (phi, model, syntax="ctl") :
+    if syntax not in ("ctl", "arctl") :
+        raise ValueError(f"unsupported syntax {syntax!r}")
+    elif isinstance(phi, str) :
+        phi = parse(phi)
+    sat = Checker(model)(getattr(phi, syntax)())
+    return (model.init & ~sat) == model.bdd.false
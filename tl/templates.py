@@ -0,0 +1,141 @@
+"""Formula templates
+
+A template is a formula in which some atoms are variables written `$name`
+(parsed as `var` nodes). It is parsed once, and then instantiated by
+substituting values to its variables: a value may be a string, that is
+replaced by an atom with this name, or a `Phi` that is inserted as is.
+Instances share with the template all the sub-formulas that contain no
+variable, and only the nodes from the root to the variables are rebuilt.
+
+Translations to the ITS-tools syntaxes may be emitted directly without
+building the instances: the template is translated once with placeholders
+for its variables, and the resulting text is cut into segments that are
+then joined with the translated values. Note that the template itself is
+checked against the syntax but values that are formulas are not checked in
+their context, so they are translated from a full instance.
+"""
+
+from . import Phi, parse
+
+class Template (object) :
+    def __init__ (self, text, parser=parse) :
+        self.text = text
+        self.phi = phi = parser(text) if isinstance(text, str) else text
+        self.variables = []
+        # nodes that lead to a variable, in post-order
+        self._spine = []
+        has = {}
+        stack = [(phi, False)]
+        while stack :
+            node, ready = stack.pop()
+            if id(node) in has :
+                continue
+            elif node.kind == "var" :
+                has[id(node)] = True
+                self._spine.append(node)
+                if node.value not in self.variables :
+                    self.variables.append(node.value)
+            elif ready :
+                has[id(node)] = any(has[id(sub)] for sub in self._subterms(node))
+                if has[id(node)] :
+                    self._spine.append(node)
+            else :
+                stack.append((node, True))
+                stack.extend((sub, False) for sub in reversed(self._subterms(node)))
+        self._names = {}
+        self._segments = {}
+    def __repr__ (self) :
+        return f"{self.__class__.__name__}({self.text!r})"
+    def _subterms (self, node) :
+        subs = list(node.children)
+        for key in sorted(node.keys()) :
+            value = node[key]
+            if isinstance(value, Phi) :
+                subs.append(value)
+            elif isinstance(value, list) :
+                subs.extend(v for v in value if isinstance(v, Phi))
+        return subs
+    def _values (self, row, kw) :
+        if isinstance(row, dict) :
+            values = dict(row, **kw)
+        else :
+            if len(row) != len(self.variables) :
+                raise ValueError(f"expected {len(self.variables)} values,"
+                                 f" got {len(row)}")
+            values = dict(zip(self.variables, row), **kw)
+        for name in self.variables :
+            if name not in values :
+                raise ValueError(f"missing value for ${name}")
+        for name in values :
+            if name not in self.variables :
+                raise ValueError(f"unknown variable ${name}")
+        return values
+    def _name (self, value) :
+        # atoms are shared by all the instances
+        if isinstance(value, Phi) :
+            return value
+        elif value not in self._names :
+            self._names[value] = self.phi.__class__("name", value=value)
+        return self._names[value]
+    def _get (self, value, done) :
+        if isinstance(value, Phi) :
+            return done.get(id(value), value)
+        elif isinstance(value, list) :
+            return [done.get(id(v), v) if isinstance(v, Phi) else v
+                    for v in value]
+        return value
+    def _instantiate (self, values) :
+        done = {}
+        for node in self._spine :
+            if node.kind == "var" :
+                done[id(node)] = self._name(values[node.value])
+            else :
+                done[id(node)] = node.__class__(
+                    node.kind,
+                    *(self._get(child, done) for child in node.children),
+                    **{key : self._get(value, done)
+                       for key, value in node.items()})
+        return done.get(id(self.phi), self.phi)
+    def instantiate (self, row=(), **kw) :
+        return self._instantiate(self._values(row or {}, kw))
+    def instantiate_many (self, rows) :
+        for row in rows :
+            yield self._instantiate(self._values(row, {}))
+    def segments (self, syntax) :
+        if syntax not in self._segments :
+            phi = self.phi
+            # one mark per occurrence (spine position) of each variable
+            cuts = {}
+            phi._memo = memo = {}
+            try :
+                for num, node in enumerate(self._spine) :
+                    if node.kind == "var" :
+                        cuts[str(num)] = node.value
+                        memo[syntax, id(node)] = f"\0{num}\0"
+                text = getattr(phi, syntax)()
+            finally :
+                del phi._memo
+            parts = text.split("\0")
+            # parts alternate text and mark numbers
+            self._segments[syntax] = (parts[::2], [cuts[p] for p in parts[1::2]])
+        return self._segments[syntax]
+    def _emit (self, syntax, values) :
+        if any(isinstance(v, Phi) for v in values.values()) :
+            return getattr(self._instantiate(values), syntax)()
+        texts, names = self.segments(syntax)
+        trans = {name : self.phi(syntax, self._name(value))
+                 for name, value in values.items()}
+        out = [texts[0]]
+        for name, text in zip(names, texts[1:]) :
+            out.append(trans[name])
+            out.append(text)
+        return "".join(out)
+    def emit (self, syntax, row=(), **kw) :
+        return self._emit(syntax, self._values(row or {}, kw))
+    def emit_many (self, syntax, rows) :
+        for row in rows :
+            yield self._emit(syntax, self._values(row, {}))
+    def its_ctl (self, row=(), **kw) :
+        return self.emit("its_ctl", row, **kw)
+    def its_ltl (self, row=(), **kw) :
+        return self.emit("its_ltl", row, **kw)
@@ -2798,10 +2798,10 @@ class Indenter(PostLex):
 
 import pickle, zlib, base64
 DATA = (
-{'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}], 'ignore': ['WS'], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}], 'start': ['start'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'restrict', 1: 'LBRACE', 2: 'act', 3: 'LSQB', 4: '__restrict_plus_2', 5: 'fair', 6: 'UMOD', 7: 'LPAR', 8: 'TILDE', 9: 'ATOM', 10: 'sub', 11: 'BOOL', 12: 'RBRACE', 13: 'RSQB', 14: 'exp', 15: '__phi_star_1', 16: 'phi', 17: 'bool', 18: 'THEN', 19: '$END', 20: 'RPAR', 21: 'BMOD', 22: 'FAIR', 23: '__bool_star_0', 24: '__act_star_3', 25: 'start'}, 'states': {0: {0: (0, 65), 1: (0, 10), 2: (0, 45), 3: (0, 22), 4: (0, 17), 5: (0, 59), 6: (1, {'@': 46}), 7: (1, {'@': 46}), 8: (1, {'@': 46}), 9: (1, {'@': 46})}, 1: {8: (0, 33), 1: (0, 10), 10: (0, 42), 2: (0, 19), 9: (0, 30), 7: (0, 26)}, 2: {11: (0, 24), 12: (0, 56)}, 3: {13: (0, 20)}, 4: {8: (0, 33), 6: (0, 0), 10: (0, 70), 9: (0, 30), 7: (0, 26)}, 5: {7: (0, 61), 9: (0, 46), 8: (0, 5), 14: (0, 50)}, 6: {8: (0, 33), 15: (0, 4), 10: (0, 34), 6: (0, 64), 16: (0, 53), 9: (0, 30), 7: (0, 26)}, 7: {13: (0, 15)}, 8: {8: (0, 33), 15: (0, 4), 17: (0, 3), 10: (0, 34), 1: (0, 10), 7: (0, 26), 16: (0, 44), 2: (0, 7), 6: (0, 64), 9: (0, 30)}, 9: {6: (1, {'@': 35}), 1: (1, {'@': 35}), 7: (1, {'@': 35}), 8: (1, {'@': 35}), 9: (1, {'@': 35}), 3: (1, {'@': 35})}, 10: {7: (0, 61), 9: (0, 46), 14: (0, 54), 8: (0, 5)}, 11: {6: (1, {'@': 36}), 1: (1, {'@': 36}), 7: (1, {'@': 36}), 8: (1, {'@': 36}), 9: (1, {'@': 36}), 3: (1, {'@': 36})}, 12: {8: (0, 33), 15: (0, 4), 10: (0, 34), 17: (0, 48), 7: (0, 26), 16: (0, 44), 6: (0, 64), 9: (0, 30)}, 13: {11: (1, {'@': 26}), 18: (1, {'@': 26}), 19: (1, {'@': 26}), 13: (1, {'@': 26}), 20: (1, {'@': 26}), 21: (1, {'@': 26})}, 14: {6: (1, {'@': 50}), 1: (1, {'@': 50}), 7: (1, {'@': 50}), 8: (1, {'@': 50}), 9: (1, {'@': 50}), 3: (1, {'@': 50})}, 15: {6: (1, {'@': 38}), 1: (1, {'@': 38}), 7: (1, {'@': 38}), 8: (1, {'@': 38}), 9: (1, {'@': 38}), 3: (1, {'@': 38})}, 16: {19: (1, {'@': 15})}, 17: {1: (0, 10), 5: (0, 14), 3: (0, 22), 2: (0, 40), 6: (1, {'@': 24}), 7: (1, {'@': 24}), 8: (1, {'@': 24}), 9: (1, {'@': 24})}, 18: {8: (0, 33), 9: (0, 30), 7: (0, 26), 10: (0, 57)}, 19: {8: (0, 33), 9: (0, 30), 7: (0, 26), 10: (0, 29)}, 20: {6: (1, {'@': 39}), 1: (1, {'@': 39}), 7: (1, {'@': 39}), 8: (1, {'@': 39}), 9: (1, {'@': 39}), 3: (1, {'@': 39})}, 21: {8: (0, 33), 15: (0, 4), 10: (0, 34), 1: (0, 10), 17: (0, 60), 7: (0, 26), 16: (0, 44), 2: (0, 43), 6: (0, 64), 9: (0, 30)}, 22: {22: (0, 21)}, 23: {20: (0, 66), 11: (0, 24)}, 24: {7: (0, 61), 14: (0, 69), 9: (0, 46), 8: (0, 5)}, 25: {20: (1, {'@': 41}), 11: (1, {'@': 41}), 18: (1, {'@': 41}), 19: (1, {'@': 41}), 13: (1, {'@': 41})}, 26: {8: (0, 33), 15: (0, 4), 10: (0, 34), 7: (0, 26), 6: (0, 64), 16: (0, 41), 9: (0, 30)}, 27: {11: (0, 6), 13: (1, {'@': 16}), 19: (1, {'@': 16}), 18: (1, {'@': 16})}, 28: {8: (0, 33), 10: (0, 68), 2: (0, 18), 1: (0, 10), 9: (0, 30), 7: (0, 26)}, 29: {20: (1, {'@': 21}), 11: (1, {'@': 21}), 18: (1, {'@': 21}), 19: (1, {'@': 21}), 13: (1, {'@': 21})}, 30: {11: (1, {'@': 28}), 18: (1, {'@': 28}), 19: (1, {'@': 28}), 13: (1, {'@': 28}), 20: (1, {'@': 28}), 21: (1, {'@': 28})}, 31: {6: (1, {'@': 40}), 1: (1, {'@': 40}), 7: (1, {'@': 40}), 8: (1, {'@': 40}), 9: (1, {'@': 40}), 3: (1, {'@': 40})}, 32: {}, 33: {8: (0, 33), 10: (0, 55), 9: (0, 30), 7: (0, 26)}, 34: {21: (0, 1), 20: (1, {'@': 23}), 11: (1, {'@': 23}), 18: (1, {'@': 23}), 19: (1, {'@': 23}), 13: (1, {'@': 23})}, 35: {11: (0, 6), 20: (0, 51)}, 36: {6: (1, {'@': 37}), 1: (1, {'@': 37}), 7: (1, {'@': 37}), 8: (1, {'@': 37}), 9: (1, {'@': 37}), 3: (1, {'@': 37})}, 37: {7: (0, 61), 9: (0, 46), 8: (0, 5), 14: (0, 49)}, 38: {20: (1, {'@': 32}), 11: (1, {'@': 32}), 12: (1, {'@': 32})}, 39: {8: (0, 33), 15: (0, 4), 10: (0, 34), 1: (0, 10), 7: (0, 26), 16: (0, 44), 6: (0, 64), 17: (0, 52), 2: (0, 58), 9: (0, 30)}, 40: {6: (1, {'@': 49}), 1: (1, {'@': 49}), 7: (1, {'@': 49}), 8: (1, {'@': 49}), 9: (1, {'@': 49}), 3: (1, {'@': 49})}, 41: {23: (0, 35), 20: (0, 13), 11: (0, 67)}, 42: {20: (1, {'@': 22}), 11: (1, {'@': 22}), 18: (1, {'@': 22}), 19: (1, {'@': 22}), 13: (1, {'@': 22})}, 43: {13: (0, 36), 18: (0, 39)}, 44: {23: (0, 27), 11: (0, 67), 13: (1, {'@': 17}), 19: (1, {'@': 17}), 18: (1, {'@': 17})}, 45: {6: (1, {'@': 47}), 1: (1, {'@': 47}), 7: (1, {'@': 47}), 8: (1, {'@': 47}), 9: (1, {'@': 47}), 3: (1, {'@': 47})}, 46: {20: (1, {'@': 34}), 11: (1, {'@': 34}), 12: (1, {'@': 34})}, 47: {24: (0, 23), 20: (0, 38), 11: (0, 37)}, 48: {19: (1, {'@': 14})}, 49: {20: (1, {'@': 51}), 11: (1, {'@': 51}), 12: (1, {'@': 51})}, 50: {20: (1, {'@': 33}), 11: (1, {'@': 33}), 12: (1, {'@': 33})}, 51: {11: (1, {'@': 25}), 18: (1, {'@': 25}), 19: (1, {'@': 25}), 13: (1, {'@': 25}), 20: (1, {'@': 25}), 21: (1, {'@': 25})}, 52: {13: (0, 11)}, 53: {20: (1, {'@': 42}), 11: (1, {'@': 42}), 18: (1, {'@': 42}), 19: (1, {'@': 42}), 13: (1, {'@': 42})}, 54: {12: (0, 63), 24: (0, 2), 11: (0, 37)}, 55: {11: (1, {'@': 27}), 18: (1, {'@': 27}), 19: (1, {'@': 27}), 13: (1, {'@': 27}), 20: (1, {'@': 27}), 21: (1, {'@': 27})}, 56: {6: (1, {'@': 29}), 1: (1, {'@': 29}), 7: (1, {'@': 29}), 8: (1, {'@': 29}), 9: (1, {'@': 29}), 3: (1, {'@': 29}), 13: (1, {'@': 29}), 18: (1, {'@': 29})}, 57: {20: (1, {'@': 18}), 11: (1, {'@': 18}), 18: (1, {'@': 18}), 19: (1, {'@': 18}), 13: (1, {'@': 18})}, 58: {13: (0, 9)}, 59: {6: (1, {'@': 48}), 1: (1, {'@': 48}), 7: (1, {'@': 48}), 8: (1, {'@': 48}), 9: (1, {'@': 48}), 3: (1, {'@': 48})}, 60: {18: (0, 8), 13: (0, 31)}, 61: {7: (0, 61), 14: (0, 47), 9: (0, 46), 8: (0, 5)}, 62: {6: (1, {'@': 43}), 7: (1, {'@': 43}), 8: (1, {'@': 43}), 9: (1, {'@': 43})}, 63: {6: (1, {'@': 30}), 1: (1, {'@': 30}), 7: (1, {'@': 30}), 8: (1, {'@': 30}), 9: (1, {'@': 30}), 3: (1, {'@': 30}), 13: (1, {'@': 30}), 18: (1, {'@': 30})}, 64: {1: (0, 10), 2: (0, 45), 3: (0, 22), 4: (0, 17), 5: (0, 59), 0: (0, 62), 6: (1, {'@': 44}), 7: (1, {'@': 44}), 8: (1, {'@': 44}), 9: (1, {'@': 44})}, 65: {6: (1, {'@': 45}), 7: (1, {'@': 45}), 8: (1, {'@': 45}), 9: (1, {'@': 45})}, 66: {20: (1, {'@': 31}), 11: (1, {'@': 31}), 12: (1, {'@': 31})}, 67: {8: (0, 33), 15: (0, 4), 10: (0, 34), 6: (0, 64), 7: (0, 26), 9: (0, 30), 16: (0, 25)}, 68: {20: (1, {'@': 19}), 11: (1, {'@': 19}), 18: (1, {'@': 19}), 19: (1, {'@': 19}), 13: (1, {'@': 19})}, 69: {20: (1, {'@': 52}), 11: (1, {'@': 52}), 12: (1, {'@': 52})}, 70: {21: (0, 28), 20: (1, {'@': 20}), 11: (1, {'@': 20}), 18: (1, {'@': 20}), 19: (1, {'@': 20}), 13: (1, {'@': 20})}, 71: {8: (0, 33), 15: (0, 4), 10: (0, 34), 1: (0, 10), 3: (0, 22), 4: (0, 17), 6: (0, 64), 17: (0, 16), 0: (0, 12), 25: (0, 32), 7: (0, 26), 16: (0, 44), 5: (0, 59), 2: (0, 45), 9: (0, 30)}}, 'start_states': {'start': 71}, 'end_states': {'start': 32}}, 'options': {'debug': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': True, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'import_paths': [], 'source_path': None}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}], 'options': {'debug': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': True, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'import_paths': [], 'source_path': None}, '__type__': 'Lark'}
+{'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}], 'ignore': ['WS'], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}], 'start': ['start'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: '__phi_star_2', 1: 'phi', 2: 'TILDE', 3: 'ATOM', 4: 'act', 5: 'sub', 6: 'LET', 7: 'UMOD', 8: 'IATOM', 9: 'family_head', 10: 'bool', 11: 'FAMILY', 12: 'LPAR', 13: 'VAR', 14: 'LBRACE', 15: 'THEN', 16: 'BMOD', 17: 'RSQB', 18: 'BOOL', 19: 'RPAR', 20: 'COMMA', 21: 'IN', 22: '$END', 23: 'LSQB', 24: 'RBRACE', 25: '__restrict_plus_3', 26: 'fair', 27: 'fair_open', 28: 'global', 29: 'start', 30: 'restrict', 31: 'EQUAL', 32: 'bind', 33: 'exp', 34: '__act_star_4', 35: '__bool_star_1', 36: '__bool_star_0', 37: 'FAIR'}, 'states': {0: {0: (0, 40), 1: (0, 78), 2: (0, 52), 3: (0, 73), 4: (0, 19), 5: (0, 60), 6: (0, 27), 7: (0, 29), 8: (0, 87), 9: (0, 45), 10: (0, 31), 11: (0, 77), 12: (0, 16), 13: (0, 85), 14: (0, 57)}, 1: {15: (1, {'@': 36}), 16: (1, {'@': 36}), 17: (1, {'@': 36}), 18: (1, {'@': 36}), 19: (1, {'@': 36}), 20: (1, {'@': 36}), 21: (1, {'@': 36}), 22: (1, {'@': 36})}, 2: {17: (1, {'@': 43}), 15: (1, {'@': 43}), 8: (1, {'@': 43}), 14: (1, {'@': 43}), 3: (1, {'@': 43}), 11: (1, {'@': 43}), 6: (1, {'@': 43}), 7: (1, {'@': 43}), 23: (1, {'@': 43}), 12: (1, {'@': 43}), 2: (1, {'@': 43}), 13: (1, {'@': 43})}, 3: {17: (1, {'@': 30}), 15: (1, {'@': 30}), 18: (1, {'@': 30}), 19: (1, {'@': 30}), 20: (1, {'@': 30}), 21: (1, {'@': 30}), 22: (1, {'@': 30})}, 4: {8: (1, {'@': 51}), 14: (1, {'@': 51}), 3: (1, {'@': 51}), 11: (1, {'@': 51}), 6: (1, {'@': 51}), 7: (1, {'@': 51}), 23: (1, {'@': 51}), 12: (1, {'@': 51}), 2: (1, {'@': 51}), 13: (1, {'@': 51})}, 5: {20: (1, {'@': 58}), 22: (1, {'@': 58}), 17: (1, {'@': 58}), 19: (1, {'@': 58}), 15: (1, {'@': 58}), 21: (1, {'@': 58}), 18: (1, {'@': 58})}, 6: {8: (1, {'@': 67}), 14: (1, {'@': 67}), 3: (1, {'@': 67}), 11: (1, {'@': 67}), 6: (1, {'@': 67}), 7: (1, {'@': 67}), 23: (1, {'@': 67}), 12: (1, {'@': 67}), 2: (1, {'@': 67}), 13: (1, {'@': 67})}, 7: {19: (1, {'@': 47}), 24: (1, {'@': 47}), 18: (1, {'@': 47})}, 8: {19: (1, {'@': 71}), 18: (1, {'@': 71}), 24: (1, {'@': 71})}, 9: {18: (0, 84), 24: (0, 2)}, 10: {20: (1, {'@': 60}), 21: (1, {'@': 60})}, 11: {20: (1, {'@': 59}), 22: (1, {'@': 59}), 17: (1, {'@': 59}), 19: (1, {'@': 59}), 15: (1, {'@': 59}), 21: (1, {'@': 59}), 18: (1, {'@': 59})}, 12: {17: (0, 34)}, 13: {8: (1, {'@': 66}), 14: (1, {'@': 66}), 3: (1, {'@': 66}), 11: (1, {'@': 66}), 6: (1, {'@': 66}), 7: (1, {'@': 66}), 23: (1, {'@': 66}), 12: (1, {'@': 66}), 2: (1, {'@': 66}), 13: (1, {'@': 66})}, 14: {20: (1, {'@': 28}), 21: (1, {'@': 28})}, 15: {17: (1, {'@': 44}), 15: (1, {'@': 44}), 8: (1, {'@': 44}), 14: (1, {'@': 44}), 3: (1, {'@': 44}), 11: (1, {'@': 44}), 6: (1, {'@': 44}), 7: (1, {'@': 44}), 23: (1, {'@': 44}), 12: (1, {'@': 44}), 2: (1, {'@': 44}), 13: (1, {'@': 44})}, 16: {0: (0, 40), 10: (0, 53), 1: (0, 78), 2: (0, 52), 3: (0, 73), 5: (0, 60), 6: (0, 27), 8: (0, 87), 9: (0, 45), 7: (0, 29), 11: (0, 77), 12: (0, 16), 13: (0, 85)}, 17: {17: (0, 71)}, 18: {0: (0, 40), 1: (0, 78), 2: (0, 52), 3: (0, 73), 5: (0, 60), 6: (0, 27), 10: (0, 14), 8: (0, 87), 9: (0, 45), 7: (0, 29), 11: (0, 77), 12: (0, 16), 13: (0, 85)}, 19: {15: (0, 89), 17: (0, 20)}, 20: {8: (1, {'@': 53}), 14: (1, {'@': 53}), 3: (1, {'@': 53}), 11: (1, {'@': 53}), 6: (1, {'@': 53}), 7: (1, {'@': 53}), 23: (1, {'@': 53}), 12: (1, {'@': 53}), 2: (1, {'@': 53}), 13: (1, {'@': 53})}, 21: {0: (0, 40), 1: (0, 78), 2: (0, 52), 10: (0, 26), 3: (0, 73), 5: (0, 60), 6: (0, 27), 8: (0, 87), 9: (0, 45), 7: (0, 29), 11: (0, 77), 12: (0, 16), 13: (0, 85)}, 22: {0: (0, 40), 1: (0, 78), 25: (0, 59), 2: (0, 52), 6: (0, 27), 26: (0, 6), 14: (0, 57), 8: (0, 87), 9: (0, 45), 5: (0, 60), 7: (0, 29), 27: (0, 0), 4: (0, 13), 12: (0, 16), 28: (0, 23), 3: (0, 73), 29: (0, 33), 10: (0, 30), 11: (0, 77), 13: (0, 85), 30: (0, 82), 23: (0, 91)}, 23: {0: (0, 40), 1: (0, 78), 2: (0, 52), 3: (0, 73), 10: (0, 49), 5: (0, 60), 6: (0, 27), 8: (0, 87), 9: (0, 45), 7: (0, 29), 11: (0, 77), 12: (0, 16), 13: (0, 85)}, 24: {31: (0, 18)}, 25: {17: (0, 4)}, 26: {15: (1, {'@': 26}), 17: (1, {'@': 26}), 19: (1, {'@': 26}), 20: (1, {'@': 26}), 21: (1, {'@': 26}), 22: (1, {'@': 26})}, 27: {32: (0, 74), 3: (0, 24)}, 28: {2: (1, {'@': 57}), 8: (1, {'@': 57}), 14: (1, {'@': 57}), 11: (1, {'@': 57}), 6: (1, {'@': 57}), 7: (1, {'@': 57}), 12: (1, {'@': 57}), 3: (1, {'@': 57}), 13: (1, {'@': 57})}, 29: {25: (0, 59), 27: (0, 0), 30: (0, 92), 26: (0, 6), 23: (0, 91), 4: (0, 13), 14: (0, 57), 8: (1, {'@': 63}), 3: (1, {'@': 63}), 11: (1, {'@': 63}), 7: (1, {'@': 63}), 12: (1, {'@': 63}), 2: (1, {'@': 63}), 13: (1, {'@': 63})}, 30: {22: (1, {'@': 22})}, 31: {17: (0, 50), 15: (0, 56)}, 32: {17: (1, {'@': 29}), 15: (1, {'@': 29}), 18: (1, {'@': 29}), 19: (1, {'@': 29}), 20: (1, {'@': 29}), 21: (1, {'@': 29}), 22: (1, {'@': 29})}, 33: {}, 34: {8: (1, {'@': 55}), 14: (1, {'@': 55}), 3: (1, {'@': 55}), 11: (1, {'@': 55}), 6: (1, {'@': 55}), 7: (1, {'@': 55}), 23: (1, {'@': 55}), 12: (1, {'@': 55}), 2: (1, {'@': 55}), 13: (1, {'@': 55})}, 35: {19: (1, {'@': 48}), 24: (1, {'@': 48}), 18: (1, {'@': 48})}, 36: {19: (0, 76), 18: (0, 84)}, 37: {18: (0, 75), 15: (1, {'@': 24}), 17: (1, {'@': 24}), 19: (1, {'@': 24}), 20: (1, {'@': 24}), 21: (1, {'@': 24}), 22: (1, {'@': 24})}, 38: {33: (0, 81), 3: (0, 35), 8: (0, 55), 12: (0, 48), 2: (0, 69), 13: (0, 68)}, 39: {17: (1, {'@': 32}), 15: (1, {'@': 32}), 18: (1, {'@': 32}), 19: (1, {'@': 32}), 20: (1, {'@': 32}), 21: (1, {'@': 32}), 22: (1, {'@': 32})}, 40: {3: (0, 73), 2: (0, 52), 11: (0, 77), 7: (0, 43), 5: (0, 72), 12: (0, 16), 13: (0, 85), 8: (0, 87), 9: (0, 45)}, 41: {8: (1, {'@': 64}), 3: (1, {'@': 64}), 11: (1, {'@': 64}), 7: (1, {'@': 64}), 12: (1, {'@': 64}), 2: (1, {'@': 64}), 13: (1, {'@': 64})}, 42: {17: (0, 51)}, 43: {25: (0, 59), 27: (0, 0), 26: (0, 6), 4: (0, 13), 14: (0, 57), 23: (0, 91), 30: (0, 41), 8: (1, {'@': 65}), 3: (1, {'@': 65}), 11: (1, {'@': 65}), 7: (1, {'@': 65}), 12: (1, {'@': 65}), 2: (1, {'@': 65}), 13: (1, {'@': 65})}, 44: {0: (0, 40), 2: (0, 52), 3: (0, 73), 5: (0, 60), 7: (0, 29), 8: (0, 87), 9: (0, 45), 1: (0, 5), 11: (0, 77), 12: (0, 16), 13: (0, 85)}, 45: {3: (0, 73), 2: (0, 52), 11: (0, 77), 5: (0, 80), 12: (0, 16), 13: (0, 85), 8: (0, 87), 9: (0, 45)}, 46: {3: (0, 73), 2: (0, 52), 11: (0, 77), 5: (0, 3), 12: (0, 16), 13: (0, 85), 14: (0, 57), 8: (0, 87), 4: (0, 67), 9: (0, 45)}, 47: {8: (1, {'@': 68}), 14: (1, {'@': 68}), 3: (1, {'@': 68}), 11: (1, {'@': 68}), 6: (1, {'@': 68}), 7: (1, {'@': 68}), 23: (1, {'@': 68}), 12: (1, {'@': 68}), 2: (1, {'@': 68}), 13: (1, {'@': 68})}, 48: {3: (0, 35), 33: (0, 64), 2: (0, 69), 13: (0, 68), 8: (0, 55), 12: (0, 48)}, 49: {22: (1, {'@': 21})}, 50: {8: (1, {'@': 56}), 14: (1, {'@': 56}), 3: (1, {'@': 56}), 11: (1, {'@': 56}), 6: (1, {'@': 56}), 7: (1, {'@': 56}), 23: (1, {'@': 56}), 12: (1, {'@': 56}), 2: (1, {'@': 56}), 13: (1, {'@': 56})}, 51: {8: (1, {'@': 54}), 14: (1, {'@': 54}), 3: (1, {'@': 54}), 11: (1, {'@': 54}), 6: (1, {'@': 54}), 7: (1, {'@': 54}), 23: (1, {'@': 54}), 12: (1, {'@': 54}), 2: (1, {'@': 54}), 13: (1, {'@': 54})}, 52: {3: (0, 73), 2: (0, 52), 11: (0, 77), 12: (0, 16), 13: (0, 85), 5: (0, 54), 8: (0, 87), 9: (0, 45)}, 53: {19: (0, 1)}, 54: {15: (1, {'@': 37}), 16: (1, {'@': 37}), 17: (1, {'@': 37}), 18: (1, {'@': 37}), 19: (1, {'@': 37}), 20: (1, {'@': 37}), 21: (1, {'@': 37}), 22: (1, {'@': 37})}, 55: {19: (1, {'@': 49}), 24: (1, {'@': 49}), 18: (1, {'@': 49})}, 56: {0: (0, 40), 1: (0, 78), 2: (0, 52), 3: (0, 73), 5: (0, 60), 6: (0, 27), 14: (0, 57), 10: (0, 12), 8: (0, 87), 9: (0, 45), 7: (0, 29), 11: (0, 77), 4: (0, 42), 12: (0, 16), 13: (0, 85)}, 57: {3: (0, 35), 2: (0, 69), 13: (0, 68), 33: (0, 83), 8: (0, 55), 12: (0, 48)}, 58: {32: (0, 10), 3: (0, 24)}, 59: {27: (0, 0), 4: (0, 47), 14: (0, 57), 26: (0, 88), 23: (0, 91), 2: (1, {'@': 35}), 8: (1, {'@': 35}), 11: (1, {'@': 35}), 6: (1, {'@': 35}), 7: (1, {'@': 35}), 12: (1, {'@': 35}), 3: (1, {'@': 35}), 13: (1, {'@': 35})}, 60: {16: (0, 65), 17: (1, {'@': 34}), 15: (1, {'@': 34}), 18: (1, {'@': 34}), 19: (1, {'@': 34}), 20: (1, {'@': 34}), 21: (1, {'@': 34}), 22: (1, {'@': 34})}, 61: {20: (0, 70), 21: (0, 21)}, 62: {17: (1, {'@': 33}), 15: (1, {'@': 33}), 18: (1, {'@': 33}), 19: (1, {'@': 33}), 20: (1, {'@': 33}), 21: (1, {'@': 33}), 22: (1, {'@': 33})}, 63: {3: (0, 73), 2: (0, 52), 11: (0, 77), 5: (0, 39), 12: (0, 16), 13: (0, 85), 8: (0, 87), 9: (0, 45)}, 64: {34: (0, 36), 19: (0, 79), 18: (0, 38)}, 65: {3: (0, 73), 2: (0, 52), 11: (0, 77), 5: (0, 62), 12: (0, 16), 4: (0, 63), 13: (0, 85), 14: (0, 57), 8: (0, 87), 9: (0, 45)}, 66: {0: (0, 40), 1: (0, 78), 2: (0, 52), 3: (0, 73), 5: (0, 60), 6: (0, 27), 10: (0, 90), 8: (0, 87), 9: (0, 45), 7: (0, 29), 11: (0, 77), 12: (0, 16), 13: (0, 85)}, 67: {3: (0, 73), 2: (0, 52), 11: (0, 77), 12: (0, 16), 13: (0, 85), 5: (0, 32), 8: (0, 87), 9: (0, 45)}, 68: {19: (1, {'@': 50}), 24: (1, {'@': 50}), 18: (1, {'@': 50})}, 69: {33: (0, 7), 3: (0, 35), 8: (0, 55), 12: (0, 48), 2: (0, 69), 13: (0, 68)}, 70: {32: (0, 86), 3: (0, 24)}, 71: {8: (1, {'@': 52}), 14: (1, {'@': 52}), 3: (1, {'@': 52}), 11: (1, {'@': 52}), 6: (1, {'@': 52}), 7: (1, {'@': 52}), 23: (1, {'@': 52}), 12: (1, {'@': 52}), 2: (1, {'@': 52}), 13: (1, {'@': 52})}, 72: {16: (0, 46), 17: (1, {'@': 31}), 15: (1, {'@': 31}), 18: (1, {'@': 31}), 19: (1, {'@': 31}), 20: (1, {'@': 31}), 21: (1, {'@': 31}), 22: (1, {'@': 31})}, 73: {15: (1, {'@': 39}), 16: (1, {'@': 39}), 17: (1, {'@': 39}), 18: (1, {'@': 39}), 19: (1, {'@': 39}), 20: (1, {'@': 39}), 21: (1, {'@': 39}), 22: (1, {'@': 39})}, 74: {35: (0, 61), 21: (0, 66), 20: (0, 58)}, 75: {0: (0, 40), 2: (0, 52), 3: (0, 73), 5: (0, 60), 7: (0, 29), 8: (0, 87), 9: (0, 45), 11: (0, 77), 1: (0, 11), 12: (0, 16), 13: (0, 85)}, 76: {19: (1, {'@': 45}), 24: (1, {'@': 45}), 18: (1, {'@': 45})}, 77: {8: (1, {'@': 42}), 3: (1, {'@': 42}), 11: (1, {'@': 42}), 12: (1, {'@': 42}), 2: (1, {'@': 42}), 13: (1, {'@': 42})}, 78: {36: (0, 37), 18: (0, 44), 15: (1, {'@': 25}), 17: (1, {'@': 25}), 19: (1, {'@': 25}), 20: (1, {'@': 25}), 21: (1, {'@': 25}), 22: (1, {'@': 25})}, 79: {19: (1, {'@': 46}), 24: (1, {'@': 46}), 18: (1, {'@': 46})}, 80: {15: (1, {'@': 38}), 16: (1, {'@': 38}), 17: (1, {'@': 38}), 18: (1, {'@': 38}), 19: (1, {'@': 38}), 20: (1, {'@': 38}), 21: (1, {'@': 38}), 22: (1, {'@': 38})}, 81: {19: (1, {'@': 70}), 18: (1, {'@': 70}), 24: (1, {'@': 70})}, 82: {2: (1, {'@': 23}), 8: (1, {'@': 23}), 11: (1, {'@': 23}), 6: (1, {'@': 23}), 7: (1, {'@': 23}), 12: (1, {'@': 23}), 3: (1, {'@': 23}), 13: (1, {'@': 23})}, 83: {24: (0, 15), 34: (0, 9), 18: (0, 38)}, 84: {3: (0, 35), 8: (0, 55), 12: (0, 48), 2: (0, 69), 33: (0, 8), 13: (0, 68)}, 85: {15: (1, {'@': 41}), 16: (1, {'@': 41}), 17: (1, {'@': 41}), 18: (1, {'@': 41}), 19: (1, {'@': 41}), 20: (1, {'@': 41}), 21: (1, {'@': 41}), 22: (1, {'@': 41})}, 86: {20: (1, {'@': 61}), 21: (1, {'@': 61})}, 87: {15: (1, {'@': 40}), 16: (1, {'@': 40}), 17: (1, {'@': 40}), 18: (1, {'@': 40}), 19: (1, {'@': 40}), 20: (1, {'@': 40}), 21: (1, {'@': 40}), 22: (1, {'@': 40})}, 88: {8: (1, {'@': 69}), 14: (1, {'@': 69}), 3: (1, {'@': 69}), 11: (1, {'@': 69}), 6: (1, {'@': 69}), 7: (1, {'@': 69}), 23: (1, {'@': 69}), 12: (1, {'@': 69}), 2: (1, {'@': 69}), 13: (1, {'@': 69})}, 89: {0: (0, 40), 1: (0, 78), 2: (0, 52), 3: (0, 73), 5: (0, 60), 6: (0, 27), 7: (0, 29), 14: (0, 57), 4: (0, 25), 8: (0, 87), 9: (0, 45), 11: (0, 77), 12: (0, 16), 13: (0, 85), 10: (0, 17)}, 90: {15: (1, {'@': 27}), 17: (1, {'@': 27}), 19: (1, {'@': 27}), 20: (1, {'@': 27}), 21: (1, {'@': 27}), 22: (1, {'@': 27})}, 91: {37: (0, 28)}, 92: {8: (1, {'@': 62}), 3: (1, {'@': 62}), 11: (1, {'@': 62}), 7: (1, {'@': 62}), 12: (1, {'@': 62}), 2: (1, {'@': 62}), 13: (1, {'@': 62})}}, 'start_states': {'start': 22}, 'end_states': {'start': 33}}, 'options': {'debug': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': True, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'import_paths': [], 'source_path': None}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}], 'options': {'debug': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': True, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'import_paths': [], 'source_path': None}, '__type__': 'Lark'}
 )
 MEMO = (
-{0: {'name': 'WS', 'pattern': {'value': '(?:[ \t\x0c\r\n])+', 'flags': [], '_width': [1, 4294967295], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 1: {'name': 'FAIR', 'pattern': {'value': '\\b[UWS]FAIR\\b', 'flags': [], '_width': [5, 5], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 2: {'name': 'THEN', 'pattern': {'value': '\\bTHEN\\b', 'flags': [], '_width': [4, 4], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 3: {'name': 'UMOD', 'pattern': {'value': '\\b[AEXFG]+\\b', 'flags': [], '_width': [1, 4294967295], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 4: {'name': 'BMOD', 'pattern': {'value': '\\b[URWM]\\b', 'flags': [], '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 5: {'name': 'ATOM', 'pattern': {'value': '\\b\\w+\\b|"[^"]+"|\'[^\']+\'', 'flags': [], '_width': [1, 4294967295], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 6: {'name': 'BOOL', 'pattern': {'value': '&|\\||=>|<=>', 'flags': [], '_width': [1, 3], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 7: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 8: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 9: {'name': 'TILDE', 'pattern': {'value': '~', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 10: {'name': 'LBRACE', 'pattern': {'value': '{', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 11: {'name': 'RBRACE', 'pattern': {'value': '}', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 12: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 13: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 14: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'restrict', '__type__': 'NonTerminal'}, {'name': 'bool', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 15: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [True, False], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 16: {'origin': {'name': 'bool', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'phi', '__type__': 'NonTerminal'}, {'name': '__bool_star_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bin_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 17: {'origin': {'name': 'bool', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'phi', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bin_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 18: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__phi_star_1', '__type__': 'NonTerminal'}, {'name': 'sub', '__type__': 'NonTerminal'}, {'name': 'BMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 19: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__phi_star_1', '__type__': 'NonTerminal'}, {'name': 'sub', '__type__': 'NonTerminal'}, {'name': 'BMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, False, True, False], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 20: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__phi_star_1', '__type__': 'NonTerminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, True], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 21: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sub', '__type__': 'NonTerminal'}, {'name': 'BMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 22: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sub', '__type__': 'NonTerminal'}, {'name': 'BMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, True, False], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 23: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sub', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, True], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 24: {'origin': {'name': 'restrict', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__restrict_plus_2', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'restrict', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 25: {'origin': {'name': 'sub', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'phi', '__type__': 'NonTerminal'}, {'name': '__bool_star_0', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'bin_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 26: {'origin': {'name': 'sub', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'phi', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'bin_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 27: {'origin': {'name': 'sub', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TILDE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'not_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 28: {'origin': {'name': 'sub', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ATOM', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'atom', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 29: {'origin': {'name': 'act', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': '__act_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'act', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 30: {'origin': {'name': 'act', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'act', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 31: {'origin': {'name': 'exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': '__act_star_3', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'bin_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 32: {'origin': {'name': 'exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'bin_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 33: {'origin': {'name': 'exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TILDE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'not_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 34: {'origin': {'name': 'exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ATOM', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'atom', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 35: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FAIR', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 36: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FAIR', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'bool', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 37: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FAIR', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, False, True, False], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 38: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FAIR', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'bool', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 39: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FAIR', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'bool', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'bool', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 40: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FAIR', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'bool', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, False, True, False], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 41: {'origin': {'name': '__bool_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BOOL', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'phi', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 42: {'origin': {'name': '__bool_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__bool_star_0', '__type__': 'NonTerminal'}, {'name': 'BOOL', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'phi', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 43: {'origin': {'name': '__phi_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'UMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'restrict', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 44: {'origin': {'name': '__phi_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'UMOD', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, True], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 45: {'origin': {'name': '__phi_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__phi_star_1', '__type__': 'NonTerminal'}, {'name': 'UMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'restrict', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 46: {'origin': {'name': '__phi_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__phi_star_1', '__type__': 'NonTerminal'}, {'name': 'UMOD', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, True], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 47: {'origin': {'name': '__restrict_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'act', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 48: {'origin': {'name': '__restrict_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'fair', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 49: {'origin': {'name': '__restrict_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__restrict_plus_2', '__type__': 'NonTerminal'}, {'name': 'act', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 50: {'origin': {'name': '__restrict_plus_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__restrict_plus_2', '__type__': 'NonTerminal'}, {'name': 'fair', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 51: {'origin': {'name': '__act_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BOOL', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 52: {'origin': {'name': '__act_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__act_star_3', '__type__': 'NonTerminal'}, {'name': 'BOOL', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
+{0: {'name': 'WS', 'pattern': {'value': '(?:[ \t\x0c\r\n])+', 'flags': [], '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 1: {'name': 'FAMILY', 'pattern': {'value': '[&|]_\\{[^}]*\\}', 'flags': [], '_width': [4, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 3, '__type__': 'TerminalDef'}, 2: {'name': 'FAIR', 'pattern': {'value': '\\b[UWS]FAIR\\b', 'flags': [], '_width': [5, 5], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 3: {'name': 'THEN', 'pattern': {'value': '\\bTHEN\\b', 'flags': [], '_width': [4, 4], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 4: {'name': 'LET', 'pattern': {'value': '\\blet\\b(?=\\s*(\\w+|"[^"]+"|\'[^\']+\')\\s*=(?!>))', 'flags': [], '_width': [3, 3], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 5: {'name': 'IN', 'pattern': {'value': '\\bin\\b', 'flags': [], '_width': [2, 2], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 6: {'name': 'UMOD', 'pattern': {'value': '\\b[AEXFG]+\\b', 'flags': [], '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 7: {'name': 'BMOD', 'pattern': {'value': '\\b[URWM]\\b', 'flags': [], '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 1, '__type__': 'TerminalDef'}, 8: {'name': 'IATOM', 'pattern': {'value': '\\b\\w+_\\{[^}]*\\}', 'flags': [], '_width': [4, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 9: {'name': 'ATOM', 'pattern': {'value': '\\b\\w+\\b|"[^"]+"|\'[^\']+\'', 'flags': [], '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 10: {'name': 'VAR', 'pattern': {'value': '\\$\\w+', 'flags': [], '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 11: {'name': 'BOOL', 'pattern': {'value': '&|\\||=>|<=>', 'flags': [], '_width': [1, 3], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 12: {'name': 'COMMA', 'pattern': {'value': ',', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 13: {'name': 'EQUAL', 'pattern': {'value': '=', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 14: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 15: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 16: {'name': 'TILDE', 'pattern': {'value': '~', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 17: {'name': 'LBRACE', 'pattern': {'value': '{', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 18: {'name': 'RBRACE', 'pattern': {'value': '}', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 19: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 20: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], '__type__': 'PatternStr'}, 'priority': 1, '__type__': 'TerminalDef'}, 21: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'global', '__type__': 'NonTerminal'}, {'name': 'bool', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 22: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bool', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [True, False], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 23: {'origin': {'name': 'global', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'restrict', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'global_restrict', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 24: {'origin': {'name': 'bool', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'phi', '__type__': 'NonTerminal'}, {'name': '__bool_star_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bin_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 25: {'origin': {'name': 'bool', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'phi', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'bin_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 26: {'origin': {'name': 'bool', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LET', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'bind', '__type__': 'NonTerminal'}, {'name': '__bool_star_1', '__type__': 'NonTerminal'}, {'name': 'IN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'bool', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'let', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 27: {'origin': {'name': 'bool', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LET', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'bind', '__type__': 'NonTerminal'}, {'name': 'IN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'bool', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'let', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 28: {'origin': {'name': 'bind', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ATOM', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'bool', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'bind', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 29: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__phi_star_2', '__type__': 'NonTerminal'}, {'name': 'sub', '__type__': 'NonTerminal'}, {'name': 'BMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 30: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__phi_star_2', '__type__': 'NonTerminal'}, {'name': 'sub', '__type__': 'NonTerminal'}, {'name': 'BMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, False, True, False], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 31: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__phi_star_2', '__type__': 'NonTerminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, True], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 32: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sub', '__type__': 'NonTerminal'}, {'name': 'BMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 33: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sub', '__type__': 'NonTerminal'}, {'name': 'BMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, True, False], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 34: {'origin': {'name': 'phi', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sub', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'mod', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, True], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 35: {'origin': {'name': 'restrict', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__restrict_plus_3', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'restrict', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 36: {'origin': {'name': 'sub', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'bool', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'nop', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 37: {'origin': {'name': 'sub', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TILDE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'not_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 38: {'origin': {'name': 'sub', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'family_head', '__type__': 'NonTerminal'}, {'name': 'sub', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'family', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 39: {'origin': {'name': 'sub', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ATOM', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'atom', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 40: {'origin': {'name': 'sub', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IATOM', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': 'iatom', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 41: {'origin': {'name': 'sub', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'VAR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': 'var', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 42: {'origin': {'name': 'family_head', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FAMILY', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'family_head', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 43: {'origin': {'name': 'act', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': '__act_star_4', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'act', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 44: {'origin': {'name': 'act', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'act', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 45: {'origin': {'name': 'exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': '__act_star_4', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'bin_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 46: {'origin': {'name': 'exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'bin_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 47: {'origin': {'name': 'exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TILDE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'not_op', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 48: {'origin': {'name': 'exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ATOM', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'atom', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 49: {'origin': {'name': 'exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IATOM', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': 'iatom', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 50: {'origin': {'name': 'exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'VAR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': 'var', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 51: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'fair_open', '__type__': 'NonTerminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 52: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'fair_open', '__type__': 'NonTerminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'bool', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 53: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'fair_open', '__type__': 'NonTerminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, True, False], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 54: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'fair_open', '__type__': 'NonTerminal'}, {'name': 'bool', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'act', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 55: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'fair_open', '__type__': 'NonTerminal'}, {'name': 'bool', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'bool', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 56: {'origin': {'name': 'fair', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'fair_open', '__type__': 'NonTerminal'}, {'name': 'bool', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': 'fair', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, True, False], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 57: {'origin': {'name': 'fair_open', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FAIR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'fair_open', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 58: {'origin': {'name': '__bool_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BOOL', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'phi', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 59: {'origin': {'name': '__bool_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__bool_star_0', '__type__': 'NonTerminal'}, {'name': 'BOOL', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'phi', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 60: {'origin': {'name': '__bool_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'bind', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 61: {'origin': {'name': '__bool_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__bool_star_1', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'bind', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 62: {'origin': {'name': '__phi_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'UMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'restrict', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 63: {'origin': {'name': '__phi_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'UMOD', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, True], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 64: {'origin': {'name': '__phi_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__phi_star_2', '__type__': 'NonTerminal'}, {'name': 'UMOD', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'restrict', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 65: {'origin': {'name': '__phi_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__phi_star_2', '__type__': 'NonTerminal'}, {'name': 'UMOD', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': [False, False, True], '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 66: {'origin': {'name': '__restrict_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'act', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 67: {'origin': {'name': '__restrict_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'fair', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 68: {'origin': {'name': '__restrict_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__restrict_plus_3', '__type__': 'NonTerminal'}, {'name': 'act', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 69: {'origin': {'name': '__restrict_plus_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__restrict_plus_3', '__type__': 'NonTerminal'}, {'name': 'fair', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 70: {'origin': {'name': '__act_star_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BOOL', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 71: {'origin': {'name': '__act_star_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__act_star_4', '__type__': 'NonTerminal'}, {'name': 'BOOL', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
 )
 Shift = 0
 Reduce = 1